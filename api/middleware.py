@@ -2,203 +2,147 @@
 API Middleware Module
 
 FastAPI 미들웨어를 구현합니다.
-- JWT 인증
+단일 raw ASGI 미들웨어(RequestContextMiddleware)로 다음을 한 번에 처리합니다.
+- 요청 ID 부여 / 로깅 (x-request-id 응답 헤더)
+- 라우트 분류 (public / auth / stream, 컴파일된 PathClassifier → scope["route_class"])
+- JWT 인증 (public 라우트는 생략)
 - X-Tenant-ID 헤더 처리
-- 로깅 (raw ASGI: SSE 스트림 본문을 건드리지 않음, BE 중계 0바이트 방지)
 - 예외 처리
+
+BaseHTTPMiddleware를 사용하지 않으므로 요청당 추가 태스크/메모리 스트림이 없고,
+SSE 스트림 본문을 버퍼링·취소하지 않습니다. (스트림 경로도 별도 바이패스 없이 동일 경로로 처리)
 """
 
 import logging
 import time
 import uuid
-from typing import Callable
 
-from fastapi import Request, Response, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from api.route_access import ROUTE_CLASS_PUBLIC, ROUTE_CLASS_SCOPE_KEY, PathClassifier
 from core.config import settings
 from core.security.auth import extract_bearer_token, get_user_from_token
 
 logger = logging.getLogger(__name__)
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+def _unauthorized(detail: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        content={"detail": detail},
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _error_response(exc: Exception) -> JSONResponse:
+    """라우트 예외 → 일관된 형식의 에러 응답"""
+    if isinstance(exc, PermissionError):
+        logger.warning(f"Permission denied: {exc}")
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": str(exc), "error_type": "permission_error"},
+        )
+    if isinstance(exc, ValueError):
+        logger.warning(f"Validation error: {exc}")
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": str(exc), "error_type": "validation_error"},
+        )
+    logger.error(f"Unhandled exception: {exc}", exc_info=exc)
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error", "error_type": "server_error"},
+    )
+
+
+def authenticate(scope: Scope, state: dict, route_class: str) -> JSONResponse | None:
     """
-    JWT 인증 미들웨어
-    
-    Authorization 헤더에서 JWT를 추출하고 검증합니다.
-    검증된 사용자 정보를 request.state에 저장합니다.
+    JWT 인증 + 테넌트 확인
+
+    public 라우트는 토큰 검증을 생략하고, 검증된 사용자/테넌트는 state(request.state)에 저장합니다.
+
+    Returns:
+        거부 응답 (401/403) 또는 None (통과)
     """
-    
-    # 인증이 필요 없는 경로
-    EXEMPT_PATHS = [
-        "/",
-        "/health",
-        "/docs",
-        "/redoc",
-        "/openapi.json",
-        "/agents/health",  # 에이전트 헬스체크는 공개
-        "/aura/triggers/case-updated",  # Phase B: 배치 웹훅 (X-Trigger-Secret으로 검증)
-    ]
-    
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
-        """미들웨어 처리"""
-        
-        # 인증 제외 경로 확인 (정확한 경로 매칭 또는 시작 경로 확인)
-        path = request.url.path
-        is_exempt = (
-            path in self.EXEMPT_PATHS or
-            any(path.startswith(exempt) for exempt in self.EXEMPT_PATHS if exempt.endswith("*"))
-        )
-        
-        if is_exempt:
-            logger.debug(f"Path {path} is exempt from authentication")
-            return await call_next(request)
-        
+    path = scope.get("path", "")
+    headers = Headers(scope=scope)
+
+    if route_class == ROUTE_CLASS_PUBLIC:
+        logger.debug(f"Path {path} is exempt from authentication")
+    elif not settings.require_auth:
         # 개발 모드에서 인증 비활성화 옵션
-        if not settings.require_auth:
-            logger.debug("Authentication disabled in development mode")
-            request.state.user = None
-            request.state.tenant_id = None
-            return await call_next(request)
-        
-        # Authorization 헤더 확인
-        authorization = request.headers.get("Authorization")
-        
+        logger.debug("Authentication disabled in development mode")
+        state["user"] = None
+        state["tenant_id"] = None
+    else:
+        authorization = headers.get("Authorization")
         if not authorization:
-            logger.warning(f"Missing Authorization header: {request.url.path}")
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Missing authorization header"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # Bearer 토큰 추출
+            logger.warning(f"Missing Authorization header: {path}")
+            return _unauthorized("Missing authorization header")
+
         token = extract_bearer_token(authorization)
-        
         if not token:
             logger.warning("Invalid authorization header format")
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid authorization header format"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # 토큰 검증 및 사용자 정보 추출
+            return _unauthorized("Invalid authorization header format")
+
         user = get_user_from_token(token)
-        
         if user is None:
             logger.warning("Invalid or expired token")
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid or expired token"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # 사용자 정보를 request.state에 저장
-        request.state.user = user
-        request.state.tenant_id = user.tenant_id
-        
-        logger.debug(
-            f"Authenticated user: {user.user_id} (tenant: {user.tenant_id})"
-        )
-        
-        return await call_next(request)
+            return _unauthorized("Invalid or expired token")
+
+        state["user"] = user
+        state["tenant_id"] = user.tenant_id
+        logger.debug(f"Authenticated user: {user.user_id} (tenant: {user.tenant_id})")
+
+    # X-Tenant-ID: JWT 테넌트가 있으면 일치 여부 확인, 없으면 헤더 값 사용
+    tenant_id = headers.get("X-Tenant-ID")
+    if tenant_id:
+        if state.get("tenant_id"):
+            if state["tenant_id"] != tenant_id:
+                logger.warning(
+                    f"Tenant ID mismatch: JWT={state['tenant_id']}, Header={tenant_id}"
+                )
+                return JSONResponse(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    content={"detail": "Tenant ID mismatch"},
+                )
+        else:
+            state["tenant_id"] = tenant_id
+        logger.debug(f"Tenant ID: {tenant_id}")
+    return None
 
 
-class TenantMiddleware(BaseHTTPMiddleware):
-    """
-    X-Tenant-ID 헤더 처리 미들웨어
-    
-    멀티테넌시를 위한 테넌트 ID를 헤더에서 추출합니다.
-    """
-    
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
-        """미들웨어 처리"""
-        
-        # X-Tenant-ID 헤더 확인
-        tenant_id = request.headers.get("X-Tenant-ID")
-        
-        if tenant_id:
-            # request.state에 이미 tenant_id가 있으면 (JWT에서 추출)
-            # 헤더 값과 비교하여 일치 여부 확인
-            if hasattr(request.state, "tenant_id") and request.state.tenant_id:
-                if request.state.tenant_id != tenant_id:
-                    logger.warning(
-                        f"Tenant ID mismatch: JWT={request.state.tenant_id}, "
-                        f"Header={tenant_id}"
-                    )
-                    return JSONResponse(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        content={"detail": "Tenant ID mismatch"},
-                    )
-            else:
-                request.state.tenant_id = tenant_id
-            
-            logger.debug(f"Tenant ID: {tenant_id}")
-        
-        return await call_next(request)
-
-
-# 분석 스트림 경로: BaseHTTPMiddleware 미경유 시 사용 (스트림 취소 방지)
-ANALYSIS_STREAM_PATH_PREFIX = "/aura/cases/"
-ANALYSIS_STREAM_PATH_SUFFIX = "/analysis/stream"
-
-
-class StreamBypassMiddleware:
+class RequestContextMiddleware:
     """
-    GET /aura/cases/{id}/analysis/stream 요청을 BaseHTTPMiddleware 없이 처리하는 raw ASGI 미들웨어.
-    Starlette BaseHTTPMiddleware가 스트리밍 응답 body 태스크를 취소하는 문제를 피하기 위해
-    해당 경로만 별도 서브앱(stream_app)으로 넘겨 응답 본문이 그대로 전달되도록 함.
-    """
-
-    def __init__(self, app: ASGIApp, stream_app: ASGIApp) -> None:
-        self.app = app
-        self.stream_app = stream_app
-
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope.get("type") != "http":
-            await self.app(scope, receive, send)
-            return
-        path = scope.get("path", "")
-        method = scope.get("method", "GET")
-        if (
-            method == "GET"
-            and path.startswith(ANALYSIS_STREAM_PATH_PREFIX)
-            and path.endswith(ANALYSIS_STREAM_PATH_SUFFIX)
-        ):
-            logger.debug("Stream bypass: delegating to stream_app path=%s", path)
-            await self.stream_app(scope, receive, send)
-            return
-        await self.app(scope, receive, send)
-
+    요청 컨텍스트 raw ASGI 미들웨어 (요청 ID, 로깅, 인증, 테넌트, 예외 처리)
 
-class RawRequestLoggingMiddleware:
-    """
-    로깅만 수행하는 raw ASGI 미들웨어.
     응답 본문을 읽거나 버퍼링하지 않아 SSE 스트림이 그대로 BE/클라이언트로 전달됩니다.
-    (BaseHTTPMiddleware는 StreamingResponse와 궁합 문제로 0바이트 전달될 수 있음)
+    응답 시작 전 예외는 JSON 에러 응답으로 변환하고, 스트리밍 도중 예외는 로깅 후 전파합니다.
     """
 
     def __init__(self, app: ASGIApp) -> None:
         self.app = app
+        self._classifier: PathClassifier | None = None
+
+    def classify(self, scope: Scope) -> str:
+        """요청 경로 분류 (분류기는 첫 요청 시 scope["app"] 라우트로 1회 컴파일)"""
+        if self._classifier is None:
+            self._classifier = PathClassifier.from_app(scope.get("app"))
+        return self._classifier.classify(scope.get("path", ""))
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope.get("type") != "http":
             await self.app(scope, receive, send)
             return
+
         request_id = str(uuid.uuid4())
         scope["request_id"] = request_id
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+
         start_time = time.time()
         method = scope.get("method", "")
         path = scope.get("path", "")
@@ -206,99 +150,51 @@ class RawRequestLoggingMiddleware:
         client_host = client[0] if client else "unknown"
         logger.info(f"[{request_id}] {method} {path} - Client: {client_host}")
         status_code: int | None = None
+        response_started = False
 
-        async def send_wrapper(message: dict) -> None:
-            nonlocal status_code
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_started
             if message["type"] == "http.response.start":
+                response_started = True
                 status_code = message.get("status", 0)
-                headers = list(message.get("headers", []))
-                headers.append((b"x-request-id", request_id.encode("latin-1")))
-                message = {**message, "headers": headers}
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"x-request-id", request_id.encode("latin-1")),
+                    ],
+                }
             await send(message)
-            if message["type"] == "http.response.body" and not message.get("more_body", True):
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
                 duration = time.time() - start_time
                 logger.info(
                     f"[{request_id}] {method} {path} - Status: {status_code} - Duration: {duration:.3f}s"
                 )
 
-        try:
-            await self.app(scope, receive, send_wrapper)
-        except Exception as e:
-            duration = time.time() - start_time
-            logger.error(
-                f"[{request_id}] Request failed after {duration:.3f}s: {e}",
-                exc_info=True,
-            )
-            raise
-
-
-class RequestIdStateMiddleware(BaseHTTPMiddleware):
-    """scope.request_id → request.state.request_id (get_request_id 등에서 사용)."""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request.state.request_id = request.scope.get("request_id") or str(uuid.uuid4())
-        if not isinstance(request.state.request_id, str):
-            request.state.request_id = str(uuid.uuid4())
-        return await call_next(request)
-
-
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    """
-    에러 처리 미들웨어
-
-    예외를 캐치하고 일관된 형식의 에러 응답을 반환합니다.
-    """
+        route_class = self.classify(scope)
+        scope[ROUTE_CLASS_SCOPE_KEY] = route_class
+        rejection = authenticate(scope, state, route_class)
+        if rejection is not None:
+            await rejection(scope, receive, send_wrapper)
+            return
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
         try:
-            response = await call_next(request)
-            return response
-        except PermissionError as e:
-            logger.warning(f"Permission denied: {e}")
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={
-                    "detail": str(e),
-                    "error_type": "permission_error",
-                },
-            )
-        
-        except ValueError as e:
-            logger.warning(f"Validation error: {e}")
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={
-                    "detail": str(e),
-                    "error_type": "validation_error",
-                },
-            )
-        
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logger.error(f"Unhandled exception: {e}", exc_info=True)
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "detail": "Internal server error",
-                    "error_type": "server_error",
-                },
-            )
+            if response_started:
+                duration = time.time() - start_time
+                logger.error(
+                    f"[{request_id}] Request failed after {duration:.3f}s: {e}",
+                    exc_info=True,
+                )
+                raise
+            await _error_response(e)(scope, receive, send_wrapper)
 
 
-def setup_middlewares(app, stream_app: ASGIApp | None = None) -> None:
+def setup_middlewares(app) -> None:
     """
     FastAPI 앱에 미들웨어 추가.
-    로깅은 raw ASGI로 해서 SSE 스트림 본문이 BE까지 전달되도록 함.
-    stream_app이 주어지면 GET .../analysis/stream 은 BaseHTTPMiddleware 없이 stream_app으로 처리.
+    요청 ID/로깅/인증/테넌트/예외 처리를 단일 raw ASGI 미들웨어로 처리 (스트림 경로 포함).
     """
-    app.add_middleware(ErrorHandlingMiddleware)
-    app.add_middleware(RequestIdStateMiddleware)
-    app.add_middleware(TenantMiddleware)
-    app.add_middleware(AuthMiddleware)
-    app.add_middleware(RawRequestLoggingMiddleware)
-    if stream_app is not None:
-        app.add_middleware(StreamBypassMiddleware, stream_app=stream_app)
+    app.add_middleware(RequestContextMiddleware)
     logger.info("Middlewares configured")
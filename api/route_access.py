@@ -0,0 +1,130 @@
+"""
+Route Access Module
+
+라우트별 접근 분류(public / auth / stream)와 컴파일된 경로 분류기입니다.
+- 라우트 선언: @public_route (인증 생략), @stream_route (SSE 스트림, 인증 필요)
+- 첫 요청 시 앱 라우트 메타데이터로 분류기 1회 컴파일 (정적 경로 dict + 파라미터 경로 단일 정규식)
+- 미들웨어가 요청당 1회 분류하여 scope["route_class"]에 저장 → 하위 처리에서 재사용
+
+사용 예:
+    @router.get("/health")
+    @public_route
+    async def health(): ...
+"""
+
+import re
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from starlette.routing import Mount
+
+try:  # FastAPI 신규 버전: include_router가 라우트를 지연 포함 (app.routes에 펼쳐지지 않음)
+    from fastapi.routing import iter_route_contexts
+except ImportError:  # 고정 버전(^0.115): include_router가 prefix 포함 APIRoute로 펼쳐 추가
+    iter_route_contexts = None
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+ROUTE_CLASS_PUBLIC = "public"
+ROUTE_CLASS_AUTH = "auth"
+ROUTE_CLASS_STREAM = "stream"
+
+ROUTE_CLASS_SCOPE_KEY = "route_class"
+
+# 라우트 데코레이터로 선언할 수 없는 공개 경로 (FastAPI 자동 생성 문서 라우트)
+# '*'로 끝나면 접두 경로 매칭
+STATIC_PUBLIC_PATHS = [
+    "/docs",
+    "/docs/oauth2-redirect",
+    "/redoc",
+    "/openapi.json",
+]
+
+_PARAM_PATTERN = re.compile(r"\{([^}:]+)(?::([^}]+))?\}")
+
+
+def public_route(func: F) -> F:
+    """인증 없이 접근 가능한 라우트로 선언 (라우터 데코레이터 아래에 적용)"""
+    func.__route_class__ = ROUTE_CLASS_PUBLIC
+    return func
+
+
+def stream_route(func: F) -> F:
+    """SSE 스트림 라우트로 선언 (인증 필요, 라우터 데코레이터 아래에 적용)"""
+    func.__route_class__ = ROUTE_CLASS_STREAM
+    return func
+
+
+def _path_to_regex(path: str) -> str:
+    """'/aura/cases/{case_id}/stream' → 정규식 조각 ({x:path}는 여러 세그먼트 허용)"""
+    parts: list[str] = []
+    pos = 0
+    for match in _PARAM_PATTERN.finditer(path):
+        parts.append(re.escape(path[pos:match.start()]))
+        parts.append(".*" if match.group(2) == "path" else "[^/]+")
+        pos = match.end()
+    parts.append(re.escape(path[pos:]))
+    return "".join(parts)
+
+
+class PathClassifier:
+    """
+    경로 → 라우트 분류 (public / auth / stream)
+
+    정적 경로는 dict 조회, 파라미터/접두 경로는 라우트 순서대로 named group을 가진 단일 정규식으로 1회 매칭
+    (Starlette 라우트 매칭과 동일하게 먼저 선언된 라우트 우선, 메서드는 구분하지 않음).
+    선언되지 않은 경로(404 포함)는 auth로 분류.
+    """
+
+    def __init__(self, routes: Iterable[tuple[str, str]]) -> None:
+        """
+        Args:
+            routes: 라우트 순서대로 (경로 템플릿, 분류) 목록. '*'로 끝나는 경로는 접두 매칭
+        """
+        self._exact: dict[str, str] = {}
+        self._pattern_classes: list[str] = []
+        patterns: list[str] = []
+        for path, route_class in routes:
+            if path.endswith("*"):
+                pattern = re.escape(path[:-1]) + ".*"
+            elif "{" in path:
+                pattern = _path_to_regex(path)
+            else:
+                self._exact.setdefault(path, route_class)
+                continue
+            patterns.append(f"(?P<r{len(self._pattern_classes)}>{pattern}$)")
+            self._pattern_classes.append(route_class)
+        self._regex = re.compile("|".join(patterns)) if patterns else None
+
+    def classify(self, path: str) -> str:
+        route_class = self._exact.get(path)
+        if route_class is not None:
+            return route_class
+        if self._regex is not None:
+            match = self._regex.match(path)
+            if match is not None and match.lastgroup is not None:
+                return self._pattern_classes[int(match.lastgroup[1:])]
+        return ROUTE_CLASS_AUTH
+
+    @classmethod
+    def from_app(cls, app: Any, extra_public: Iterable[str] = STATIC_PUBLIC_PATHS) -> "PathClassifier":
+        """앱 라우트의 endpoint 선언(@public_route/@stream_route, 미선언은 auth)으로 분류기 컴파일"""
+        routes: list[tuple[str, str]] = [(path, ROUTE_CLASS_PUBLIC) for path in extra_public]
+        for path, endpoint in _iter_endpoints(getattr(app, "routes", [])):
+            routes.append((path, getattr(endpoint, "__route_class__", ROUTE_CLASS_AUTH)))
+        return cls(routes)
+
+
+def _iter_endpoints(routes: Iterable[Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """라우트 목록 → (전체 경로, endpoint). Mount는 prefix를 붙여 하위 라우트로 재귀"""
+    for route in routes:
+        if isinstance(route, Mount):
+            yield from _iter_endpoints(route.routes, prefix + route.path)
+            continue
+        path = getattr(route, "path", None)
+        if path:
+            yield prefix + path, getattr(route, "endpoint", None)
+        elif iter_route_contexts is not None:
+            # 지연 포함된 라우터 (path 없음) → 유효 경로(prefix 포함)로 펼침
+            for context in iter_route_contexts([route]):
+                if context.path:
+                    yield prefix + context.path, context.endpoint
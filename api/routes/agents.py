@@ -9,11 +9,12 @@ import json
 import logging
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Request, status
 from pydantic import BaseModel, Field
 
 from api.dependencies import CurrentUser, TenantId
+from api.sse_utils import sse_response
+from api.route_access import public_route, stream_route
 from domains.dev.agents.code_agent import get_code_agent
 
 logger = logging.getLogger(__name__)
@@ -73,8 +74,10 @@ async def chat(
 
 
 @router.post("/chat/stream")
+@stream_route
 async def chat_stream(
     request: ChatRequest,
+    req: Request,
     user: CurrentUser,
     tenant_id: TenantId,
 ):
@@ -137,15 +140,7 @@ async def chat_stream(
             }
             yield f"data: {json.dumps(error_data)}\n\n"
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Nginx 버퍼링 비활성화
-        },
-    )
+    return sse_response(event_generator(), req, tenant_id)
 
 
 def _format_event(event: dict[str, Any]) -> dict[str, Any] | None:
@@ -227,6 +222,7 @@ async def list_tools(user: CurrentUser):
 
 
 @router.get("/health")
+@public_route
 async def agent_health():
     """에이전트 헬스체크"""
     try:
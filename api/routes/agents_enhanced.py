@@ -9,11 +9,11 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Request, status
 from pydantic import BaseModel, Field
 
 from api.dependencies import CurrentUser, TenantId
+from api.sse_utils import sse_response
 from api.schemas.events import (
     ThoughtEvent,
     PlanStepEvent,
@@ -23,6 +23,7 @@ from api.schemas.events import (
     EndEvent,
     ErrorEvent,
 )
+from api.route_access import stream_route
 from domains.dev.agents.enhanced_agent import get_enhanced_agent
 from domains.dev.agents.hooks import create_sse_hook
 from core.memory import get_checkpointer
@@ -40,8 +41,10 @@ class EnhancedChatRequest(BaseModel):
 
 
 @router.post("/chat/stream")
+@stream_route
 async def enhanced_chat_stream(
     request: EnhancedChatRequest,
+    req: Request,
     user: CurrentUser,
     tenant_id: TenantId,
 ):
@@ -63,13 +66,8 @@ async def enhanced_chat_stream(
             start_event = StartEvent(message="Enhanced agent started")
             yield f"data: {json.dumps(start_event.model_dump())}\n\n"
             
-            # Checkpointer 설정
-            # TODO: LangGraphCheckpointer를 BaseCheckpointSaver 인터페이스에 맞게 수정 필요
-            # 현재는 MemorySaver를 기본값으로 사용 (None 전달 시 MemorySaver 사용)
-            checkpointer = None  # MemorySaver 사용 (임시 해결책)
-            
-            # Enhanced Agent 가져오기
-            agent = get_enhanced_agent(checkpointer=checkpointer)
+            # Enhanced Agent 가져오기 (Checkpointer: checkpointer_factory, CHECKPOINTER_BACKEND=redis 시 워커 간 공유)
+            agent = get_enhanced_agent()
             
             # SSE Hook 생성
             hook = create_sse_hook(event_queue)
@@ -149,15 +147,7 @@ async def enhanced_chat_stream(
             )
             yield f"data: {json.dumps(error_event.model_dump())}\n\n"
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    return sse_response(event_generator(), req, tenant_id)
 
 
 @router.post("/approve")
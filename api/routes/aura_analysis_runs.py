@@ -4,27 +4,29 @@ Phase2 Analysis Runs (runId 기반)
 GET /aura/analysis-runs/{runId}/stream - runId 기반 SSE 스트림
 """
 
-import asyncio
 import logging
 
-from fastapi import APIRouter
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Header, Request
 
 from api.dependencies import CurrentUser, TenantId
-from api.sse_utils import SSE_HEADERS, format_sse_line
+from api.sse_encoder import CONNECTED_COMMENT, DONE_FRAME
+from api.sse_utils import format_sse_line, sse_max_fps, sse_response
+from api.route_access import stream_route
 from core.analysis.run_store import get_event, queue_exists
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/aura/analysis-runs", tags=["aura-analysis-runs"])
-STREAM_EVENT_DELAY = 0.15
 
 
 @router.get("/{run_id}/stream")
+@stream_route
 async def analysis_run_stream(
     run_id: str,
+    request: Request,
     user: CurrentUser,
     tenant_id: TenantId,
+    x_dwp_caller_type: str | None = Header(None, alias="X-DWP-Caller-Type"),
 ):
     """
     Phase2 분석 스트림 (runId 기반)
@@ -45,7 +47,7 @@ async def analysis_run_stream(
 
     async def event_generator():
         # 연결 직후 한 줄 전송해 클라이언트/프록시가 스트림을 인식하도록 함 (빈 응답 방지)
-        yield ": connected\n\n"
+        yield CONNECTED_COMMENT
         sent_completed = False
         case_id = ""
         while True:
@@ -57,7 +59,6 @@ async def analysis_run_stream(
             if event_type == "started":
                 case_id = payload.get("caseId", "")
             yield format_sse_line(event_type, payload)
-            await asyncio.sleep(STREAM_EVENT_DELAY)
             if event_type in ("completed", "failed"):
                 sent_completed = True
                 break
@@ -65,10 +66,6 @@ async def analysis_run_stream(
         if not sent_completed:
             fallback = {"status": "completed", "runId": run_id, "caseId": case_id}
             yield format_sse_line("completed", fallback)
-        yield "data: [DONE]\n\n"
+        yield DONE_FRAME
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers=SSE_HEADERS,
-    )
+    return sse_response(event_generator(), request, tenant_id, sse_max_fps(x_dwp_caller_type))
@@ -5,21 +5,19 @@ dwp-backend와의 연동을 위한 엔드포인트입니다.
 백엔드 요구사항에 맞춘 SSE 스트리밍 및 HITL 통신을 제공합니다.
 """
 
-import asyncio
 import json
 import logging
 import uuid
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Header, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Header, HTTPException, Request, status
 from pydantic import BaseModel, Field, field_validator
 
 from api.dependencies import CurrentUser, TenantId
-from api.sse_utils import SSE_HEADERS
+from api.sse_encoder import DONE_FRAME, encode_sse
+from api.sse_utils import acquire_stream_slot, sse_max_fps, sse_response
 from api.schemas.events import (
-    SSE_EVENT_PAYLOAD_VERSION,
     ThoughtEvent,
     PlanStepEvent,
     PlanStepUpdateEvent,
@@ -32,7 +30,9 @@ from api.schemas.events import (
     FailedEvent,
 )
 from api.schemas.hitl_events import HITLEvent
+from api.route_access import stream_route
 from core.memory.hitl_manager import get_hitl_manager
+from core.streaming.event_log import get_sse_event_log
 from domains.dev.agents.enhanced_agent import get_enhanced_agent
 from domains.dev.agents.hooks import create_sse_hook
 from core.memory import get_checkpointer
@@ -41,10 +41,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/aura", tags=["aura-backend"])
 
-# 스트리밍 이벤트 간 최소 지연시간 (초) - 프론트엔드 UI 안정성을 위해
-STREAMING_EVENT_DELAY = 0.05  # 50ms
-
-
 class BackendStreamRequest(BaseModel):
     """백엔드 스트리밍 요청 모델 (프론트엔드 API 스펙 준수)"""
     prompt: str = Field(..., min_length=1, description="사용자 프롬프트")
@@ -75,7 +71,7 @@ class BackendStreamRequest(BaseModel):
         return v
 
 
-def format_sse_event(event_type: str, data: dict[str, Any], event_id: str | None = None) -> str:
+def format_sse_event(event_type: str, data: dict[str, Any] | BaseModel, event_id: str | None = None) -> bytes:
     """
     SSE 이벤트 형식으로 변환 (백엔드 요구사항)
     
@@ -86,39 +82,23 @@ def format_sse_event(event_type: str, data: dict[str, Any], event_id: str | None
     
     Args:
         event_type: 이벤트 타입 (thought, plan_step, tool_execution, hitl, content)
-        data: 이벤트 데이터
+        data: 이벤트 데이터 (dict 또는 pydantic 이벤트 모델, datetime은 Unix timestamp(초)로 직렬화)
         event_id: 이벤트 ID (재연결 지원용, None이면 자동 생성)
         
     Returns:
-        SSE 형식 문자열
+        SSE 프레임 bytes (api.sse_encoder)
     """
     if event_id is None:
         # Unix timestamp (밀리초)를 이벤트 ID로 사용
         event_id = str(int(datetime.utcnow().timestamp() * 1000))
-    
-    # datetime 객체를 Unix timestamp (초 단위 정수)로 변환
-    def convert_datetime(obj: Any) -> Any:
-        """datetime 객체를 Unix timestamp로 변환"""
-        if isinstance(obj, datetime):
-            return int(obj.timestamp())
-        elif isinstance(obj, dict):
-            return {k: convert_datetime(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_datetime(item) for item in obj]
-        return obj
-    
-    # datetime 객체 변환
-    converted_data = convert_datetime(data)
-    # 페이로드 스키마 버전 보강 (권장: {"version":"1.0", "type":..., ...})
-    if isinstance(converted_data, dict):
-        converted_data.setdefault("version", SSE_EVENT_PAYLOAD_VERSION)
-
-    return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(converted_data, ensure_ascii=False)}\n\n"
+    return encode_sse(event_type, data, event_id)
 
 
 @router.post("/test/stream")
+@stream_route
 async def backend_stream(
     request: BackendStreamRequest,
+    req: Request,
     user: CurrentUser,
     tenant_id: TenantId,
     x_dwp_source: str | None = Header(None, alias="X-DWP-Source"),
@@ -150,8 +130,11 @@ async def backend_stream(
     - 이벤트 타입: thought, plan_step, plan_step_update, timeline_step_update, tool_execution, hitl, content
     - 스트림 종료: `data: [DONE]\n\n`
     - HITL 이벤트 전송 시 실행 중지 및 Redis Pub/Sub 대기
-    - Last-Event-ID 헤더 지원: 재연결 시 중단 지점부터 재개 (이벤트 ID 기반)
+    - Last-Event-ID 헤더 지원: 동일 thread_id로 재연결 시 세션 로그에서 누락 이벤트 replay 후 실시간 구독 (에이전트 재실행 없음)
     """
+    # Thread ID 생성 (스트림 세션 로그 키)
+    thread_id = request.thread_id or f"{user.user_id}_{tenant_id}_{int(datetime.utcnow().timestamp())}"
+    
     async def event_generator():
         """SSE 이벤트 생성기 (백엔드 요구사항 준수)"""
         # X-User-ID 헤더 검증 (백엔드 요구사항: JWT sub와 일치해야 함)
@@ -167,7 +150,7 @@ async def backend_stream(
                 "timestamp": int(datetime.utcnow().timestamp()),
             }
             yield format_sse_event("error", error_data, "0")
-            yield "data: [DONE]\n\n"
+            yield DONE_FRAME
             return
         
         event_queue: list[dict[str, Any]] = []
@@ -189,25 +172,18 @@ async def backend_stream(
             start_data = {
                 "type": "start",
                 "message": "Agent started",
+                "threadId": thread_id,
                 "timestamp": int(datetime.utcnow().timestamp()),
             }
             event_id_counter += 1
             yield format_sse_event("start", start_data, str(event_id_counter))
             
-            # Checkpointer 설정
-            # TODO: LangGraphCheckpointer를 BaseCheckpointSaver 인터페이스에 맞게 수정 필요
-            # 현재는 MemorySaver를 기본값으로 사용 (None 전달 시 MemorySaver 사용)
-            checkpointer = None  # MemorySaver 사용 (임시 해결책)
-            
-            # Enhanced Agent 가져오기
-            agent = get_enhanced_agent(checkpointer=checkpointer)
+            # Enhanced Agent 가져오기 (Checkpointer: checkpointer_factory, CHECKPOINTER_BACKEND=redis 시 워커 간 공유)
+            agent = get_enhanced_agent()
             
             # SSE Hook 생성
             hook = create_sse_hook(event_queue)
             
-            # Thread ID 생성
-            thread_id = request.thread_id or f"{user.user_id}_{tenant_id}_{int(datetime.utcnow().timestamp())}"
-            
             # 컨텍스트 병합 (요청의 context와 헤더 정보)
             merged_context = {
                 **(request.context or {}),
@@ -276,13 +252,14 @@ async def backend_stream(
                                 context=approval["toolArgs"],
                             )
                             event_id_counter += 1
-                            yield format_sse_event("hitl", hitl_event.model_dump(), str(event_id_counter))
+                            yield format_sse_event("hitl", hitl_event, str(event_id_counter))
                             
                             # 승인 신호 대기 (Redis Pub/Sub)
                             logger.info(f"HITL: Waiting for approval signal (session: {session_id})")
                             signal = await hitl_manager.wait_for_approval_signal(
                                 session_id=session_id,
                                 timeout=300,  # 5분
+                                request_id=request_id,
                             )
                             
                             if signal is None:
@@ -323,7 +300,7 @@ async def backend_stream(
                                 yield format_sse_event("end", end_data, str(event_id_counter))
                                 
                                 # 스트림 종료 표시
-                                yield "data: [DONE]\n\n"
+                                yield DONE_FRAME
                                 return
                             
                             if signal.get("type") == "rejection":
@@ -336,7 +313,7 @@ async def backend_stream(
                                 }
                                 event_id_counter += 1
                                 yield format_sse_event("error", error_data, str(event_id_counter))
-                                yield "data: [DONE]\n\n"
+                                yield DONE_FRAME
                                 return
                             
                             # 승인됨 - 실행 계속
@@ -356,10 +333,6 @@ async def backend_stream(
                     
                     event_id_counter += 1
                     yield format_sse_event(event_type, formatted_data, str(event_id_counter))
-                    
-                    # 프론트엔드 UI 안정성을 위한 최소 지연시간 적용
-                    # 너무 빠른 이벤트 연속 전송 시 UI 깨짐 방지
-                    await asyncio.sleep(STREAMING_EVENT_DELAY)
             
             # 종료 이벤트
             end_data = {
@@ -371,7 +344,7 @@ async def backend_stream(
             yield format_sse_event("end", end_data, str(event_id_counter))
             
             # 스트림 종료 표시 (프론트엔드 요구사항)
-            yield "data: [DONE]\n\n"
+            yield DONE_FRAME
             
         except Exception as e:
             logger.error(f"Backend streaming failed: {e}", exc_info=True)
@@ -383,13 +356,24 @@ async def backend_stream(
             }
             event_id_counter += 1
             yield format_sse_event("error", error_data, str(event_id_counter))
-            yield "data: [DONE]\n\n"
+            yield DONE_FRAME
+    
+    # 동일 thread_id + Last-Event-ID 재연결 → 에이전트 재실행 없이 세션 로그 replay 후 실시간 구독
+    # 에이전트 실행 전에 테넌트 동시 스트림 슬롯 확보 (초과 시 429)
+    release_slot = acquire_stream_slot(tenant_id)
+    event_log = get_sse_event_log()
+    log_key = f"backend:{tenant_id}:{user.user_id}:{thread_id}"
+    session = event_log.get(log_key) if last_event_id else None
+    if session is not None:
+        logger.info(f"Backend stream reattached: thread={thread_id}, last_event_id={last_event_id}")
+        frames = session.frames(last_event_id)
+        max_fps = sse_max_fps(replay=True)
+    else:
+        frames = event_log.start(log_key, event_generator()).frames()
+        # 프론트엔드 UI 안정성: 이벤트 burst는 sse_max_fps 단위 청크로 병합 (고정 지연 없음)
+        max_fps = sse_max_fps(x_dwp_caller_type)
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers=SSE_HEADERS,
-    )
+    return sse_response(frames, req, tenant_id, max_fps, release=release_slot)
 
 
 @router.get("/hitl/requests/{request_id}")
@@ -6,22 +6,28 @@ Phase2-2: Trigger 202 JSON, Stream 별도, BE Callback
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
 import uuid
+from contextlib import aclosing
 from typing import Any
 
 from fastapi import APIRouter, Header, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, field_validator
 
 from api.dependencies import AdminUser, CurrentUser, TenantId
 from api.schemas.common import coerce_case_run_id
-from api.sse_utils import SSE_HEADERS, format_sse_line
+from api.sse_encoder import CONNECTED_COMMENT, DONE_FRAME, encode_sse
+from api.sse_utils import format_sse_line, sse_max_fps, sse_response
+from api.route_access import stream_route
 from core.context import set_request_context
 from core.analysis.callback import send_callback
+from core.analysis.worker_pool import ANALYSIS_PHASE2, iter_analysis
 from core.analysis.run_store import get_event, get_or_create_queue, put_event, queue_exists, remove_queue
+from core.task_supervisor import POOL_PHASE2, TASK_QUEUED, TaskPoolSaturatedError, get_task_supervisor
 from core.streaming.case_stream_store import (
     CaseStreamEvent,
     get_case_stream_store,
@@ -33,30 +39,30 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/aura/cases", tags=["aura-cases"])
 
-# SSE 이벤트 간 최소 지연 (초)
-STREAM_EVENT_DELAY = 0.15
 
-
-def _format_case_sse_event(ev: CaseStreamEvent) -> str:
+def _format_case_sse_event(ev: CaseStreamEvent) -> bytes:
     """SSE 형식: id, event, data"""
-    return f"id: {ev.id}\nevent: {ev.event}\ndata: {json.dumps(ev.to_sse_data(), ensure_ascii=False)}\n\n"
+    return encode_sse(ev.event, ev.to_sse_data(), ev.id, versioned=False)
 
 
 # ==================== P0: Case Stream ====================
 
 
 @router.get("/{case_id}/stream")
+@stream_route
 async def case_stream(
     case_id: str,
+    request: Request,
     user: CurrentUser,
     tenant_id: TenantId,
     last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+    x_dwp_caller_type: str | None = Header(None, alias="X-DWP-Caller-Type"),
 ):
     """
     Case Agent Stream (SSE) - P0
     
     GET /api/aura/cases/{caseId}/stream
-    Last-Event-ID로 replay 지원.
+    Last-Event-ID로 replay 지원 (replay는 페이싱 없이 즉시 전송).
     """
     store = get_case_stream_store()
     tenant = tenant_id or "1"
@@ -67,7 +73,6 @@ async def case_stream(
         events_after = store.get_events_after(case_id, last_event_id)
         for ev in events_after:
             yield _format_case_sse_event(ev)
-            await asyncio.sleep(STREAM_EVENT_DELAY)
 
         # 기존 이벤트가 없으면 샘플 3~5개 생성 후 스트리밍
         if not events_after:
@@ -80,15 +85,12 @@ async def case_stream(
             )
             for ev in sample_events:
                 yield _format_case_sse_event(ev)
-                await asyncio.sleep(STREAM_EVENT_DELAY)
 
         # 스트림 종료 표시
-        yield "data: [DONE]\n\n"
+        yield DONE_FRAME
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers=SSE_HEADERS,
+    return sse_response(
+        event_generator(), request, tenant_id, sse_max_fps(x_dwp_caller_type, replay=bool(last_event_id)),
     )
 
 
@@ -160,10 +162,9 @@ async def _run_analysis_background(
     event_type = "failed"
     payload: dict[str, Any] = {}
     try:
-        from core.analysis.phase2_pipeline import run_phase2_analysis
-
-        async for event_type, payload in run_phase2_analysis(
-            case_id, run_id=run_id, tenant_id=tenant_id, body_evidence=body_evidence,
+        async for event_type, payload in iter_analysis(
+            ANALYSIS_PHASE2,
+            case_id=case_id, run_id=run_id, tenant_id=tenant_id, body_evidence=body_evidence,
         ):
             put_event(run_id, event_type, payload)
             if event_type in ("completed", "failed"):
@@ -221,10 +222,23 @@ async def case_analysis_runs(
     auth_token = request.headers.get("Authorization")
 
     get_or_create_queue(run_id)
-    asyncio.create_task(_run_analysis_background(
-        case_id, run_id, tenant_id_val, auth_token,
-        body_evidence=body.evidence,
-    ))
+    try:
+        submitted = get_task_supervisor().submit(
+            POOL_PHASE2,
+            functools.partial(
+                _run_analysis_background,
+                case_id, run_id, tenant_id_val, auth_token,
+                body_evidence=body.evidence,
+            ),
+            name=f"phase2:{case_id}:{run_id}",
+        )
+    except TaskPoolSaturatedError as e:
+        remove_queue(run_id)
+        return JSONResponse(
+            status_code=429,
+            content={"status": "REJECTED", "runId": run_id, "caseId": case_id, "detail": str(e)},
+            headers={"Retry-After": "5"},
+        )
 
     stream_url = f"/aura/analysis-runs/{run_id}/stream"
     return JSONResponse(
@@ -234,16 +248,21 @@ async def case_analysis_runs(
             "runId": run_id,
             "caseId": case_id,
             "streamUrl": stream_url,
+            "queued": submitted.status == TASK_QUEUED,
+            "queuePosition": submitted.queue_position,
         },
     )
 
 
 @router.get("/{case_id}/analysis/stream")
+@stream_route
 async def case_analysis_stream(
     case_id: str,
     runId: str,
+    request: Request,
     user: CurrentUser,
     tenant_id: TenantId,
+    x_dwp_caller_type: str | None = Header(None, alias="X-DWP-Caller-Type"),
 ):
     """
     Phase2-2 분석 스트림 (SSE)
@@ -265,7 +284,7 @@ async def case_analysis_stream(
     async def event_generator():
         # 연결 직후 SSE 주석 한 줄 전송 (클라이언트/프록시가 스트림 연결 인식용)
         try:
-            yield ": connected\n\n"
+            yield CONNECTED_COMMENT
             logger.info("case_analysis_stream: first chunk sent run_id=%s", run_id)
         except (GeneratorExit, BaseException) as e:
             logger.warning("case_analysis_stream: connection closed before/after first chunk run_id=%s reason=%s", run_id, e)
@@ -283,38 +302,25 @@ async def case_analysis_stream(
                 if event_type == "started":
                     case_id_val = payload.get("caseId", "")
                 yield format_sse_line(event_type, payload)
-                await asyncio.sleep(STREAM_EVENT_DELAY)
                 if event_type in ("completed", "failed"):
                     sent_completed = True
                     break
             if not sent_completed:
                 fallback = {"status": "completed", "runId": run_id, "caseId": case_id_val}
                 yield format_sse_line("completed", fallback)
-            yield "data: [DONE]\n\n"
+            yield DONE_FRAME
         except (GeneratorExit, BaseException) as e:
             logger.warning("case_analysis_stream: stream closed run_id=%s reason=%s", run_id, e)
             raise
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers=SSE_HEADERS,
-    )
-
-
-# 스트림 전용 라우터 (BaseHTTPMiddleware 미경유용 — 스트림 취소 방지)
-stream_only_router = APIRouter(prefix="/aura/cases", tags=["aura-cases"])
-stream_only_router.add_api_route(
-    "/{case_id}/analysis/stream",
-    case_analysis_stream,
-    methods=["GET"],
-)
+    return sse_response(event_generator(), request, tenant_id, sse_max_fps(x_dwp_caller_type))
 
 
 # ==================== Phase2: Analysis Trigger (SSE, legacy) ====================
 
 
 @router.post("/{case_id}/analysis/trigger")
+@stream_route
 async def case_analysis_trigger(
     case_id: str,
     request: Request,
@@ -340,23 +346,32 @@ async def case_analysis_trigger(
     )
 
     async def event_generator():
-        from core.analysis.phase2_pipeline import run_phase2_analysis
-
         try:
-            async for event_type, payload in run_phase2_analysis(
-                case_id, tenant_id=tenant_id or "1",
-            ):
-                yield format_sse_line(event_type, payload)
-                await asyncio.sleep(STREAM_EVENT_DELAY)
+            # aclosing: 연결 끊김으로 스트림이 닫히면 파이프라인 생성기(워커 모드면 워커 작업)도 즉시 종료
+            async with aclosing(iter_analysis(ANALYSIS_PHASE2, case_id=case_id, tenant_id=tenant_id or "1")) as events:
+                async for event_type, payload in events:
+                    yield format_sse_line(event_type, payload)
+        except (asyncio.CancelledError, GeneratorExit):
+            # 클라이언트 연결 끊김 → 진행 중 LLM/Synapse 호출 취소, 이후 audit 발행 중단
+            logger.info(f"Phase2 analysis trigger cancelled: case_id={case_id}")
+            try:
+                from core.audit import AgentAuditEvent, get_audit_writer
+                get_audit_writer().ingest_fire_and_forget(AgentAuditEvent.run_cancelled(
+                    tenant_id=tenant_id or "1",
+                    reason="client_disconnected",
+                    trace_id=f"trace-{case_id}-analysis",
+                    caseId=case_id,
+                ))
+            except Exception:
+                pass
+            raise
         except Exception as e:
             logger.exception(f"Phase2 analysis trigger failed: {e}")
             yield format_sse_line("failed", {"error": str(e), "stage": "trigger"})
-        yield "data: [DONE]\n\n"
+        yield DONE_FRAME
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers=SSE_HEADERS,
+    return sse_response(
+        event_generator(), request, tenant_id, sse_max_fps(request.headers.get("X-DWP-Caller-Type")),
     )
 
 
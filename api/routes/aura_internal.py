@@ -5,6 +5,7 @@ POST /aura/internal/cases/{caseId}/analysis-runs — BE 호출, 즉시 ack.
 """
 
 import asyncio
+import functools
 import logging
 import os
 from typing import Any
@@ -16,9 +17,10 @@ from pydantic import BaseModel, Field, field_validator
 
 from api.schemas.common import coerce_case_run_id
 from core.context import set_request_context
-from core.analysis.phase3_pipeline import run_phase3_analysis
+from core.analysis.worker_pool import ANALYSIS_PHASE3, iter_analysis
 from core.analysis.phase3_callback import send_phase3_callback
 from core.analysis.run_store import get_or_create_queue, put_event, remove_queue
+from core.task_supervisor import POOL_PHASE3, TASK_QUEUED, TaskPoolSaturatedError, get_task_supervisor
 
 logger = logging.getLogger(__name__)
 
@@ -80,8 +82,10 @@ async def _run_phase3_background(
     failed_payload: dict[str, Any] = {}
 
     try:
-        async for event_type, payload in run_phase3_analysis(
-            case_id, run_id, artifacts=artifacts, callbacks=callbacks.model_dump(), options=opts, test_fail=test_fail
+        async for event_type, payload in iter_analysis(
+            ANALYSIS_PHASE3,
+            case_id=case_id, run_id=run_id, artifacts=artifacts,
+            callbacks=callbacks.model_dump(), options=opts, test_fail=test_fail,
         ):
             if event_type == "_phase3_callback_payload":
                 callback_payload = payload
@@ -153,14 +157,27 @@ async def phase3_analysis_runs(
         test_fail = test_fail.lower() if test_fail else None
     get_or_create_queue(run_id)
 
-    asyncio.create_task(_run_phase3_background(
-        case_id_str,
-        run_id,
-        body.artifacts,
-        body.callbacks,
-        body.options,
-        test_fail=test_fail,
-    ))
+    try:
+        submitted = get_task_supervisor().submit(
+            POOL_PHASE3,
+            functools.partial(
+                _run_phase3_background,
+                case_id_str,
+                run_id,
+                body.artifacts,
+                body.callbacks,
+                body.options,
+                test_fail=test_fail,
+            ),
+            name=f"phase3:{case_id_str}:{run_id}",
+        )
+    except TaskPoolSaturatedError as e:
+        remove_queue(run_id)
+        return JSONResponse(
+            status_code=429,
+            content={"accepted": False, "runId": run_id, "message": str(e)},
+            headers={"Retry-After": "5"},
+        )
 
     stream_path = f"/aura/cases/{case_id_str}/analysis/stream?runId={run_id}"
     return JSONResponse(
@@ -169,5 +186,7 @@ async def phase3_analysis_runs(
             "accepted": True,
             "runId": run_id,
             "streamPath": stream_path,
+            "queued": submitted.status == TASK_QUEUED,
+            "queuePosition": submitted.queue_position,
         },
     )
@@ -8,18 +8,21 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from fastapi import APIRouter, Header, Request
-from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, model_validator
 
 from api.dependencies import CurrentUser, TenantId
 from api.routes.aura_backend import format_sse_event
+from api.sse_encoder import DONE_FRAME
+from api.sse_utils import acquire_stream_slot, sse_max_fps, sse_response
 from api.schemas.hitl_events import HITLEvent
+from api.route_access import stream_route
 from core.config import settings
 from core.context import set_request_context
 from core.memory.hitl_manager import get_hitl_manager
+from core.streaming.event_log import get_sse_event_log
 from domains.finance.agents.finance_agent import get_finance_agent
 from domains.finance.agents.hooks import create_finance_sse_hook
 
@@ -27,9 +30,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/agents/finance", tags=["finance-agent"])
 
-STREAMING_EVENT_DELAY = 0.05
-
-
 class FinanceStreamRequest(BaseModel):
     """Finance 스트리밍 요청"""
     prompt: str | None = Field(default=None, description="사용자 프롬프트 (목표)")
@@ -40,12 +40,24 @@ class FinanceStreamRequest(BaseModel):
         description="caseId, documentIds, entityIds, openItemIds",
     )
     thread_id: str | None = Field(default=None, description="스레드 ID")
+    resume: bool = Field(
+        default=False,
+        description="suspend된 HITL 세션 재개 (thread_id 필수, prompt 불필요)",
+    )
+    hitl_mode: Literal["block", "suspend"] | None = Field(
+        default=None,
+        description="HITL interrupt 처리 방식 (미지정 시 settings.hitl_resume_mode)",
+    )
 
     @model_validator(mode="after")
     def require_prompt_or_message(self) -> "FinanceStreamRequest":
-        """prompt 또는 message 중 하나 필수 (최소 1자)"""
+        """prompt 또는 message 중 하나 필수 (최소 1자), resume 요청은 thread_id 필수"""
         p = (self.prompt or "").strip()
         m = (self.message or "").strip()
+        if self.resume:
+            if not self.thread_id:
+                raise ValueError("resume 요청에는 thread_id가 필수입니다")
+            return self
         if not p and not m:
             raise ValueError("prompt 또는 message 중 하나는 필수입니다")
         if m and not p:
@@ -71,7 +83,48 @@ def _enrich_event_data(
     return data
 
 
+def _signal_to_resume_value(
+    signal: dict[str, Any],
+    request_id: str,
+    tenant_id: str,
+    trace_id: str,
+) -> dict[str, Any]:
+    """HITL 승인/거절 신호 → Command(resume=...) 값 (승인 시 audit action_approved 발행)"""
+    if signal.get("type") == "rejection":
+        return {"approved": False}
+    resume_value = {"approved": signal.get("approved", True)}
+    try:
+        from core.audit import AgentAuditEvent
+        from core.audit.writer import get_audit_writer
+        event = AgentAuditEvent.action_approved(
+            tenant_id=tenant_id,
+            action_id=request_id,
+            trace_id=trace_id,
+        )
+        get_audit_writer().ingest_fire_and_forget(event)
+    except Exception:
+        pass
+    return resume_value
+
+
+def _audit_run_cancelled(tenant_id: str, trace_id: str, **evidence: Any) -> None:
+    """실행 취소 audit 이벤트 발행 (reason=client_disconnected)"""
+    try:
+        from core.audit import AgentAuditEvent
+        from core.audit.writer import get_audit_writer
+        event = AgentAuditEvent.run_cancelled(
+            tenant_id=tenant_id,
+            reason="client_disconnected",
+            trace_id=trace_id,
+            **{k: v for k, v in evidence.items() if v is not None},
+        )
+        get_audit_writer().ingest_fire_and_forget(event)
+    except Exception:
+        pass
+
+
 @router.post("/stream")
+@stream_route
 async def finance_stream(
     request: FinanceStreamRequest,
     req: Request,
@@ -79,31 +132,58 @@ async def finance_stream(
     tenant_id: TenantId,
     last_event_id: str | None = Header(None, alias="Last-Event-ID"),
     x_user_id: str | None = Header(None, alias="X-User-ID"),
+    x_dwp_caller_type: str | None = Header(None, alias="X-DWP-Caller-Type"),
 ):
     """
     Finance 에이전트 SSE 스트리밍
     
     요청: {"prompt": "..."} 또는 {"message": "..."}, context 선택
     이벤트: start → thought → plan_step → tool_execution → hitl(필요시) → content → end → done
+    
+    HITL suspend 모드 (hitl_mode="suspend" 또는 HITL_RESUME_MODE=suspend):
+    interrupt 시 세션을 Redis에 저장하고 hitl → end(status=suspended)로 스트림 종료.
+    승인 후 {"thread_id": "...", "resume": true} + Last-Event-ID로 재접속하면 체크포인트에서 재개
+    (CHECKPOINTER_BACKEND=redis면 어느 워커에서든 재개 가능).
+    
+    재연결: 에이전트는 스트림 세션 로그(SSEEventLog)에 프레임을 기록하며 백그라운드로 실행.
+    동일 thread_id + Last-Event-ID로 재요청하면 에이전트 재실행 없이 누락 프레임 replay 후 실시간 구독.
     """
-    trace_id = str(uuid.uuid4())
-    ctx = request.context or {}
-    case_id = ctx.get("caseId") or ctx.get("case_id")
-    case_key = ctx.get("caseKey") or ctx.get("case_key")
     tenant_id_val = tenant_id or "default"
-    gateway_request_id = req.headers.get("X-Request-ID") or req.headers.get("X-Gateway-Request-ID")
+    # 재개 레코드 회수 전에 동시 스트림 슬롯 확보 (429 시 회수된 세션 유실 방지)
+    release_slot = acquire_stream_slot(tenant_id_val)
+    # 슬롯 반환은 응답(_SlotStreamingResponse)이 담당 → 응답 생성 전 예외/취소 시 여기서 반환
+    try:
+        hitl_manager = await get_hitl_manager()
+        suspend_mode = (request.hitl_mode or settings.hitl_resume_mode) == "suspend"
     
-    # Synapse Tool API 호출 시 사용할 컨텍스트 설정 (C-2: correlation 키 포함)
-    auth_header = req.headers.get("Authorization")
-    set_request_context(
-        tenant_id=tenant_id_val,
-        user_id=user.user_id,
-        auth_token=auth_header,
-        trace_id=trace_id,
-        gateway_request_id=gateway_request_id,
-        case_id=case_id,
-        case_key=case_key,
-    )
+        suspended: dict[str, Any] | None = None
+        resume_signal: dict[str, Any] | None = None
+        if request.resume:
+            suspended, resume_signal = await hitl_manager.take_suspended_session(
+                request.thread_id, user.user_id, tenant_id_val,
+            )
+    
+        trace_id = suspended["traceId"] if suspended else str(uuid.uuid4())
+        ctx = (suspended["context"] if suspended else request.context) or {}
+        case_id = ctx.get("caseId") or ctx.get("case_id")
+        case_key = ctx.get("caseKey") or ctx.get("case_key")
+        thread_id = request.thread_id or f"finance_{user.user_id}_{tenant_id_val}_{int(datetime.utcnow().timestamp())}"
+        gateway_request_id = req.headers.get("X-Request-ID") or req.headers.get("X-Gateway-Request-ID")
+    
+        # Synapse Tool API 호출 시 사용할 컨텍스트 설정 (C-2: correlation 키 포함)
+        auth_header = req.headers.get("Authorization")
+        set_request_context(
+            tenant_id=tenant_id_val,
+            user_id=user.user_id,
+            auth_token=auth_header,
+            trace_id=trace_id,
+            gateway_request_id=gateway_request_id,
+            case_id=case_id,
+            case_key=case_key,
+        )
+    except BaseException:
+        release_slot()
+        raise
     
     async def event_generator():
         # X-User-ID 헤더 검증 (JWT sub와 일치해야 함) — P0-1
@@ -120,13 +200,43 @@ async def finance_stream(
                 "timestamp": int(datetime.utcnow().timestamp()),
             }
             yield format_sse_event("error", error_data, "0")
-            yield "data: [DONE]\n\n"
+            yield DONE_FRAME
             return
 
+        if request.resume and suspended is None:
+            error_data = _enrich_event_data({
+                "type": "error",
+                "error": "재개할 HITL 세션이 없습니다 (만료, 이미 재개됨 또는 소유자 불일치)",
+                "errorType": "NotFoundError",
+                "threadId": request.thread_id,
+                "timestamp": int(datetime.utcnow().timestamp()),
+            }, trace_id, case_id, tenant_id_val, user.user_id)
+            yield format_sse_event("error", error_data, "0")
+            yield DONE_FRAME
+            return
+        
         event_queue: list[dict[str, Any]] = []
-        session_id = f"finance_{user.user_id}_{int(datetime.utcnow().timestamp())}"
+        session_id = (
+            suspended["sessionId"] if suspended
+            else f"finance_{user.user_id}_{int(datetime.utcnow().timestamp())}"
+        )
+        
+        event_id_counter = suspended.get("lastEventId", 0) if suspended else 0
+        if suspended and resume_signal is None:
+            # 아직 승인 신호 없음 → 세션 유지한 채 다시 종료
+            end_data = _enrich_event_data({
+                "type": "end",
+                "message": "HITL 승인 대기 중입니다",
+                "status": "suspended",
+                "requestId": suspended.get("requestId"),
+                "sessionId": session_id,
+                "threadId": request.thread_id,
+                "timestamp": int(datetime.utcnow().timestamp()),
+            }, trace_id, case_id, tenant_id_val, user.user_id)
+            yield format_sse_event("end", end_data, str(event_id_counter + 1))
+            yield DONE_FRAME
+            return
         
-        event_id_counter = 0
         if last_event_id:
             try:
                 last_id = int(last_event_id)
@@ -137,7 +247,12 @@ async def finance_stream(
         
         try:
             start_data = _enrich_event_data(
-                {"type": "start", "message": "Finance agent started", "timestamp": int(datetime.utcnow().timestamp())},
+                {
+                    "type": "start",
+                    "message": "Finance agent resumed" if suspended else "Finance agent started",
+                    "threadId": thread_id,
+                    "timestamp": int(datetime.utcnow().timestamp()),
+                },
                 trace_id, case_id, tenant_id_val, user.user_id,
             )
             event_id_counter += 1
@@ -145,7 +260,6 @@ async def finance_stream(
             
             agent = get_finance_agent()
             hook = create_finance_sse_hook(event_queue)
-            thread_id = request.thread_id or f"finance_{user.user_id}_{tenant_id_val}_{int(datetime.utcnow().timestamp())}"
             
             current_state: dict[str, Any] = {
                 "messages": [],
@@ -156,17 +270,25 @@ async def finance_stream(
             }
             
             resume_value: Any = None
+            if suspended:
+                resume_value = _signal_to_resume_value(
+                    resume_signal, suspended.get("requestId", ""), tenant_id_val, trace_id,
+                )
+                logger.info(f"Finance HITL resumed: {suspended.get('requestId')} -> {resume_value}")
             stream_done = False
-            hitl_manager = await get_hitl_manager()
             
-            prompt_val = (request.prompt or request.message or "").strip()
+            prompt_val = (
+                suspended.get("goal", "") if suspended
+                else (request.prompt or request.message or "")
+            ).strip()
+            goal_val = suspended.get("goal") if suspended else request.goal
             while not stream_done:
                 async for graph_event in agent.stream(
                     user_input=prompt_val,
                     user_id=user.user_id,
                     tenant_id=tenant_id_val,
-                    goal=request.goal or prompt_val,
-                    context=request.context or {},
+                    goal=goal_val or prompt_val,
+                    context=ctx,
                     thread_id=thread_id,
                     resume_value=resume_value,
                 ):
@@ -201,12 +323,45 @@ async def finance_stream(
                                     hitl_event.model_dump(),
                                     trace_id, case_id, tenant_id_val, user.user_id,
                                 )
+                                
+                                if suspend_mode:
+                                    # 승인 대기 없이 세션 저장 후 스트림 종료 (체크포인트는 interrupt 시점에 저장됨)
+                                    hitl_data["resumable"] = True
+                                    hitl_data["threadId"] = thread_id
+                                    hitl_data["sessionId"] = session_id
+                                    event_id_counter += 1
+                                    yield format_sse_event("hitl", hitl_data, str(event_id_counter))
+                                    await hitl_manager.save_suspended_session(thread_id, {
+                                        "sessionId": session_id,
+                                        "requestId": request_id,
+                                        "traceId": trace_id,
+                                        "userId": user.user_id,
+                                        "tenantId": tenant_id_val,
+                                        "goal": goal_val or prompt_val,
+                                        "context": ctx,
+                                        "lastEventId": event_id_counter + 1,
+                                    })
+                                    end_data = _enrich_event_data({
+                                        "type": "end",
+                                        "message": "HITL 승인 대기로 스트림을 종료합니다 (승인 후 resume 요청으로 재개)",
+                                        "status": "suspended",
+                                        "requestId": request_id,
+                                        "sessionId": session_id,
+                                        "threadId": thread_id,
+                                        "timestamp": int(datetime.utcnow().timestamp()),
+                                    }, trace_id, case_id, tenant_id_val, user.user_id)
+                                    event_id_counter += 1
+                                    yield format_sse_event("end", end_data, str(event_id_counter))
+                                    yield DONE_FRAME
+                                    return
+                                
                                 event_id_counter += 1
                                 yield format_sse_event("hitl", hitl_data, str(event_id_counter))
                                 
                                 signal = await hitl_manager.wait_for_approval_signal(
                                     session_id=session_id,
                                     timeout=settings.hitl_timeout_seconds,
+                                    request_id=request_id,
                                 )
                                 
                                 if signal is None:
@@ -237,24 +392,12 @@ async def finance_stream(
                                     }, trace_id, case_id, tenant_id_val, user.user_id)
                                     event_id_counter += 1
                                     yield format_sse_event("end", end_data, str(event_id_counter))
-                                    yield "data: [DONE]\n\n"
+                                    yield DONE_FRAME
                                     return
                                 
-                                if signal.get("type") == "rejection":
-                                    resume_value = {"approved": False}
-                                else:
-                                    resume_value = {"approved": signal.get("approved", True)}
-                                    try:
-                                        from core.audit import AgentAuditEvent
-                                        from core.audit.writer import get_audit_writer
-                                        event = AgentAuditEvent.action_approved(
-                                            tenant_id=tenant_id_val,
-                                            action_id=request_id,
-                                            trace_id=trace_id,
-                                        )
-                                        get_audit_writer().ingest_fire_and_forget(event)
-                                    except Exception:
-                                        pass
+                                resume_value = _signal_to_resume_value(
+                                    signal, request_id, tenant_id_val, trace_id,
+                                )
                                 logger.info(f"Finance HITL: {request_id} -> {resume_value}")
                                 break
                             stream_done = False
@@ -303,7 +446,6 @@ async def finance_stream(
                     )
                     event_id_counter += 1
                     yield format_sse_event(event_type, enriched, str(event_id_counter))
-                    await asyncio.sleep(STREAMING_EVENT_DELAY)
             
             end_data = _enrich_event_data({
                 "type": "end",
@@ -312,8 +454,13 @@ async def finance_stream(
             }, trace_id, case_id, tenant_id_val, user.user_id)
             event_id_counter += 1
             yield format_sse_event("end", end_data, str(event_id_counter))
-            yield "data: [DONE]\n\n"
+            yield DONE_FRAME
             
+        except asyncio.CancelledError:
+            # 클라이언트 연결 끊김 (재연결 유예 초과) → astream 및 진행 중 Tool/LLM 호출 취소
+            logger.info(f"Finance stream cancelled: thread={thread_id}, trace_id={trace_id}")
+            _audit_run_cancelled(tenant_id_val, trace_id, case_id=case_id, threadId=thread_id)
+            raise
         except Exception as e:
             logger.error(f"Finance streaming failed: {e}", exc_info=True)
             error_data = _enrich_event_data({
@@ -324,17 +471,24 @@ async def finance_stream(
             }, trace_id, case_id, tenant_id_val, user.user_id)
             event_id_counter += 1
             yield format_sse_event("error", error_data, str(event_id_counter))
-            yield "data: [DONE]\n\n"
+            yield DONE_FRAME
     
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    try:
+        event_log = get_sse_event_log()
+        log_key = f"finance:{tenant_id_val}:{user.user_id}:{thread_id}"
+        session = event_log.get(log_key) if last_event_id and not request.resume else None
+        if session is not None:
+            logger.info(f"Finance stream reattached: thread={thread_id}, last_event_id={last_event_id}")
+            frames = session.frames(last_event_id)
+            max_fps = sse_max_fps(replay=True)
+        else:
+            frames = event_log.start(log_key, event_generator()).frames()
+            max_fps = sse_max_fps(x_dwp_caller_type)
+    
+        return sse_response(frames, req, tenant_id_val, max_fps, release=release_slot)
+    except BaseException:
+        release_slot()
+        raise
 
 
 @router.post("/approve")
@@ -5,18 +5,21 @@ Case Trigger Routes
 조건 충족 시 Finance Agent 자동 분석 시작.
 """
 
-import asyncio
+import functools
 import logging
 import uuid
 from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from api.route_access import public_route
 from core.config import settings
 from core.context import set_request_context
 from core.memory.redis_store import get_redis_store
+from core.task_supervisor import POOL_FINANCE_TRIGGER, TaskPoolSaturatedError, get_task_supervisor
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +132,7 @@ async def _run_finance_agent_background(
 
 
 @router.post("/case-updated")
+@public_route
 async def case_updated_webhook(
     payload: CaseUpdatedPayload,
     x_trigger_secret: str | None = Header(None, alias="X-Trigger-Secret"),
@@ -152,27 +156,47 @@ async def case_updated_webhook(
     # 중복 트리거 방지 (P1: caseId+updated_at 기반)
     updated_at_val = payload.updated_at or payload.timestamp
     dedup_suffix = updated_at_val or str(int(datetime.utcnow().timestamp()))
+    dedup_key = f"trigger:case:{tenant_id}:{case_id}:{dedup_suffix}"
     try:
         store = await get_redis_store()
-        dedup_key = f"trigger:case:{tenant_id}:{case_id}:{dedup_suffix}"
-        if await store.client.get(dedup_key):
+        # SET NX EX 단일 명령 (동시 웹훅 간 read-then-write 경쟁 제거)
+        if not await store.set_if_absent(dedup_key, "1", TRIGGER_DEDUP_TTL):
             logger.info(f"Trigger dedup: {case_id} (updated_at={dedup_suffix}) already triggered, skip")
             return {"status": "skipped", "reason": "duplicate", "caseId": case_id}
-        await store.client.setex(dedup_key, TRIGGER_DEDUP_TTL, "1")
     except Exception as e:
         logger.warning(f"Trigger dedup check failed: {e}")
 
     if _should_auto_start(severity, status_val):
-        asyncio.create_task(
-            _run_finance_agent_background(
-                case_id=case_id,
-                case_key=payload.caseKey,
-                tenant_id=tenant_id,
-                trace_id=trace_id,
+        try:
+            submitted = get_task_supervisor().submit(
+                POOL_FINANCE_TRIGGER,
+                functools.partial(
+                    _run_finance_agent_background,
+                    case_id=case_id,
+                    case_key=payload.caseKey,
+                    tenant_id=tenant_id,
+                    trace_id=trace_id,
+                ),
+                # severity 높은 케이스 우선 실행 (대기열 적재 시)
+                priority=-SEVERITY_ORDER.get(severity.upper(), 0),
+                name=f"finance-trigger:{case_id}",
             )
+        except TaskPoolSaturatedError as e:
+            # 재전송 시 중복으로 스킵되지 않도록 dedup 키 해제
+            try:
+                await (await get_redis_store()).delete(dedup_key)
+            except Exception as redis_error:
+                logger.warning(f"Trigger dedup release failed: {redis_error}")
+            logger.warning(f"Trigger rejected: case={case_id} ({e})")
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"status": "rejected", "caseId": case_id, "reason": "saturated"},
+                headers={"Retry-After": "5"},
+            )
+        logger.info(
+            f"Trigger auto-start: case={case_id}, severity={severity}, status={status_val} ({submitted.status})"
         )
-        logger.info(f"Trigger auto-start: case={case_id}, severity={severity}, status={status_val}")
-        return {"status": "started", "caseId": case_id, "trace_id": trace_id}
+        return {"status": submitted.status, "caseId": case_id, "trace_id": trace_id}
     else:
         logger.info(f"Trigger waiting: case={case_id}, severity={severity}, status={status_val} (conditions not met)")
         return {"status": "waiting", "caseId": case_id, "reason": "conditions_not_met"}
@@ -0,0 +1,79 @@
+"""
+SSE Encoder
+
+모든 스트리밍 엔드포인트 공통 SSE 프레임 인코더 (이벤트당 hot path).
+- dict / pydantic 이벤트 모델을 재귀 변환·복사 없이 곧바로 UTF-8 bytes로 직렬화
+- orjson 설치 시 fast path (datetime → Unix timestamp(초)는 default 훅에서 처리), 없으면 json 폴백
+- 고정 조각(event 헤더, [DONE], connected/keepalive 주석) 사전 인코딩/캐시
+"""
+
+import json
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+
+from api.schemas.events import SSE_EVENT_PAYLOAD_VERSION
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - langsmith 설치 시 함께 설치됨
+    orjson = None
+
+DONE_FRAME = b"data: [DONE]\n\n"
+CONNECTED_COMMENT = b": connected\n\n"
+KEEPALIVE_COMMENT = b": keepalive\n\n"
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _default(obj: Any) -> Any:
+    """JSON 기본 미지원 타입 변환 (datetime → Unix timestamp, pydantic 모델 → dict)"""
+    if isinstance(obj, datetime):
+        return int(obj.timestamp())
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(value: Any) -> bytes:
+    """값 → compact JSON bytes (ensure_ascii=False와 동일한 UTF-8 출력)"""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        value, default=_default, ensure_ascii=False, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=256)
+def _event_header(event_type: str) -> bytes:
+    return f"event: {event_type}\ndata: ".encode("utf-8")
+
+
+def encode_sse(
+    event_type: str,
+    data: dict[str, Any] | BaseModel,
+    event_id: str | None = None,
+    versioned: bool = True,
+) -> bytes:
+    """
+    SSE 프레임 인코딩: [id: {event_id}\\n]event: {type}\\ndata: {json}\\n\\n
+
+    Args:
+        event_type: 이벤트 타입
+        data: 이벤트 데이터 (dict 또는 pydantic 이벤트 모델)
+        event_id: 이벤트 ID (재연결용, None이면 id 라인 생략)
+        versioned: dict 페이로드에 version 필드 보강 여부
+    """
+    if versioned and isinstance(data, dict) and "version" not in data:
+        data = {**data, "version": SSE_EVENT_PAYLOAD_VERSION}
+    parts = [_event_header(event_type), dumps_json(data), b"\n\n"]
+    if event_id is not None:
+        parts.insert(0, b"id: " + event_id.encode("utf-8") + b"\n")
+    return b"".join(parts)
@@ -1,11 +1,24 @@
 """
 SSE(Server-Sent Events) 공통 유틸
 
-라우트 간 중복을 줄이기 위한 헤더·포맷 헬퍼.
+라우트 간 중복을 줄이기 위한 헤더·포맷·페이싱 헬퍼와 공통 스트림 응답(sse_response).
+- keepalive 주석 전송 (프록시 유휴 연결 절단 방지)
+- request.is_disconnected() 감지 시 상류 작업(LLM 호출, 큐 대기) 취소
+- 테넌트별 동시 스트림 수 상한 (초과 시 429)
 """
 
-import json
-from typing import Any
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from api.sse_encoder import KEEPALIVE_COMMENT, encode_sse
+from core.config import settings
+
+logger = logging.getLogger(__name__)
 
 # 스트리밍 응답에 공통으로 사용하는 헤더 (BE 중계·nginx 버퍼링 비활성화)
 # 스펙: docs/aura/docs/streaming/AURA_SSE_SPEC.md
@@ -17,9 +30,262 @@ SSE_HEADERS = {
 }
 
 
-def format_sse_line(event_type: str, payload: dict[str, Any]) -> str:
+def format_sse_line(event_type: str, payload: dict[str, Any]) -> bytes:
     """
-    SSE 한 줄 형식: event + data (ensure_ascii=False).
+    SSE 한 줄 형식: event + data (id/version 없음).
     analysis-runs, cases run stream 등 공통 포맷용.
     """
-    return f"event: {event_type}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    return encode_sse(event_type, payload, versioned=False)
+
+
+def sse_max_fps(caller_type: str | None = None, replay: bool = False) -> float | None:
+    """
+    스트림 페이싱 프레임 레이트 결정
+
+    replay 또는 서버 간 호출(X-DWP-Caller-Type이 sse_unpaced_caller_types에 포함)은 페이싱 없음(None).
+    """
+    if replay or settings.sse_max_fps <= 0:
+        return None
+    if caller_type and caller_type.upper() in {t.upper() for t in settings.sse_unpaced_caller_types}:
+        return None
+    return settings.sse_max_fps
+
+
+def _join_frames(frames: list[str | bytes]) -> str | bytes:
+    """병합 청크 생성 (bytes 프레임이 섞이면 bytes로 통일)"""
+    if len(frames) == 1:
+        return frames[0]
+    if all(isinstance(f, str) for f in frames):
+        return "".join(frames)
+    return b"".join(f.encode("utf-8") if isinstance(f, str) else f for f in frames)
+
+
+async def pump_sse(
+    frames: AsyncIterator[str | bytes],
+    max_fps: float | None = None,
+    request: Request | None = None,
+    heartbeat_interval: float | None = None,
+) -> AsyncIterator[str | bytes]:
+    """
+    SSE 프레임 펌프: 적응형 페이싱 + keepalive + 연결 끊김 감지를 한 루프에서 처리
+
+    상류 __anext__는 항상 하나의 Task로만 대기하므로 프레임당 Task/wait는 1회입니다.
+
+    페이싱 (max_fps, 고정 이벤트 간 sleep 대체):
+    - 직전 전송 후 1/max_fps 이상 지났으면(유휴) 즉시 전송
+    - 그 안에 도착한 연속 이벤트(burst)는 모아서 다음 슬롯에 하나의 청크로 전송
+    - max_fps가 None/0이면 페이싱 없음 (replay, 서버 간 호출)
+
+    heartbeat (heartbeat_interval):
+    - interval 동안 전송한 프레임이 없으면 `: keepalive` 전송
+    - interval마다 request.is_disconnected() 확인, 끊겼으면 상류 생성기를 닫아 진행 중 작업 취소
+    - heartbeat_interval이 None이면 keepalive/끊김 감지 없음
+
+    둘 다 없으면 Task 없이 그대로 통과합니다.
+    """
+    source = frames.__aiter__()
+    paced = bool(max_fps and max_fps > 0)
+    if not paced and heartbeat_interval is None:
+        try:
+            async for frame in source:
+                yield frame
+        finally:
+            await _close_source(source, None)
+        return
+
+    pace_interval = 1.0 / max_fps if paced else 0.0
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Future | None = None
+    buffer: list[str | bytes] = []
+    last_sent = float("-inf")  # 마지막 프레임 전송 (페이싱 기준)
+    last_output = last_check = loop.time()  # 마지막 출력(프레임/keepalive), 마지막 끊김 확인
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(source.__anext__())
+            deadline = None
+            if heartbeat_interval is not None:
+                deadline = min(last_output, last_check) + heartbeat_interval
+            if buffer:
+                flush_at = last_sent + pace_interval
+                deadline = flush_at if deadline is None else min(deadline, flush_at)
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+            now = loop.time()
+            if heartbeat_interval is not None and now - last_check >= heartbeat_interval:
+                last_check = now
+                if request is not None and await request.is_disconnected():
+                    logger.info(f"SSE client disconnected, cancelling stream: {request.url.path}")
+                    return
+            if not done:
+                if buffer and now - last_sent >= pace_interval:
+                    yield _join_frames(buffer)
+                    buffer.clear()
+                    last_sent = last_output = now
+                elif heartbeat_interval is not None and now - last_output >= heartbeat_interval:
+                    yield KEEPALIVE_COMMENT
+                    last_output = now
+                continue
+
+            future, pending = pending, None
+            try:
+                buffer.append(future.result())
+            except StopAsyncIteration:
+                break
+            if now - last_sent >= pace_interval:
+                yield _join_frames(buffer)
+                buffer.clear()
+                last_sent = last_output = loop.time()
+        if buffer:
+            yield _join_frames(buffer)
+    finally:
+        await _close_source(source, pending)
+
+
+def pace_sse(
+    frames: AsyncIterator[str | bytes],
+    max_fps: float | None = None,
+) -> AsyncIterator[str | bytes]:
+    """SSE 프레임 적응형 페이싱만 적용 (pump_sse 참고)"""
+    return pump_sse(frames, max_fps)
+
+
+def with_heartbeat(
+    frames: AsyncIterator[str | bytes],
+    request: Request | None = None,
+    interval: float | None = None,
+) -> AsyncIterator[str | bytes]:
+    """keepalive 주석 삽입 + 클라이언트 연결 끊김 감지만 적용 (pump_sse 참고)"""
+    return pump_sse(frames, None, request, interval or settings.sse_heartbeat_interval)
+
+
+async def _close_source(source: AsyncIterator, pending: asyncio.Future | None) -> None:
+    """진행 중인 __anext__ 취소 후 상류 생성기 종료 (상류 await 지점에 CancelledError 전파)"""
+    if pending is not None and not pending.done():
+        pending.cancel()
+        try:
+            await pending
+        except (asyncio.CancelledError, StopAsyncIteration, Exception):
+            pass
+    aclose = getattr(source, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+class StreamSlots:
+    """
+    테넌트별 동시 SSE 스트림 수 제한
+
+    Args:
+        max_per_tenant: 테넌트당 최대 동시 스트림 수 (0이면 무제한)
+    """
+
+    def __init__(self, max_per_tenant: int) -> None:
+        self.max_per_tenant = max_per_tenant
+        self._active: dict[str, int] = {}
+
+    def acquire(self, tenant_id: str) -> bool:
+        """슬롯 획득 (상한 초과 시 False)"""
+        current = self._active.get(tenant_id, 0)
+        if self.max_per_tenant and current >= self.max_per_tenant:
+            return False
+        self._active[tenant_id] = current + 1
+        return True
+
+    def release(self, tenant_id: str) -> None:
+        """슬롯 반환"""
+        current = self._active.get(tenant_id, 0) - 1
+        if current > 0:
+            self._active[tenant_id] = current
+        else:
+            self._active.pop(tenant_id, None)
+
+    def active(self, tenant_id: str) -> int:
+        """테넌트의 현재 스트림 수"""
+        return self._active.get(tenant_id, 0)
+
+
+_stream_slots: StreamSlots | None = None
+
+
+def get_stream_slots() -> StreamSlots:
+    """StreamSlots 싱글톤 (sse_max_streams_per_tenant)"""
+    global _stream_slots
+    if _stream_slots is None:
+        _stream_slots = StreamSlots(settings.sse_max_streams_per_tenant)
+    return _stream_slots
+
+
+class _SlotStreamingResponse(StreamingResponse):
+    """응답 종료(정상/끊김/예외) 시 스트림 슬롯 반환"""
+
+    def __init__(self, content: AsyncIterator[str | bytes], release: Callable[[], None], **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self._release = release
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._release()
+
+
+def acquire_stream_slot(tenant_id: str | None) -> Callable[[], None]:
+    """
+    테넌트 스트림 슬롯 획득 (스트림 시작 전 부수 작업이 있는 라우트에서 먼저 호출)
+
+    Returns:
+        슬롯 반환 함수 (중복 호출 안전)
+
+    Raises:
+        HTTPException: 429 (테넌트 동시 스트림 수 초과)
+    """
+    tenant = tenant_id or "default"
+    slots = get_stream_slots()
+    if not slots.acquire(tenant):
+        logger.warning(f"SSE stream limit exceeded: tenant={tenant}, active={slots.active(tenant)}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Too many concurrent streams for tenant (max {slots.max_per_tenant})",
+            headers={"Retry-After": "5"},
+        )
+    released = False
+
+    def release() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            slots.release(tenant)
+
+    return release
+
+
+def sse_response(
+    frames: AsyncIterator[str | bytes],
+    request: Request | None = None,
+    tenant_id: str | None = None,
+    max_fps: float | None = None,
+    release: Callable[[], None] | None = None,
+) -> StreamingResponse:
+    """
+    공통 SSE 응답: 페이싱 + keepalive/끊김 감지(단일 펌프) → 테넌트 동시 스트림 상한
+
+    Args:
+        frames: SSE 프레임 생성기
+        request: 연결 끊김 감지용 요청 (None이면 전송 실패 시에만 감지)
+        tenant_id: 동시 스트림 상한 대상 테넌트
+        max_fps: 페이싱 프레임 레이트 (sse_max_fps 결과)
+        release: acquire_stream_slot으로 미리 획득한 슬롯 반환 함수 (None이면 여기서 획득)
+
+    Raises:
+        HTTPException: 429 (테넌트 동시 스트림 수 초과)
+    """
+    if release is None:
+        release = acquire_stream_slot(tenant_id)
+    return _SlotStreamingResponse(
+        pump_sse(frames, max_fps, request, settings.sse_heartbeat_interval),
+        release=release,
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
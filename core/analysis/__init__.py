@@ -8,6 +8,7 @@ Analysis Module (Phase2 / Phase3)
 - proposal_utils: 스코어·fingerprint (Phase2/Phase3 공통)
 - phase2_pipeline / phase3_pipeline: 파이프라인 오케스트레이션
 - run_store: runId별 이벤트 큐 (스트림 소비)
+- worker_pool: 파이프라인 워커 프로세스 실행 모드 (선택)
 """
 
 from core.analysis.phase2_events import (
@@ -19,6 +19,7 @@ from core.analysis.phase3_events import (
 from core.analysis.rag import chunk_artifacts, retrieve_rag
 from core.analysis.proposal_utils import score_from_evidence, proposal_fingerprint
 from core.llm import get_llm_client
+from core.llm.prompts import PHASE3_DEFAULT_PROMPT_VERSION, render_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +77,9 @@ async def run_phase3_analysis(
     opts = options or {}
     top_k = int(opts.get("ragTopK", 5))
     temperature = float(opts.get("temperature", 0.2))
-    prompt_version = str(opts.get("promptVersion", "phase3-mvp-v1"))
+    prompt_version = str(opts.get("promptVersion", PHASE3_DEFAULT_PROMPT_VERSION))
+    # 미등록 promptVersion은 기본 템플릿으로 폴백 (실제 사용 버전은 meta.promptTemplateVersion)
+    prompt_template_version = PHASE3_DEFAULT_PROMPT_VERSION
     aura_trace_id = f"aura-{run_id[:8]}-{uuid.uuid4().hex[:8]}"
 
     try:
@@ -101,9 +104,14 @@ async def run_phase3_analysis(
             raise RuntimeError("Simulated LLM failure (X-Aura-Test-Fail: llm)")
         try:
             llm = get_llm_client()
-            prompt = (
-                f"케이스 {case_id} 분석. 스코어 {score:.2f}, 심각도 {severity}. "
-                "한국어로 2~3문장 reasonText 작성."
+            prompt, prompt_template_version = render_prompt(
+                "phase3_reason",
+                prompt_version,
+                case_id=case_id,
+                score=f"{score:.2f}",
+                severity=severity,
+                evidence_count=len(evidence),
+                rag_count=len(rag_refs),
             )
             resp = await llm.ainvoke(prompt)
             if resp:
@@ -166,6 +174,7 @@ async def run_phase3_analysis(
             "trace": {"auraTraceId": aura_trace_id, "policyVersion": prompt_version},
             "meta": {
                 "promptVersion": prompt_version,
+                "promptTemplateVersion": prompt_template_version,
                 "model": "gpt-4.x",
                 "temperature": temperature,
             },
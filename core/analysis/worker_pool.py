@@ -0,0 +1,361 @@
+"""
+Analysis Worker Pool
+
+Phase2/Phase3 분석 파이프라인을 워커 프로세스에서 실행하는 선택적 모드입니다.
+- analysis_worker_processes > 0 이면 spawn 워커 프로세스 풀에서 파이프라인 실행 (0이면 기존과 같이 in-process)
+- 워커는 자체 이벤트 루프에서 파이프라인을 실행하고 (event_type, payload)를 워커 전용 이벤트 파이프로 전송
+- API 프로세스는 수신 스레드에서 이벤트를 받아 작업별 asyncio.Queue로 전달 → 기존 run_store/콜백 흐름 그대로 사용
+- 요청 컨텍스트(tenant/auth/trace)는 작업과 함께 전달되어 워커에서 복원
+- 작업은 진행 중 작업이 가장 적은 워커에 할당, 소비자 중단(SSE 연결 끊김) 시 워커 작업도 취소
+- 워커 프로세스 종료 감지 시 할당된 작업은 failed 처리 후 워커 재기동
+
+API 프로세스는 I/O와 SSE 스트리밍만 담당하므로 분석의 CPU 작업(직렬화, 청킹, 스코어링)이 스트림 지연을 만들지 않습니다.
+
+사용 예:
+    async for event_type, payload in iter_analysis(ANALYSIS_PHASE2, case_id=case_id, run_id=run_id):
+        put_event(run_id, event_type, payload)
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import multiprocessing.connection as mp_connection
+import pickle
+import signal
+import threading
+import time
+import uuid
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable
+
+from core.config import settings
+from core.context import get_request_context, set_request_context
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_PHASE2 = "phase2"
+ANALYSIS_PHASE3 = "phase3"
+
+# 분석 종류 → 파이프라인 ("module:function", 워커에서 import)
+ANALYSIS_PIPELINES: dict[str, str] = {
+    ANALYSIS_PHASE2: "core.analysis.phase2_pipeline:run_phase2_analysis",
+    ANALYSIS_PHASE3: "core.analysis.phase3_pipeline:run_phase3_analysis",
+}
+
+_TERMINAL_EVENTS = ("completed", "failed")
+
+# 워커 프로세스 생존 확인 주기 (초)
+WORKER_CHECK_INTERVAL = 1.0
+
+
+def _load_pipeline(path: str) -> Callable[..., AsyncIterator[tuple[str, dict[str, Any]]]]:
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _export_state(kind: str, kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """워커 프로세스 메모리에만 남는 파이프라인 부수 상태 추출 (종료 이벤트 직전 API 프로세스로 전송)"""
+    if kind == ANALYSIS_PHASE2:
+        from core.streaming.case_stream_store import get_phase2_result
+
+        case_id = kwargs.get("case_id")
+        result = get_phase2_result(case_id) if case_id else None
+        if result is not None:
+            return {"phase2Result": (case_id, result)}
+    return None
+
+
+def _apply_state(state: dict[str, Any]) -> None:
+    """워커에서 받은 부수 상태를 API 프로세스에 반영"""
+    if "phase2Result" in state:
+        from core.streaming.case_stream_store import set_phase2_result
+
+        case_id, result = state["phase2Result"]
+        set_phase2_result(case_id, result)
+
+
+# ==================== Worker Process ====================
+
+
+def _worker_main(inbox: Any, events: Any) -> None:
+    """워커 프로세스 진입점 (events: 워커 전용 이벤트 파이프 송신 측, 종료는 부모가 보내는 None 센티널로 처리)"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(_worker_loop(inbox, events))
+
+
+async def _worker_loop(inbox: Any, events: Any) -> None:
+    """inbox 메시지 처리: ("job", pickled) → 작업 시작, ("cancel", job_id) → 작업 취소"""
+    tasks: dict[str, asyncio.Task] = {}
+    while True:
+        message = await asyncio.to_thread(inbox.get)
+        if message is None:
+            break
+        command, data = message
+        if command == "cancel":
+            task = tasks.get(data)
+            if task is not None:
+                task.cancel()
+            continue
+        job_id, kind, pipeline_path, kwargs, context = pickle.loads(data)
+        task = asyncio.create_task(_run_job(events, job_id, kind, pipeline_path, kwargs, context))
+        tasks[job_id] = task
+        task.add_done_callback(lambda _, job_id=job_id: tasks.pop(job_id, None))
+    if tasks:
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+
+async def _run_job(
+    events: Any,
+    job_id: str,
+    kind: str,
+    pipeline_path: str,
+    kwargs: dict[str, Any],
+    context: dict[str, Any],
+) -> None:
+    if context:
+        set_request_context(**context)
+    try:
+        # aclosing: 취소 시 파이프라인 생성기도 즉시 종료 (in-process 실행과 동일)
+        async with aclosing(_load_pipeline(pipeline_path)(**kwargs)) as pipeline_events:
+            async for event_type, payload in pipeline_events:
+                if event_type in _TERMINAL_EVENTS:
+                    state = _export_state(kind, kwargs)
+                    if state:
+                        events.send(("state", job_id, state))
+                events.send(("event", job_id, (event_type, payload)))
+    except asyncio.CancelledError:
+        logger.info(f"Analysis worker job {job_id} ({kind}) cancelled")
+    except Exception as e:
+        logger.exception(f"Analysis worker job {job_id} ({kind}) failed")
+        events.send(("event", job_id, ("failed", {"error": str(e), "stage": "worker"})))
+    finally:
+        events.send(("done", job_id, None))
+
+
+# ==================== API Process ====================
+
+
+class _Worker:
+    """
+    워커 프로세스 + 전용 inbox + 전용 이벤트 파이프 + 할당된 작업
+
+    이벤트 채널을 워커별 파이프로 분리하여, 워커가 쓰기 도중 비정상 종료되어도
+    다른 워커의 이벤트 전달이 막히지 않습니다. (공유 Queue의 lock 고착 방지)
+    """
+
+    def __init__(self, mp: Any) -> None:
+        self.inbox = mp.Queue()
+        self.events, child_events = mp.Pipe(duplex=False)
+        self.jobs: set[str] = set()
+        self.eof = False  # 이벤트 파이프 EOF 수신 (워커 종료 후 남은 이벤트까지 모두 수신됨)
+        self.process = mp.Process(
+            target=_worker_main,
+            args=(self.inbox, child_events),
+            name="aura-analysis-worker",
+            daemon=True,
+        )
+        self.process.start()
+        # 부모의 송신 측을 닫아야 워커 종료 시 EOF 수신
+        child_events.close()
+
+    def close(self) -> None:
+        self.inbox.close()
+        self.events.close()
+
+
+class AnalysisWorkerPool:
+    """
+    분석 워커 프로세스 풀 (작업은 진행 중 작업이 가장 적은 워커에 할당)
+
+    Args:
+        processes: 워커 프로세스 수
+        job_timeout: 작업 이벤트 수신 대기 상한 (초, 초과 시 failed 이벤트로 종료)
+    """
+
+    def __init__(self, processes: int, job_timeout: float) -> None:
+        self.processes = max(1, processes)
+        self.job_timeout = job_timeout
+        self._mp = multiprocessing.get_context("spawn")
+        self._wake_recv, self._wake_send = self._mp.Pipe(duplex=False)
+        self._workers: list[_Worker] = []
+        self._streams: dict[str, asyncio.Queue] = {}
+        self._job_workers: dict[str, _Worker] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reader: threading.Thread | None = None
+        self._closed = False
+
+    def start(self) -> None:
+        """워커 프로세스와 이벤트 수신 스레드 시작 (이벤트 루프 안에서 호출)"""
+        self._loop = asyncio.get_running_loop()
+        self._workers = [_Worker(self._mp) for _ in range(self.processes)]
+        self._reader = threading.Thread(target=self._read_events, name="analysis-worker-events", daemon=True)
+        self._reader.start()
+        logger.info(f"Analysis worker pool started (processes={self.processes})")
+
+    def _read_events(self) -> None:
+        """
+        수신 스레드: 워커별 이벤트 파이프 → 이벤트 루프로 전달 (unpickle은 이 스레드에서 수행)
+
+        파이프 EOF(워커 종료)는 즉시, 그 외 생존 확인은 이벤트 유입과 무관하게
+        WORKER_CHECK_INTERVAL마다 이벤트 루프의 _check_workers로 넘깁니다.
+        """
+        last_check = time.monotonic()
+        while True:
+            workers = {w.events: w for w in list(self._workers) if not w.eof}
+            ready = mp_connection.wait([self._wake_recv, *workers], timeout=WORKER_CHECK_INTERVAL)
+            if self._wake_recv in ready:
+                return
+            exited = False
+            for conn in ready:
+                worker = workers[conn]
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    worker.eof = True
+                    exited = True
+                    continue
+                self._loop.call_soon_threadsafe(self._dispatch, message)
+            now = time.monotonic()
+            if exited or now - last_check >= WORKER_CHECK_INTERVAL:
+                last_check = now
+                self._loop.call_soon_threadsafe(self._check_workers)
+
+    def _dispatch(self, message: tuple[str, str, Any]) -> None:
+        kind, job_id, data = message
+        if kind == "state":
+            _apply_state(data)
+            return
+        stream = self._streams.get(job_id)
+        if kind == "done":
+            worker = self._job_workers.pop(job_id, None)
+            if worker is not None:
+                worker.jobs.discard(job_id)
+            if stream is not None:
+                stream.put_nowait(None)
+        elif stream is not None:
+            stream.put_nowait(data)
+
+    def _check_workers(self) -> None:
+        """종료된 워커 감지 → 할당된 작업 failed 처리 후 같은 자리에 워커 재기동"""
+        if self._closed:
+            return
+        for i, worker in enumerate(self._workers):
+            if worker.process.is_alive():
+                continue
+            if not worker.eof:
+                # 종료 전 전송된 이벤트(completed 등)를 모두 수신한 뒤 처리 (EOF 수신 시 재확인)
+                continue
+            logger.error(
+                f"Analysis worker {worker.process.pid} exited (code={worker.process.exitcode}), restarting"
+            )
+            for job_id in list(worker.jobs):
+                self._dispatch(("event", job_id, ("failed", {"error": "analysis worker exited", "stage": "worker"})))
+                self._dispatch(("done", job_id, None))
+            worker.close()
+            self._workers[i] = _Worker(self._mp)
+
+    async def run(self, kind: str, **kwargs: Any) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        워커에서 파이프라인 실행 후 (event_type, payload) 스트림 반환
+
+        현재 요청 컨텍스트를 함께 전달합니다. 소비자가 종료 이벤트 전에 중단하면 워커 작업도 취소합니다.
+        """
+        if self._closed:
+            raise RuntimeError("Analysis worker pool is shut down")
+        job_id = uuid.uuid4().hex
+        # 직렬화 실패를 호출자에게 바로 알리기 위해 미리 pickle (mp.Queue feeder 스레드 예외는 전파되지 않음)
+        raw = pickle.dumps((job_id, kind, ANALYSIS_PIPELINES[kind], kwargs, get_request_context()))
+        alive = [w for w in self._workers if w.process.is_alive()]
+        if not alive:
+            # 모든 워커 종료 → 즉시 재기동 후 할당
+            self._check_workers()
+            alive = self._workers
+        worker = min(alive, key=lambda w: len(w.jobs))
+        stream: asyncio.Queue = asyncio.Queue()
+        self._streams[job_id] = stream
+        self._job_workers[job_id] = worker
+        worker.jobs.add(job_id)
+        worker.inbox.put(("job", raw))
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(stream.get(), self.job_timeout)
+                except asyncio.TimeoutError:
+                    logger.error(f"Analysis worker job {job_id} ({kind}) timed out after {self.job_timeout:g}s")
+                    yield ("failed", {"error": "analysis worker timeout", "stage": "worker"})
+                    return
+                if item is None:
+                    return
+                yield item
+        finally:
+            self._streams.pop(job_id, None)
+            if job_id in self._job_workers and not self._closed:
+                worker.inbox.put(("cancel", job_id))
+
+    async def shutdown(self, timeout: float = 10.0) -> None:
+        """워커에 종료 센티널 전송 → 진행 중 작업 완료 대기, 타임아웃 초과 시 강제 종료"""
+        self._closed = True
+        for worker in self._workers:
+            worker.inbox.put(None)
+        await asyncio.to_thread(self._join_workers, timeout)
+        self._wake_send.send(None)
+        if self._reader is not None:
+            await asyncio.to_thread(self._reader.join, timeout)
+        for worker in self._workers:
+            worker.close()
+        self._wake_send.close()
+        self._wake_recv.close()
+        logger.info("Analysis worker pool stopped")
+
+    def _join_workers(self, timeout: float) -> None:
+        for worker in self._workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                logger.warning(f"Analysis worker {worker.process.pid} did not stop in {timeout:g}s, terminating")
+                worker.process.terminate()
+                worker.process.join()
+
+
+def iter_analysis(kind: str, **kwargs: Any) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """
+    분석 파이프라인 실행 (워커 모드면 워커 프로세스, 아니면 in-process)
+
+    Yields:
+        (event_type, payload) - 파이프라인 이벤트 그대로
+    """
+    pool = get_analysis_worker_pool()
+    if pool is None:
+        return _load_pipeline(ANALYSIS_PIPELINES[kind])(**kwargs)
+    return pool.run(kind, **kwargs)
+
+
+# 전역 AnalysisWorkerPool 인스턴스
+_analysis_worker_pool: AnalysisWorkerPool | None = None
+
+
+def get_analysis_worker_pool() -> AnalysisWorkerPool | None:
+    """AnalysisWorkerPool 인스턴스 반환 (analysis_worker_processes=0이면 None, 최초 호출 시 시작)"""
+    global _analysis_worker_pool
+    if settings.analysis_worker_processes <= 0:
+        return None
+    if _analysis_worker_pool is None:
+        pool = AnalysisWorkerPool(
+            settings.analysis_worker_processes,
+            settings.analysis_worker_job_timeout_seconds,
+        )
+        pool.start()
+        _analysis_worker_pool = pool
+    return _analysis_worker_pool
+
+
+async def cleanup_analysis_workers() -> None:
+    """워커 프로세스 종료 (앱 종료 시 호출, 백그라운드 작업 drain 이후)"""
+    global _analysis_worker_pool
+    if _analysis_worker_pool is not None:
+        await _analysis_worker_pool.shutdown()
+        _analysis_worker_pool = None
@@ -50,6 +50,8 @@ class AuditEventType(str, Enum):
     CASE_ASSIGNED = "CASE/CASE_ASSIGNED"
     # ACTION 확장
     ACTION_FAILED = "ACTION/ACTION_FAILED"
+    # 실행 취소 (SSE 클라이언트 연결 끊김 등)
+    RUN_CANCELLED = "AGENT/RUN_CANCELLED"
 
 
 class AuditEvent(BaseModel):
@@ -339,6 +341,28 @@ class AgentAuditEvent:
             trace_id=trace_id,
         )
 
+    @staticmethod
+    def run_cancelled(
+        tenant_id: str,
+        reason: str,
+        actor_agent_id: str = "finance_agent",
+        trace_id: str | None = None,
+        **evidence: Any,
+    ) -> AuditEvent:
+        """에이전트/분석 실행 취소 시 (클라이언트 연결 끊김으로 진행 중 LLM/Tool 호출 중단)"""
+        message = evidence.pop("message", None) or f"Run cancelled: {reason}"
+        return AuditEvent(
+            tenant_id=tenant_id,
+            actor_type="AGENT",
+            actor_agent_id=actor_agent_id,
+            event_category="AGENT",
+            event_type=AuditEventType.RUN_CANCELLED.value,
+            outcome="NOOP",
+            severity="WARN",
+            evidence_json={"reason": reason, "message": message, **evidence},
+            trace_id=trace_id,
+        )
+
     @staticmethod
     def action_rolled_back(
         tenant_id: str,
@@ -51,6 +51,21 @@ class Settings(BaseSettings):
         gt=0,
         description="LLM 응답의 최대 토큰 수",
     )
+    llm_context_max_tokens: int = Field(
+        default=12000,
+        gt=0,
+        description="에이전트 LLM 호출 입력 토큰 예산 (시스템 프롬프트 포함, 초과 시 오래된 턴 축약/제거)",
+    )
+    llm_tool_output_max_chars: int = Field(
+        default=2000,
+        gt=0,
+        description="오래된 도구 출력(ToolMessage) 축약 시 최대 문자 수",
+    )
+    llm_context_keep_recent_tool_outputs: int = Field(
+        default=2,
+        ge=0,
+        description="축약하지 않고 원문 유지할 최근 도구 출력 개수",
+    )
     # Azure OpenAI (설정 시 우선 사용)
     azure_openai_endpoint: str | None = Field(
         default=None,
@@ -139,7 +154,45 @@ class Settings(BaseSettings):
         gt=0,
         description="LangGraph Checkpoint TTL (초, 기본: 7일)"
     )
-    
+    redis_codec_format: str = Field(
+        default="json",
+        description="Redis 저장 값 포맷: json(compact JSON) | msgpack (기존 JSON 값은 포맷과 무관하게 읽음)"
+    )
+    redis_compress_threshold: int = Field(
+        default=1024,
+        ge=0,
+        description="Redis 저장 값 zlib 압축 임계값 (바이트, 0이면 압축 안 함)"
+    )
+    checkpointer_backend: str = Field(
+        default="memory",
+        description="에이전트 Checkpointer 백엔드: memory(프로세스 내, BoundedMemorySaver) | redis(워커 간 HITL resume 공유)"
+    )
+    checkpointer_max_threads: int = Field(
+        default=1000,
+        gt=0,
+        description="인메모리 Checkpointer 최대 보관 스레드 수 (초과 시 LRU 제거)"
+    )
+    checkpointer_thread_ttl: int = Field(
+        default=3600,
+        gt=0,
+        description="인메모리 Checkpointer 스레드 유휴 TTL (초, 기본: 1시간)"
+    )
+    checkpointer_interrupted_ttl: int = Field(
+        default=86400,
+        gt=0,
+        description="인메모리 Checkpointer HITL 승인 대기(interrupt) 스레드 유휴 TTL (초, 기본: 24시간)"
+    )
+    checkpointer_keep_checkpoints: int = Field(
+        default=2,
+        ge=1,
+        description="스레드/네임스페이스별 보관할 최근 체크포인트 수 (중간 체크포인트 정리)"
+    )
+    checkpointer_max_bytes: int = Field(
+        default=268435456,
+        gt=0,
+        description="인메모리 Checkpointer 직렬화 데이터 최대 용량 (바이트, 기본: 256MB)"
+    )
+
     # ==================== Security Configuration ====================
     # SECRET_KEY 또는 JWT_SECRET 환경 변수 지원 (dwp_backend 호환성)
     secret_key: str | None = Field(
@@ -203,6 +256,20 @@ class Settings(BaseSettings):
         default=True,
         description="JWT 인증 필수 여부 (개발 시 false 가능)"
     )
+    jwt_verify_cache_enabled: bool = Field(
+        default=True,
+        description="검증된 JWT 캐시 사용 여부 (토큰 해시 키, exp 시각에 만료)",
+    )
+    jwt_verify_cache_size: int = Field(
+        default=10000,
+        gt=0,
+        description="검증된 JWT 캐시 최대 항목 수 (LRU)",
+    )
+    jwt_verify_cache_max_age_seconds: int = Field(
+        default=300,
+        gt=0,
+        description="exp 클레임이 없는 토큰의 캐시 유지 시간 (초)",
+    )
     
     # ==================== Logging Configuration ====================
     log_level: str = Field(
@@ -248,6 +315,54 @@ class Settings(BaseSettings):
         gt=0,
         description="HITL 승인 대기 타임아웃 (초, 기본 5분)",
     )
+    hitl_signal_poll_interval: float = Field(
+        default=10.0,
+        gt=0,
+        description="HITL 승인 대기 중 hitl:signal 키 폴백 조회 주기 (초, Pub/Sub 메시지 유실 대비)",
+    )
+    hitl_resume_mode: str = Field(
+        default="block",
+        description="HITL interrupt 처리: block(스트림 유지하며 승인 대기) | suspend(세션 저장 후 스트림 종료, resume 요청으로 재개)",
+    )
+    hitl_suspend_ttl_seconds: int = Field(
+        default=1800,
+        gt=0,
+        description="suspend된 HITL 세션/승인 신호 보관 시간 (초, 기본 30분)",
+    )
+    sse_event_log_max_events: int = Field(
+        default=1000,
+        gt=0,
+        description="에이전트 스트림 세션당 보관 SSE 프레임 수 (Last-Event-ID replay용)",
+    )
+    sse_event_log_ttl_seconds: int = Field(
+        default=300,
+        gt=0,
+        description="완료된 스트림 세션 로그 보관 시간 (초, 재연결 유예)",
+    )
+    sse_max_fps: float = Field(
+        default=20.0,
+        ge=0,
+        description="SSE 프레임 최대 전송 빈도 (초당, burst는 한 청크로 병합, 0이면 페이싱 없음)",
+    )
+    sse_unpaced_caller_types: list[str] = Field(
+        default=["AGENT"],
+        description="페이싱 없이 즉시 전송할 X-DWP-Caller-Type 값 (서버 간 호출)",
+    )
+    sse_heartbeat_interval: float = Field(
+        default=15.0,
+        gt=0,
+        description="SSE 유휴 시 keepalive 주석 전송 및 클라이언트 연결 끊김 확인 주기 (초)",
+    )
+    sse_disconnect_grace_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="구독자 없는 에이전트 스트림 세션 취소 유예 (초, 이 시간 내 재연결 없으면 실행 취소)",
+    )
+    sse_max_streams_per_tenant: int = Field(
+        default=50,
+        ge=0,
+        description="테넌트당 최대 동시 SSE 스트림 수 (초과 시 429, 0이면 무제한)",
+    )
     audit_events_enabled: bool = Field(
         default=True,
         description="Audit 이벤트 발행 활성화 (Synapse audit_event_log 연동)",
@@ -264,6 +379,16 @@ class Settings(BaseSettings):
         default=None,
         description="Audit API URL (audit_delivery_mode=http 시, 미지정 시 synapse_base_url + /api/synapse/audit/events/ingest)",
     )
+    agent_tool_max_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="에이전트 도구 실행기: 한 메시지(ainvoke 호출) 내 도구별 동시 실행 상한 (다른 세션 호출과 공유하지 않음)",
+    )
+    agent_tool_timeout_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="에이전트 도구 호출별 타임아웃 (초, 초과 시 오류 ToolMessage 반환)",
+    )
     agent_stream_events_enabled: bool = Field(
         default=True,
         description="Agent Stream 이벤트 push 활성화 (Prompt C: Dashboard Agent Execution Stream)",
@@ -297,11 +422,132 @@ class Settings(BaseSettings):
         description="Auto-start status 목록 (쉼표 구분)",
     )
 
+    # ==================== Background Task Pools ====================
+    task_phase2_max_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Phase2 분석 백그라운드 작업 동시 실행 상한",
+    )
+    task_phase2_max_queue: int = Field(
+        default=32,
+        ge=0,
+        description="Phase2 분석 대기열 길이 상한 (초과 시 429)",
+    )
+    task_phase3_max_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Phase3 분석 백그라운드 작업 동시 실행 상한",
+    )
+    task_phase3_max_queue: int = Field(
+        default=32,
+        ge=0,
+        description="Phase3 분석 대기열 길이 상한 (초과 시 429)",
+    )
+    task_finance_trigger_max_concurrency: int = Field(
+        default=2,
+        gt=0,
+        description="케이스 웹훅 트리거 Finance Agent 동시 실행 상한",
+    )
+    task_finance_trigger_max_queue: int = Field(
+        default=50,
+        ge=0,
+        description="케이스 웹훅 트리거 대기열 길이 상한 (초과 시 429, severity 높은 케이스 우선 실행)",
+    )
+    task_drain_timeout_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="앱 종료 시 백그라운드 작업 drain 대기 시간 (초, 초과분은 취소)",
+    )
+    analysis_worker_processes: int = Field(
+        default=0,
+        ge=0,
+        description="Phase2/Phase3 분석 워커 프로세스 수 (0이면 API 프로세스 이벤트 루프에서 실행)",
+    )
+    analysis_worker_job_timeout_seconds: float = Field(
+        default=600.0,
+        gt=0,
+        description="분석 워커 작업 이벤트 수신 대기 상한 (초, 초과 시 failed 처리)",
+    )
+
     # ==================== Integration Settings ====================
     github_token: str | None = Field(
         default=None,
         description="GitHub Personal Access Token"
     )
+    github_max_connections: int = Field(
+        default=10,
+        gt=0,
+        description="GitHub API 공유 클라이언트 커넥션 풀 크기",
+    )
+    github_etag_cache_size: int = Field(
+        default=512,
+        ge=0,
+        description="GitHub API GET 응답 ETag/Last-Modified 캐시 항목 수 (조건부 요청용)",
+    )
+    github_rate_limit_reserve: int = Field(
+        default=50,
+        ge=0,
+        description="GitHub rate limit 잔여량이 이 값 이하이면 리셋 시각까지 요청 간격을 벌림",
+    )
+    github_rate_limit_max_wait_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description="GitHub rate limit 대기 허용 상한 (초, 초과 시 대기 없이 오류 반환)",
+    )
+    github_pr_files_limit: int = Field(
+        default=100,
+        gt=0,
+        description="GitHub PR 변경 파일 목록 조회 상한 (github_get_pr_diff 도구 응답 크기/API 요청 수 제한)",
+    )
+    git_max_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Git 도구 동시 실행 git 프로세스 수 상한",
+    )
+    git_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Git 명령 실행 타임아웃 (초)",
+    )
+    git_diff_max_file_bytes: int = Field(
+        default=16 * 1024,
+        gt=0,
+        description="git_diff 파일당 본문 보관 바이트 상한 (초과 시 stat 요약)",
+    )
+    git_diff_max_file_lines: int = Field(
+        default=400,
+        gt=0,
+        description="git_diff 파일당 본문 보관 라인 상한 (초과 시 stat 요약)",
+    )
+    git_diff_max_total_bytes: int = Field(
+        default=64 * 1024,
+        gt=0,
+        description="git_diff 전체 본문 보관 바이트 상한 (초과 시 읽기 중단, 이후 파일 생략)",
+    )
+    git_diff_max_files: int = Field(
+        default=100,
+        gt=0,
+        description="git_diff 파싱 파일 수 상한 (초과 시 읽기 중단)",
+    )
+    git_show_max_bytes: int = Field(
+        default=64 * 1024,
+        gt=0,
+        description="git_show_file 출력 바이트 상한 (초과 시 앞부분만 반환)",
+    )
+    git_read_cache_max_entries: int = Field(
+        default=256,
+        ge=0,
+        description="Git 읽기 도구(log/branch/show) 결과 캐시 항목 수 상한 (0이면 캐시 비활성)",
+    )
+    git_read_cache_ttl_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="Git 읽기 결과 캐시 유효 시간 (초, HEAD/refs 변경 시 즉시 무효화)",
+    )
+    git_cat_file_batch: bool = Field(
+        default=False,
+        description="git_show_file blob 읽기에 저장소별 장기 실행 `git cat-file --batch` 워커 사용",
+    )
     jira_url: str | None = Field(
         default=None,
         description="Jira 서버 URL"
@@ -0,0 +1,213 @@
+"""
+Context Budget Module
+
+에이전트 LLM 호출 입력을 토큰 예산 내로 유지합니다.
+- tiktoken 기반 토큰 계산 (미설치/인코딩 로드 실패 시 문자 수 기반 추정)
+- 오래된 ToolMessage(Synapse raw JSON 등) 축약
+- 예산 초과 시 오래된 대화 턴부터 제거 (AIMessage tool_calls ↔ ToolMessage 쌍 유지)
+- 시스템 프롬프트 토큰 수 캐시 (동일 prefix 재사용, provider-side prompt caching 호환)
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 메시지당 role/구분자 오버헤드 (OpenAI chat 포맷 기준 근사치)
+MESSAGE_TOKEN_OVERHEAD = 4
+
+# tiktoken 미사용 시 문자→토큰 환산 비율 (한글/영문 혼합 기준 보수적 추정)
+CHARS_PER_TOKEN_FALLBACK = 2
+
+
+@lru_cache()
+def _get_encoder() -> Any:
+    """tiktoken 인코더 (로드 실패 시 None → 문자 수 기반 추정)"""
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(settings.openai_model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.info(f"tiktoken unavailable, using char-based token estimate: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """텍스트 토큰 수 계산"""
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is None:
+        return len(text) // CHARS_PER_TOKEN_FALLBACK + 1
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+@lru_cache(maxsize=256)
+def count_prefix_tokens(prefix: str) -> int:
+    """
+    시스템 프롬프트 prefix 토큰 수 (캐시)
+
+    동일 컨텍스트에서 매 노드 호출마다 재계산하지 않도록 prefix 문자열 단위로 캐시합니다.
+    """
+    return count_tokens(prefix) + MESSAGE_TOKEN_OVERHEAD
+
+
+def _content_text(message: BaseMessage) -> str:
+    """메시지 content를 문자열로 변환 (멀티파트 content 포함)"""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    parts = []
+    for part in content or []:
+        if isinstance(part, dict):
+            parts.append(str(part.get("text", "")))
+        else:
+            parts.append(str(part))
+    return "".join(parts)
+
+
+def count_message_tokens(message: BaseMessage) -> int:
+    """단일 메시지 토큰 수 (tool_calls 인자 포함)"""
+    tokens = count_tokens(_content_text(message)) + MESSAGE_TOKEN_OVERHEAD
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        tokens += count_tokens(json.dumps(tool_calls, ensure_ascii=False, default=str))
+    return tokens
+
+
+def summarize_tool_output(content: str, max_chars: int) -> str:
+    """
+    도구 출력 축약
+
+    JSON이면 최상위 구조(키 목록/항목 수)를 요약하고, 앞부분만 남긴 뒤 잘린 길이를 표기합니다.
+    """
+    if len(content) <= max_chars:
+        return content
+
+    shape = ""
+    try:
+        parsed = json.loads(content)
+        if isinstance(parsed, dict):
+            shape = f"[keys: {', '.join(list(parsed.keys())[:20])}] "
+        elif isinstance(parsed, list):
+            shape = f"[items: {len(parsed)}] "
+        compact = json.dumps(parsed, ensure_ascii=False, separators=(",", ":"), default=str)
+        if len(compact) <= max_chars:
+            return compact
+        content = compact
+    except (json.JSONDecodeError, TypeError, ValueError):
+        pass
+
+    head = content[:max_chars]
+    return f"{shape}{head}... (+{len(content) - max_chars} chars truncated)"
+
+
+@dataclass
+class ContextBudget:
+    """LLM 입력 토큰 예산"""
+    max_input_tokens: int = field(default_factory=lambda: settings.llm_context_max_tokens)
+    tool_output_max_chars: int = field(default_factory=lambda: settings.llm_tool_output_max_chars)
+    keep_recent_tool_outputs: int = field(
+        default_factory=lambda: settings.llm_context_keep_recent_tool_outputs
+    )
+
+
+def _group_turns(messages: list[BaseMessage]) -> list[list[BaseMessage]]:
+    """AIMessage(tool_calls) + 후속 ToolMessage를 하나의 턴으로 묶음 (제거 시 쌍 유지)"""
+    groups: list[list[BaseMessage]] = []
+    for msg in messages:
+        if isinstance(msg, ToolMessage) and groups and (
+            isinstance(groups[-1][0], AIMessage) and getattr(groups[-1][0], "tool_calls", None)
+        ):
+            groups[-1].append(msg)
+        else:
+            groups.append([msg])
+    return groups
+
+
+def compact_messages(
+    messages: list[BaseMessage],
+    budget: ContextBudget | None = None,
+    reserved_tokens: int = 0,
+) -> list[BaseMessage]:
+    """
+    대화 메시지를 토큰 예산 내로 축약
+
+    1. 최근 N개를 제외한 ToolMessage 출력을 tool_output_max_chars로 축약
+    2. 여전히 예산 초과 시 가장 오래된 턴부터 제거 (첫 사용자 요청과 마지막 턴은 유지)
+
+    원본 state 메시지는 변경하지 않고 복사본을 반환합니다.
+
+    Args:
+        messages: state["messages"]
+        budget: 토큰 예산 (None이면 설정값)
+        reserved_tokens: 시스템 프롬프트 등 이미 사용된 토큰 수
+
+    Returns:
+        축약된 메시지 리스트
+    """
+    budget = budget or ContextBudget()
+    if not messages:
+        return []
+
+    tool_indices = [i for i, m in enumerate(messages) if isinstance(m, ToolMessage)]
+    recent_tools = set(tool_indices[-budget.keep_recent_tool_outputs:]) if budget.keep_recent_tool_outputs else set()
+
+    compacted: list[BaseMessage] = []
+    for i, msg in enumerate(messages):
+        if isinstance(msg, ToolMessage) and i not in recent_tools:
+            text = _content_text(msg)
+            if len(text) > budget.tool_output_max_chars:
+                msg = msg.model_copy(
+                    update={"content": summarize_tool_output(text, budget.tool_output_max_chars)}
+                )
+        compacted.append(msg)
+
+    available = budget.max_input_tokens - reserved_tokens
+    groups = _group_turns(compacted)
+    group_tokens = [sum(count_message_tokens(m) for m in g) for g in groups]
+    total = sum(group_tokens)
+    if total <= available:
+        return compacted
+
+    # 첫 사용자 요청(목표)은 유지, 그 다음 턴부터 제거
+    first_keep = 1 if isinstance(groups[0][0], HumanMessage) else 0
+    dropped = 0
+    while total > available and first_keep + dropped < len(groups) - 1:
+        total -= group_tokens[first_keep + dropped]
+        dropped += 1
+
+    kept = groups[:first_keep] + groups[first_keep + dropped:]
+    if dropped:
+        logger.info(
+            f"Context compaction: dropped {dropped} old turn(s), "
+            f"~{total + reserved_tokens} tokens (budget {budget.max_input_tokens})"
+        )
+    return [m for g in kept for m in g]
+
+
+def build_prompt_messages(
+    system_prompt: str,
+    messages: list[BaseMessage],
+    budget: ContextBudget | None = None,
+) -> list[BaseMessage]:
+    """
+    시스템 프롬프트 + 축약된 대화로 LLM 입력 구성
+
+    시스템 프롬프트는 항상 첫 메시지로 두어 노드 간 prefix가 byte-identical하게 유지되도록 합니다.
+    (기존 에이전트 호환을 위해 HumanMessage로 전달)
+    """
+    reserved = count_prefix_tokens(system_prompt)
+    return [HumanMessage(content=system_prompt)] + compact_messages(
+        messages, budget=budget, reserved_tokens=reserved
+    )
@@ -0,0 +1,183 @@
+"""
+Prompt Registry Module
+
+프롬프트 템플릿을 1회 컴파일하고 버전별로 관리합니다.
+- 템플릿은 등록 시 literal/placeholder 세그먼트로 파싱 (매 호출 재파싱 없음)
+- (이름, 버전, 컨텍스트 fingerprint) 단위 렌더링 결과 LRU 캐시
+- static_prefix: 첫 placeholder 이전 고정 구간 (provider-side prompt caching용, byte-identical 유지)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from string import Formatter
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# 렌더링 결과 캐시 최대 항목 수
+DEFAULT_RENDER_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """컴파일된 프롬프트 템플릿"""
+    name: str
+    version: str
+    template: str
+    segments: tuple[tuple[str, str | None], ...]  # (literal, field_name)
+    static_prefix: str
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """템플릿 placeholder 이름 목록"""
+        return tuple(f for _, f in self.segments if f is not None)
+
+    def render(self, **values: Any) -> str:
+        """세그먼트 결합으로 렌더링 (누락 필드는 빈 문자열)"""
+        parts: list[str] = []
+        for literal, field_name in self.segments:
+            parts.append(literal)
+            if field_name is not None:
+                parts.append(str(values.get(field_name, "")))
+        return "".join(parts)
+
+
+def compile_prompt(name: str, version: str, template: str) -> CompiledPrompt:
+    """str.format 호환 템플릿을 세그먼트로 컴파일"""
+    segments: list[tuple[str, str | None]] = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Prompt {name}@{version}: format spec/conversion not supported")
+        segments.append((literal, field_name))
+    first_field = next((i for i, (_, f) in enumerate(segments) if f is not None), None)
+    if first_field is None:
+        static_prefix = template
+    else:
+        static_prefix = "".join(lit for lit, _ in segments[: first_field + 1])
+    return CompiledPrompt(
+        name=name,
+        version=version,
+        template=template,
+        segments=tuple(segments),
+        static_prefix=static_prefix,
+    )
+
+
+def context_fingerprint(values: dict[str, Any]) -> str:
+    """컨텍스트 dict의 안정적 fingerprint (키 정렬 JSON → sha1)"""
+    raw = json.dumps(values, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class PromptRegistry:
+    """
+    버전 관리형 프롬프트 레지스트리
+
+    - register(name, template, version, default): 템플릿 컴파일 후 등록
+    - get(name, version): 컴파일된 템플릿 (미등록 버전은 기본 버전으로 폴백)
+    - render(name, version, cache_key, **values): 렌더링 결과 캐시
+    """
+
+    def __init__(self, render_cache_size: int = DEFAULT_RENDER_CACHE_SIZE) -> None:
+        self._prompts: dict[str, dict[str, CompiledPrompt]] = {}
+        self._defaults: dict[str, str] = {}
+        self._render_cache: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        self._render_cache_size = render_cache_size
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def register(
+        self,
+        name: str,
+        template: str,
+        version: str = "v1",
+        default: bool = False,
+    ) -> CompiledPrompt:
+        """템플릿 등록 (이름별 첫 등록 버전 또는 default=True가 기본 버전)"""
+        compiled = compile_prompt(name, version, template)
+        with self._lock:
+            self._prompts.setdefault(name, {})[version] = compiled
+            if default or name not in self._defaults:
+                self._defaults[name] = version
+            # 동일 이름 재등록 시 기존 렌더링 캐시 무효화
+            for key in [k for k in self._render_cache if k[0] == name and k[1] == version]:
+                del self._render_cache[key]
+        return compiled
+
+    def has(self, name: str) -> bool:
+        """등록 여부"""
+        return name in self._prompts
+
+    def versions(self, name: str) -> list[str]:
+        """등록된 버전 목록"""
+        return list(self._prompts.get(name, {}).keys())
+
+    def resolve_version(self, name: str, version: str | None = None) -> str:
+        """요청 버전 → 실제 사용 버전 (미등록 시 기본 버전)"""
+        if name not in self._prompts:
+            raise KeyError(f"Prompt not registered: {name}")
+        if version and version in self._prompts[name]:
+            return version
+        if version:
+            logger.warning(
+                f"Prompt {name}: unknown version {version}, falling back to {self._defaults[name]}"
+            )
+        return self._defaults[name]
+
+    def get(self, name: str, version: str | None = None) -> CompiledPrompt:
+        """컴파일된 템플릿 조회"""
+        return self._prompts[name][self.resolve_version(name, version)]
+
+    def render(
+        self,
+        name: str,
+        version: str | None = None,
+        cache_key: str | None = None,
+        values_factory: Callable[[], dict[str, Any]] | None = None,
+        **values: Any,
+    ) -> str:
+        """
+        프롬프트 렌더링 (캐시)
+
+        Args:
+            name: 프롬프트 이름 (domain)
+            version: 버전 (None이면 기본 버전)
+            cache_key: 캐시 키 (None이면 values fingerprint)
+            values_factory: 캐시 miss 시에만 호출되는 추가 placeholder 값 생성 함수
+                (값 생성 비용이 큰 경우 사용, cache_key 필수)
+            **values: placeholder 값
+
+        Returns:
+            렌더링된 프롬프트
+        """
+        if values_factory is not None and cache_key is None:
+            raise ValueError("cache_key is required when values_factory is given")
+        compiled = self.get(name, version)
+        key = (name, compiled.version, cache_key or context_fingerprint(values))
+        with self._lock:
+            cached = self._render_cache.get(key)
+            if cached is not None:
+                self._render_cache.move_to_end(key)
+                self.hits += 1
+                return cached
+        if values_factory is not None:
+            values = {**values, **values_factory()}
+        rendered = compiled.render(**values)
+        with self._lock:
+            self.misses += 1
+            self._render_cache[key] = rendered
+            if len(self._render_cache) > self._render_cache_size:
+                self._render_cache.popitem(last=False)
+        return rendered
+
+    def clear_cache(self) -> None:
+        """렌더링 캐시 초기화"""
+        with self._lock:
+            self._render_cache.clear()
+            self.hits = 0
+            self.misses = 0
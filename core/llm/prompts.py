@@ -6,6 +6,8 @@ Context 기반 동적 프롬프트 주입을 지원합니다.
 """
 from typing import Any
 
+from core.llm.prompt_registry import PromptRegistry, context_fingerprint
+
 # ==================== Base System Prompt ====================
 BASE_SYSTEM_PROMPT = """
 You are Aura, an intelligent AI assistant for DWP (Digital Workplace Platform).
@@ -136,13 +138,123 @@ Your expertise includes:
 (This domain is planned for future releases.)
 """
 
+# ==================== Phase3 Analysis Prompts ====================
+# Phase3 options.promptVersion으로 선택 (미등록 버전은 기본 버전 사용)
+PHASE3_REASON_PROMPT_V1 = (
+    "케이스 {case_id} 분석. 스코어 {score}, 심각도 {severity}. "
+    "한국어로 2~3문장 reasonText 작성."
+)
+
+PHASE3_REASON_PROMPT_V2 = (
+    "케이스 {case_id} 분석. 스코어 {score}, 심각도 {severity}. "
+    "증거 {evidence_count}건, RAG 참조 {rag_count}건. "
+    "근거가 된 증거 유형을 언급하며 한국어로 2~3문장 reasonText 작성."
+)
+
+PHASE3_DEFAULT_PROMPT_VERSION = "phase3-mvp-v1"
+
+# get_system_prompt에서 context dict로부터 참조하는 키 (렌더링 캐시 fingerprint 대상)
+CONTEXT_PROMPT_KEYS = (
+    "activeApp",
+    "selectedItemIds",
+    "url",
+    "path",
+    "title",
+    "itemId",
+    "caseId",
+    "documentIds",
+    "entityIds",
+    "openItemIds",
+    "metadata",
+)
+
+
+# ==================== Prompt Registry ====================
+_prompt_registry = PromptRegistry()
+_prompt_registry.register("base", BASE_SYSTEM_PROMPT, version="v1")
+_prompt_registry.register("dev", DEV_DOMAIN_SYSTEM_PROMPT, version="v1")
+_prompt_registry.register("finance", FINANCE_DOMAIN_SYSTEM_PROMPT, version="v1")
+_prompt_registry.register("hr", HR_DOMAIN_SYSTEM_PROMPT, version="v1")
+_prompt_registry.register("code_review", CODE_REVIEW_AGENT_PROMPT, version="v1")
+_prompt_registry.register("issue_manager", ISSUE_MANAGER_AGENT_PROMPT, version="v1")
+_prompt_registry.register(
+    "phase3_reason", PHASE3_REASON_PROMPT_V1, version=PHASE3_DEFAULT_PROMPT_VERSION, default=True
+)
+_prompt_registry.register("phase3_reason", PHASE3_REASON_PROMPT_V2, version="phase3-mvp-v2")
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """전역 PromptRegistry 반환"""
+    return _prompt_registry
+
+
+def _format_context(context: Any) -> str:
+    """프론트엔드/도메인 context(dict 또는 str)를 프롬프트용 문자열로 변환"""
+    if not isinstance(context, dict):
+        return context
+
+    context_parts = []
+
+    # activeApp 정보 추가
+    active_app = context.get("activeApp")
+    if active_app:
+        context_parts.append(f"현재 사용자가 보고 있는 화면: {active_app}")
+
+    # selectedItemIds 정보 추가
+    selected_item_ids = context.get("selectedItemIds")
+    if selected_item_ids:
+        if isinstance(selected_item_ids, list):
+            items_str = ", ".join(str(item_id) for item_id in selected_item_ids)
+            context_parts.append(f"선택된 항목 ID: {items_str}")
+        else:
+            context_parts.append(f"선택된 항목 ID: {selected_item_ids}")
+
+    # 추가 컨텍스트 정보 (url, path, title 등)
+    if context.get("url"):
+        context_parts.append(f"현재 URL: {context['url']}")
+    if context.get("path"):
+        context_parts.append(f"경로: {context['path']}")
+    if context.get("title"):
+        context_parts.append(f"페이지 제목: {context['title']}")
+    if context.get("itemId"):
+        context_parts.append(f"항목 ID: {context['itemId']}")
+
+    # Finance 도메인: caseId, documentIds, entityIds, openItemIds
+    if context.get("caseId"):
+        context_parts.append(f"케이스 ID: {context['caseId']}")
+    if context.get("documentIds"):
+        context_parts.append(f"문서 ID 목록: {context['documentIds']}")
+    if context.get("entityIds"):
+        context_parts.append(f"엔티티 ID 목록: {context['entityIds']}")
+    if context.get("openItemIds"):
+        context_parts.append(f"미결 항목 ID 목록: {context['openItemIds']}")
+
+    # 기타 메타데이터
+    metadata = context.get("metadata", {})
+    if metadata:
+        metadata_str = ", ".join(f"{k}: {v}" for k, v in metadata.items() if v)
+        if metadata_str:
+            context_parts.append(f"추가 정보: {metadata_str}")
+
+    # 컨텍스트 문자열 생성
+    if context_parts:
+        return "\n".join(context_parts)
+    return "No additional context provided."
+
+
 # ==================== Prompt Templates ====================
-def get_system_prompt(domain: str = "base", **kwargs: Any) -> str:
+def get_system_prompt(domain: str = "base", version: str | None = None, **kwargs: Any) -> str:
     """
     도메인에 따른 시스템 프롬프트를 반환합니다.
     
+    템플릿은 PromptRegistry에 1회 컴파일되어 있으며, 렌더링 결과는
+    (domain, version, 컨텍스트 fingerprint) 단위로 캐시됩니다.
+    fingerprint는 프롬프트에 반영되는 context 키만 사용하므로 user_id 등
+    프롬프트와 무관한 값이 달라도 동일한 (byte-identical) 프롬프트를 재사용합니다.
+    
     Args:
-        domain: 도메인 이름 (base, dev, hr, code_review, issue_manager)
+        domain: 도메인 이름 (base, dev, finance, hr, code_review, issue_manager)
+        version: 프롬프트 버전 (None이면 기본 버전)
         **kwargs: 프롬프트에 삽입할 컨텍스트 변수
             - context: 기본 컨텍스트 문자열 또는 dict
             - code: 코드 내용 (code_review용)
@@ -152,72 +264,36 @@ def get_system_prompt(domain: str = "base", **kwargs: Any) -> str:
     Returns:
         포맷된 시스템 프롬프트
     """
-    prompts = {
-        "base": BASE_SYSTEM_PROMPT,
-        "dev": DEV_DOMAIN_SYSTEM_PROMPT,
-        "finance": FINANCE_DOMAIN_SYSTEM_PROMPT,
-        "hr": HR_DOMAIN_SYSTEM_PROMPT,
-        "code_review": CODE_REVIEW_AGENT_PROMPT,
-        "issue_manager": ISSUE_MANAGER_AGENT_PROMPT,
-    }
-    
-    prompt_template = prompts.get(domain, BASE_SYSTEM_PROMPT)
-    
+    if not _prompt_registry.has(domain):
+        domain = "base"
+
     # 기본값 설정
     context = kwargs.get("context", "No additional context provided.")
     code = kwargs.get("code", "")
-    
-    # Context가 dict인 경우 프론트엔드 컨텍스트 정보 추출
-    context_str = context
+
     if isinstance(context, dict):
-        # 기본 컨텍스트 정보 구성
-        context_parts = []
-        
-        # activeApp 정보 추가
-        active_app = context.get("activeApp")
-        if active_app:
-            context_parts.append(f"현재 사용자가 보고 있는 화면: {active_app}")
-        
-        # selectedItemIds 정보 추가
-        selected_item_ids = context.get("selectedItemIds")
-        if selected_item_ids:
-            if isinstance(selected_item_ids, list):
-                items_str = ", ".join(str(item_id) for item_id in selected_item_ids)
-                context_parts.append(f"선택된 항목 ID: {items_str}")
-            else:
-                context_parts.append(f"선택된 항목 ID: {selected_item_ids}")
-        
-        # 추가 컨텍스트 정보 (url, path, title 등)
-        if context.get("url"):
-            context_parts.append(f"현재 URL: {context['url']}")
-        if context.get("path"):
-            context_parts.append(f"경로: {context['path']}")
-        if context.get("title"):
-            context_parts.append(f"페이지 제목: {context['title']}")
-        if context.get("itemId"):
-            context_parts.append(f"항목 ID: {context['itemId']}")
-        
-        # Finance 도메인: caseId, documentIds, entityIds, openItemIds
-        if context.get("caseId"):
-            context_parts.append(f"케이스 ID: {context['caseId']}")
-        if context.get("documentIds"):
-            context_parts.append(f"문서 ID 목록: {context['documentIds']}")
-        if context.get("entityIds"):
-            context_parts.append(f"엔티티 ID 목록: {context['entityIds']}")
-        if context.get("openItemIds"):
-            context_parts.append(f"미결 항목 ID 목록: {context['openItemIds']}")
-        
-        # 기타 메타데이터
-        metadata = context.get("metadata", {})
-        if metadata:
-            metadata_str = ", ".join(f"{k}: {v}" for k, v in metadata.items() if v)
-            if metadata_str:
-                context_parts.append(f"추가 정보: {metadata_str}")
-        
-        # 컨텍스트 문자열 생성
-        if context_parts:
-            context_str = "\n".join(context_parts)
-        else:
-            context_str = "No additional context provided."
-    
-    return prompt_template.format(context=context_str, code=code)
+        stable_context: Any = {k: context.get(k) for k in CONTEXT_PROMPT_KEYS if context.get(k)}
+    else:
+        stable_context = context
+    cache_key = context_fingerprint({"context": stable_context, "code": code})
+
+    compiled = _prompt_registry.get(domain, version)
+    return _prompt_registry.render(
+        domain,
+        compiled.version,
+        cache_key=cache_key,
+        # 컨텍스트 포맷팅은 캐시 miss 시에만 수행
+        values_factory=lambda: {"context": _format_context(context)},
+        code=code,
+    )
+
+
+def render_prompt(name: str, version: str | None = None, **values: Any) -> tuple[str, str]:
+    """
+    등록된 프롬프트 렌더링 (버전 선택)
+
+    Returns:
+        (렌더링된 프롬프트, 실제 사용된 버전)
+    """
+    compiled = _prompt_registry.get(name, version)
+    return _prompt_registry.render(name, compiled.version, **values), compiled.version
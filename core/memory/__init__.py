@@ -24,6 +24,7 @@ from core.memory.conversation import (
 from core.memory.hitl_manager import (
     HITLManager,
     get_hitl_manager,
+    cleanup_hitl_manager,
 )
 
 __all__ = [
@@ -41,4 +42,5 @@ __all__ = [
     "get_recent_context",
     "HITLManager",
     "get_hitl_manager",
+    "cleanup_hitl_manager",
 ]
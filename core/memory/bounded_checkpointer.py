@@ -0,0 +1,268 @@
+"""
+Bounded In-Memory Checkpointer
+
+InMemorySaver(MemorySaver) 호환 drop-in BaseCheckpointSaver.
+프로세스 전역 MemorySaver가 모든 스레드의 전체 체크포인트 이력을 보관하여
+장기 실행 Pod 메모리가 계속 증가하는 문제를 해결합니다.
+
+- 스레드 유휴 TTL 만료 시 제거 (HITL 대기 중인 스레드는 별도의 더 긴 interrupted_ttl 적용)
+- 최대 스레드 수 / 최대 용량 초과 시 LRU 제거 (HITL 대기 중인 스레드는 LRU 제거 대상에서 제외)
+- 스레드/네임스페이스별 최근 N개 체크포인트만 보관 (중간 체크포인트 및 미참조 blob/writes 정리)
+- 직렬화 바이트 기준 메모리 사용량 집계 (stats)
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# interrupt() 발생 시 기록되는 pending write 채널
+INTERRUPT_CHANNEL = "__interrupt__"
+RESUME_CHANNEL = "__resume__"
+
+
+def _entry_size(value: Any) -> int:
+    """serde.dumps_typed 결과 (type, bytes) 크기"""
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], (bytes, bytearray)):
+        return len(value[1])
+    return 0
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    LRU/TTL 제거 및 체크포인트 정리를 지원하는 InMemorySaver
+
+    Args:
+        max_threads: 최대 보관 스레드 수
+        thread_ttl: 스레드 유휴 TTL (초)
+        interrupted_ttl: HITL 승인 대기 스레드 유휴 TTL (초, thread_ttl보다 짧으면 thread_ttl)
+        keep_checkpoints: 스레드/네임스페이스별 보관할 최근 체크포인트 수
+        max_bytes: 직렬화 데이터 최대 용량 (바이트)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_threads: int | None = None,
+        thread_ttl: float | None = None,
+        interrupted_ttl: float | None = None,
+        keep_checkpoints: int | None = None,
+        max_bytes: int | None = None,
+        serde: Any = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self.max_threads = max_threads or settings.checkpointer_max_threads
+        self.thread_ttl = thread_ttl or settings.checkpointer_thread_ttl
+        self.interrupted_ttl = max(
+            self.thread_ttl, interrupted_ttl or settings.checkpointer_interrupted_ttl
+        )
+        self.keep_checkpoints = max(1, keep_checkpoints or settings.checkpointer_keep_checkpoints)
+        self.max_bytes = max_bytes or settings.checkpointer_max_bytes
+
+        self._lock = threading.RLock()
+        # thread_id -> 마지막 접근 시각 (접근 순서 = LRU 순서)
+        self._access: OrderedDict[str, float] = OrderedDict()
+        # thread_id -> 직렬화 바이트 합계
+        self._thread_bytes: dict[str, int] = {}
+        # thread_id -> blob/writes 키 (delete_thread 시 전체 스캔 회피)
+        self._blob_keys: defaultdict[str, set[tuple]] = defaultdict(set)
+        self._write_keys: defaultdict[str, set[tuple]] = defaultdict(set)
+        # (thread_id, ns, checkpoint_id) -> channel_versions (blob 참조 계산용)
+        self._checkpoint_versions: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self.evictions = 0
+        self.pruned_checkpoints = 0
+
+    # ==================== 접근/제거 ====================
+
+    def _touch(self, thread_id: str) -> None:
+        """스레드 접근 시각 갱신 (LRU 순서 맨 뒤로)"""
+        self._access[thread_id] = time.monotonic()
+        self._access.move_to_end(thread_id)
+
+    def _is_interrupted(self, thread_id: str) -> bool:
+        """최신 체크포인트에 미해결 interrupt가 있는지 (HITL 승인 대기)"""
+        for checkpoint_ns, checkpoints in self.storage.get(thread_id, {}).items():
+            if not checkpoints:
+                continue
+            latest_id = max(checkpoints)
+            writes = self.writes.get((thread_id, checkpoint_ns, latest_id), {})
+            channels = {w[1] for w in writes.values()}
+            if INTERRUPT_CHANNEL in channels and RESUME_CHANNEL not in channels:
+                return True
+        return False
+
+    def _drop_thread(self, thread_id: str) -> None:
+        """스레드 데이터 제거 (인덱스 기반)"""
+        self.storage.pop(thread_id, None)
+        for key in self._blob_keys.pop(thread_id, ()):
+            self.blobs.pop(key, None)
+        for key in self._write_keys.pop(thread_id, ()):
+            self.writes.pop(key, None)
+        for key in [k for k in self._checkpoint_versions if k[0] == thread_id]:
+            del self._checkpoint_versions[key]
+        self._access.pop(thread_id, None)
+        self._thread_bytes.pop(thread_id, None)
+
+    def _evict(self, current_thread: str | None = None) -> None:
+        """TTL 만료 및 용량/스레드 수 초과 스레드 제거"""
+        now = time.monotonic()
+        # 1. TTL 만료 (접근 순서대로 정렬되어 있으므로 앞에서부터 검사, HITL 대기 스레드는 interrupted_ttl)
+        for thread_id, last in list(self._access.items()):
+            idle = now - last
+            if idle < self.thread_ttl:
+                break
+            if thread_id == current_thread:
+                continue
+            if idle < self.interrupted_ttl and self._is_interrupted(thread_id):
+                continue
+            self._drop_thread(thread_id)
+            self.evictions += 1
+            logger.debug(f"Checkpointer TTL eviction: thread={thread_id}")
+
+        # 2. 스레드 수/용량 초과 시 LRU 제거 (HITL 대기 중 스레드 제외)
+        total_bytes = sum(self._thread_bytes.values())
+        if len(self._access) <= self.max_threads and total_bytes <= self.max_bytes:
+            return
+        for thread_id in list(self._access.keys()):
+            if len(self._access) <= self.max_threads and total_bytes <= self.max_bytes:
+                break
+            if thread_id == current_thread or self._is_interrupted(thread_id):
+                continue
+            total_bytes -= self._thread_bytes.get(thread_id, 0)
+            self._drop_thread(thread_id)
+            self.evictions += 1
+            logger.info(f"Checkpointer LRU eviction: thread={thread_id}")
+
+    # ==================== 체크포인트 정리 ====================
+
+    def _prune(self, thread_id: str, checkpoint_ns: str) -> None:
+        """최근 keep_checkpoints개를 제외한 체크포인트 및 미참조 blob/writes 제거"""
+        checkpoints = self.storage.get(thread_id, {}).get(checkpoint_ns)
+        if not checkpoints or len(checkpoints) <= self.keep_checkpoints:
+            return
+        # checkpoint id는 시간순 정렬 가능 (uuid6)
+        ordered = sorted(checkpoints)
+        stale = ordered[: -self.keep_checkpoints]
+        for checkpoint_id in stale:
+            del checkpoints[checkpoint_id]
+            self._checkpoint_versions.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+            write_key = (thread_id, checkpoint_ns, checkpoint_id)
+            self.writes.pop(write_key, None)
+            self._write_keys[thread_id].discard(write_key)
+        self.pruned_checkpoints += len(stale)
+
+        # 보관 체크포인트가 참조하는 채널 버전 외 blob 제거
+        referenced: set[tuple[str, Any]] = set()
+        for checkpoint_id in checkpoints:
+            versions = self._checkpoint_versions.get((thread_id, checkpoint_ns, checkpoint_id), {})
+            referenced.update(versions.items())
+        for key in list(self._blob_keys[thread_id]):
+            if key[1] == checkpoint_ns and (key[2], key[3]) not in referenced:
+                self.blobs.pop(key, None)
+                self._blob_keys[thread_id].discard(key)
+
+    def _account(self, thread_id: str) -> None:
+        """스레드 직렬화 바이트 합계 재계산"""
+        total = 0
+        for checkpoints in self.storage.get(thread_id, {}).values():
+            for checkpoint, metadata, _ in checkpoints.values():
+                total += _entry_size(checkpoint) + _entry_size(metadata)
+        for key in self._blob_keys.get(thread_id, ()):
+            total += _entry_size(self.blobs.get(key))
+        for key in self._write_keys.get(thread_id, ()):
+            for write in self.writes.get(key, {}).values():
+                total += _entry_size(write[2])
+        self._thread_bytes[thread_id] = total
+
+    # ==================== BaseCheckpointSaver ====================
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        with self._lock:
+            thread_id = str(config["configurable"]["thread_id"])
+            if thread_id in self._access:
+                self._touch(thread_id)
+            return super().get_tuple(config)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        with self._lock:
+            thread_id = str(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"]["checkpoint_ns"]
+            result = super().put(config, checkpoint, metadata, new_versions)
+            for channel, version in new_versions.items():
+                self._blob_keys[thread_id].add((thread_id, checkpoint_ns, channel, version))
+            self._checkpoint_versions[(thread_id, checkpoint_ns, checkpoint["id"])] = dict(
+                checkpoint.get("channel_versions", {})
+            )
+            self._prune(thread_id, checkpoint_ns)
+            self._account(thread_id)
+            self._touch(thread_id)
+            self._evict(current_thread=thread_id)
+            return result
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        with self._lock:
+            thread_id = str(config["configurable"]["thread_id"])
+            super().put_writes(config, writes, task_id, task_path)
+            self._write_keys[thread_id].add(
+                (
+                    thread_id,
+                    config["configurable"].get("checkpoint_ns", ""),
+                    config["configurable"]["checkpoint_id"],
+                )
+            )
+            self._account(thread_id)
+            self._touch(thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._drop_thread(str(thread_id))
+
+    # ==================== 관리 ====================
+
+    def evict_expired(self) -> int:
+        """TTL/용량 기준 제거 수동 실행 (제거된 스레드 수 반환)"""
+        with self._lock:
+            before = self.evictions
+            self._evict()
+            return self.evictions - before
+
+    def stats(self) -> dict[str, Any]:
+        """메모리 사용량 통계"""
+        with self._lock:
+            return {
+                "threads": len(self._access),
+                "checkpoints": sum(
+                    len(cps) for ns in self.storage.values() for cps in ns.values()
+                ),
+                "bytes": sum(self._thread_bytes.values()),
+                "maxThreads": self.max_threads,
+                "maxBytes": self.max_bytes,
+                "evictions": self.evictions,
+                "prunedCheckpoints": self.pruned_checkpoints,
+            }
@@ -1,35 +1,70 @@
 """
 Checkpointer Factory for LangGraph
 
-Finance Agent용 Checkpointer (astream 호환).
+Finance/Dev Agent용 Checkpointer (astream 호환).
 - agent.stream()은 graph.astream() 사용 → async checkpointer 필요
-- SqliteSaver는 async 미지원 → MemorySaver 사용 (aget_tuple 지원)
-- 영속성 필요 시: AsyncSqliteSaver + aiosqlite (별도 구현)
+- SqliteSaver는 async 미지원 → MemorySaver 계열 사용 (aget_tuple 지원)
+- BoundedMemorySaver: 스레드 LRU/TTL 제거 + 중간 체크포인트 정리 (장기 실행 Pod 메모리 상한)
+- RedisCheckpointSaver: CHECKPOINTER_BACKEND=redis 시 사용 (HITL 승인이 다른 워커에서 resume 가능)
 """
 
 import logging
 from typing import Any
 
-from langgraph.checkpoint.memory import MemorySaver
+from core.config import settings
+from core.memory.bounded_checkpointer import BoundedMemorySaver
+from core.memory.redis_checkpointer import RedisCheckpointSaver
 
 logger = logging.getLogger(__name__)
 
 _checkpointer_instance: Any = None
+_dev_checkpointer_instance: Any = None
+
+
+def _create_checkpointer(agent_name: str) -> Any:
+    """설정(checkpointer_backend)에 따른 Checkpointer 생성"""
+    backend = (settings.checkpointer_backend or "memory").lower()
+    if backend == "redis":
+        checkpointer = RedisCheckpointSaver()
+        logger.info(f"{agent_name} checkpointer: RedisCheckpointSaver (ttl={checkpointer.ttl}s)")
+        return checkpointer
+    if backend != "memory":
+        logger.warning(f"Unknown checkpointer_backend={backend}, falling back to memory")
+    checkpointer = BoundedMemorySaver()
+    logger.info(
+        f"{agent_name} checkpointer: BoundedMemorySaver "
+        f"(max_threads={checkpointer.max_threads}, ttl={checkpointer.thread_ttl}s, "
+        f"keep={checkpointer.keep_checkpoints})"
+    )
+    return checkpointer
 
 
 def get_finance_checkpointer() -> Any:
     """
     Finance Agent용 Checkpointer 반환 (싱글톤)
-    
-    astream(비동기 스트리밍) 호환을 위해 MemorySaver 사용.
+
+    astream(비동기 스트리밍) 호환 체크포인터 사용.
     SqliteSaver는 async 미지원(aget_tuple → NotImplementedError).
-    
+
     Returns:
         BaseCheckpointSaver 호환 체크포인터
     """
     global _checkpointer_instance
     if _checkpointer_instance is not None:
         return _checkpointer_instance
-    _checkpointer_instance = MemorySaver()
-    logger.info("Finance checkpointer: MemorySaver (async compatible)")
+    _checkpointer_instance = _create_checkpointer("Finance")
     return _checkpointer_instance
+
+
+def get_dev_checkpointer() -> Any:
+    """
+    Dev(Enhanced) Agent용 Checkpointer 반환 (싱글톤)
+
+    Returns:
+        BaseCheckpointSaver 호환 체크포인터
+    """
+    global _dev_checkpointer_instance
+    if _dev_checkpointer_instance is not None:
+        return _dev_checkpointer_instance
+    _dev_checkpointer_instance = _create_checkpointer("Dev")
+    return _dev_checkpointer_instance
@@ -0,0 +1,122 @@
+"""
+Redis Value Codec
+
+Redis 저장 값 직렬화 계층 (RedisStore, LangGraphCheckpointer, ConversationHistory, HITLManager).
+- compact JSON (기본) 또는 msgpack (ormsgpack 설치 시)
+- 크기 임계값 초과 시 zlib 압축
+- 첫 바이트 헤더로 포맷 판별 — 헤더 없는 값(기존 JSON)은 그대로 읽음
+
+헤더:
+    (없음) JSON 텍스트 ('{', '[', '"' 등으로 시작하는 기존/호환 값)
+    0x01   msgpack
+    0x02   zlib(JSON)
+    0x03   zlib(msgpack)
+"""
+
+import json
+import logging
+import zlib
+from typing import Any
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - langgraph-checkpoint 설치 시 함께 설치됨
+    ormsgpack = None
+
+HEADER_MSGPACK = 0x01
+HEADER_ZLIB_JSON = 0x02
+HEADER_ZLIB_MSGPACK = 0x03
+
+DEFAULT_COMPRESS_LEVEL = 6
+
+
+class CodecError(ValueError):
+    """Redis 값 디코딩 실패"""
+
+
+class RedisCodec:
+    """
+    Redis 값 인코더/디코더
+
+    Args:
+        format: "json" | "msgpack" (msgpack 미설치 시 json)
+        compress_threshold: 이 바이트 수 초과 시 zlib 압축 (None이면 압축 안 함)
+        compress_level: zlib 압축 레벨
+    """
+
+    def __init__(
+        self,
+        format: str = "json",
+        compress_threshold: int | None = 1024,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+    ) -> None:
+        if format == "msgpack" and ormsgpack is None:
+            logger.warning("ormsgpack not installed, falling back to json codec")
+            format = "json"
+        if format not in ("json", "msgpack"):
+            raise ValueError(f"Unsupported codec format: {format}")
+        self.format = format
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def encode(self, value: Any) -> bytes:
+        """값 → Redis 저장 bytes"""
+        if self.format == "msgpack":
+            payload = ormsgpack.packb(value, option=ormsgpack.OPT_NON_STR_KEYS)
+            header, compressed_header = bytes([HEADER_MSGPACK]), bytes([HEADER_ZLIB_MSGPACK])
+        else:
+            payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            header, compressed_header = b"", bytes([HEADER_ZLIB_JSON])
+
+        if self.compress_threshold is not None and len(payload) > self.compress_threshold:
+            compressed = zlib.compress(payload, self.compress_level)
+            if len(compressed) + 1 < len(payload):
+                return compressed_header + compressed
+        return header + payload
+
+    @staticmethod
+    def decode(raw: bytes | str) -> Any:
+        """Redis 값 → 값 (헤더로 포맷 판별, 헤더 없으면 JSON)"""
+        if not raw:
+            raise CodecError("Empty value")
+        try:
+            if isinstance(raw, str):
+                return json.loads(raw)
+            header = raw[0]
+            if header == HEADER_MSGPACK:
+                return _unpack_msgpack(raw[1:])
+            if header == HEADER_ZLIB_JSON:
+                return json.loads(zlib.decompress(raw[1:]).decode("utf-8"))
+            if header == HEADER_ZLIB_MSGPACK:
+                return _unpack_msgpack(zlib.decompress(raw[1:]))
+            return json.loads(raw.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError, zlib.error, ValueError) as e:
+            raise CodecError(str(e)) from e
+
+
+def _unpack_msgpack(payload: bytes) -> Any:
+    if ormsgpack is None:
+        raise CodecError("msgpack value found but ormsgpack is not installed")
+    return ormsgpack.unpackb(payload)
+
+
+# 외부 시스템(dwp_backend 등)과 공유하는 키용: 항상 헤더 없는 compact JSON
+INTEROP_JSON_CODEC = RedisCodec(format="json", compress_threshold=None)
+
+_default_codec: RedisCodec | None = None
+
+
+def get_default_codec() -> RedisCodec:
+    """설정 기반 기본 코덱 (redis_codec_format, redis_compress_threshold)"""
+    global _default_codec
+    if _default_codec is None:
+        threshold = settings.redis_compress_threshold
+        _default_codec = RedisCodec(
+            format=settings.redis_codec_format,
+            compress_threshold=threshold if threshold > 0 else None,
+        )
+    return _default_codec
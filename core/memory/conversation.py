@@ -5,12 +5,15 @@ Conversation Memory Module
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import Any, Optional
 from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from core.config import settings
+from core.memory.codec import CodecError
 from core.memory.redis_store import RedisStore, get_redis_store
 
 logger = logging.getLogger(__name__)
@@ -42,6 +45,11 @@ class ConversationHistory:
     대화 히스토리 관리 클래스
     
     Redis를 백엔드로 사용하여 대화 내용을 저장하고 조회합니다.
+    
+    저장 구조 (스레드 단위):
+    - {messages_prefix}:[tenant:]thread  LIST  메시지 (RedisStore 코덱, RPUSH + LTRIM, append-only)
+    - {meta_prefix}:[tenant:]thread      HASH  created_at, updated_at
+    - {prefix}:[tenant:]thread           (레거시) 단일 JSON blob — 첫 접근 시 LIST로 마이그레이션
     """
     
     def __init__(self, redis_store: RedisStore) -> None:
@@ -53,11 +61,30 @@ class ConversationHistory:
         """
         self.redis_store = redis_store
         self.prefix = "conversation"
+        self.messages_prefix = "conversation-messages"
+        self.meta_prefix = "conversation-meta"
+        # 스레드 인덱스 (Sorted Set, score = 마지막 갱신 시각) — 대화 키 패턴과 겹치지 않도록 별도 prefix
+        self.index_prefix = "conversation-threads"
+    
+    def _make_index_key(self, tenant_id: str | None = None) -> str:
+        """
+        스레드 인덱스 키 생성
+        
+        Args:
+            tenant_id: 테넌트 ID (None이면 전체 스레드 인덱스)
+            
+        Returns:
+            Redis 키
+        """
+        if tenant_id:
+            return f"{self.index_prefix}:{tenant_id}"
+        return f"{self.index_prefix}:_all"
     
     def _make_key(
         self,
         thread_id: str,
         tenant_id: str | None = None,
+        prefix: str | None = None,
     ) -> str:
         """
         대화 키 생성
@@ -65,13 +92,63 @@ class ConversationHistory:
         Args:
             thread_id: 대화 스레드 ID
             tenant_id: 테넌트 ID (멀티테넌시)
+            prefix: 키 prefix (None이면 레거시 blob prefix)
             
         Returns:
             Redis 키
         """
+        prefix = prefix or self.prefix
         if tenant_id:
-            return f"{self.prefix}:{tenant_id}:{thread_id}"
-        return f"{self.prefix}:{thread_id}"
+            return f"{prefix}:{tenant_id}:{thread_id}"
+        return f"{prefix}:{thread_id}"
+    
+    def _keys(self, thread_id: str, tenant_id: str | None) -> tuple[str, str, str]:
+        """(메시지 LIST 키, 메타 HASH 키, 레거시 blob 키)"""
+        return (
+            self._make_key(thread_id, tenant_id, self.messages_prefix),
+            self._make_key(thread_id, tenant_id, self.meta_prefix),
+            self._make_key(thread_id, tenant_id),
+        )
+    
+    async def _migrate_legacy(
+        self,
+        thread_id: str,
+        tenant_id: str | None,
+        max_messages: int = 100,
+    ) -> None:
+        """
+        레거시 JSON blob → LIST 마이그레이션
+        
+        GETDEL로 blob을 가져오므로 동시에 여러 워커가 호출해도 한 번만 이관됩니다.
+        이관 전에 추가된 메시지 앞쪽(LPUSH)에 기존 메시지를 배치하여 순서를 유지합니다.
+        """
+        messages_key, meta_key, legacy_key = self._keys(thread_id, tenant_id)
+        raw = await self.redis_store.client.getdel(legacy_key)
+        if raw is None:
+            return
+        try:
+            history = self.redis_store.codec.decode(raw)
+        except CodecError as e:
+            logger.error(f"Failed to decode legacy conversation {legacy_key}: {e}")
+            return
+        
+        messages = history.get("messages", [])
+        pipe = self.redis_store.client.pipeline(transaction=True)
+        if messages:
+            pipe.lpush(
+                messages_key,
+                *[self.redis_store.codec.encode(msg) for msg in reversed(messages)],
+            )
+            pipe.ltrim(messages_key, -max_messages, -1)
+        # created_at은 레거시 값 우선, updated_at은 이관 전 추가된 메시지의 값 유지
+        if history.get("created_at"):
+            pipe.hset(meta_key, "created_at", history["created_at"])
+        if history.get("updated_at"):
+            pipe.hsetnx(meta_key, "updated_at", history["updated_at"])
+        pipe.expire(messages_key, settings.redis_ttl)
+        pipe.expire(meta_key, settings.redis_ttl)
+        await pipe.execute()
+        logger.info(f"Conversation migrated to list storage: {thread_id} ({len(messages)} messages)")
     
     async def add_message(
         self,
@@ -81,7 +158,7 @@ class ConversationHistory:
         max_messages: int = 100,
     ) -> None:
         """
-        메시지 추가
+        메시지 추가 (RPUSH + LTRIM, 단일 파이프라인)
         
         Args:
             thread_id: 대화 스레드 ID
@@ -89,23 +166,29 @@ class ConversationHistory:
             tenant_id: 테넌트 ID
             max_messages: 최대 메시지 개수 (초과 시 오래된 것 삭제)
         """
-        key = self._make_key(thread_id, tenant_id)
+        messages_key, meta_key, legacy_key = self._keys(thread_id, tenant_id)
+        now = datetime.utcnow().isoformat()
+        score = time.time()
         
-        # 기존 히스토리 조회
-        history = await self.redis_store.get_json(key)
-        if history is None:
-            history = {"messages": [], "created_at": datetime.utcnow().isoformat()}
-        
-        # 메시지 추가
-        history["messages"].append(message.model_dump(mode="json"))
-        history["updated_at"] = datetime.utcnow().isoformat()
-        
-        # 최대 개수 제한
-        if len(history["messages"]) > max_messages:
-            history["messages"] = history["messages"][-max_messages:]
+        pipe = self.redis_store.client.pipeline(transaction=True)
+        pipe.rpush(messages_key, self.redis_store.codec.encode(message.model_dump(mode="json")))
+        pipe.ltrim(messages_key, -max_messages, -1)
+        pipe.hsetnx(meta_key, "created_at", now)
+        pipe.hset(meta_key, "updated_at", now)
+        pipe.expire(messages_key, settings.redis_ttl)
+        pipe.expire(meta_key, settings.redis_ttl)
+        # 스레드 인덱스 갱신 (테넌트 인덱스 + 전체 인덱스)
+        index_keys = [self._make_index_key(tenant_id)]
+        if tenant_id:
+            index_keys.append(self._make_index_key())
+        for index_key in index_keys:
+            pipe.zadd(index_key, {thread_id: score})
+            pipe.expire(index_key, settings.redis_ttl)
+        pipe.exists(legacy_key)
+        results = await pipe.execute()
         
-        # 저장
-        await self.redis_store.set_json(key, history)
+        if results[-1]:
+            await self._migrate_legacy(thread_id, tenant_id, max_messages)
         logger.debug(f"Message added to thread: {thread_id}")
     
     async def get_messages(
@@ -115,7 +198,7 @@ class ConversationHistory:
         limit: int | None = None,
     ) -> list[Message]:
         """
-        메시지 목록 조회
+        메시지 목록 조회 (LRANGE로 최근 limit개만 전송)
         
         Args:
             thread_id: 대화 스레드 ID
@@ -125,17 +208,25 @@ class ConversationHistory:
         Returns:
             메시지 리스트
         """
-        key = self._make_key(thread_id, tenant_id)
-        history = await self.redis_store.get_json(key)
+        messages_key, _, legacy_key = self._keys(thread_id, tenant_id)
+        start = -limit if limit else 0
         
-        if history is None:
-            return []
+        pipe = self.redis_store.client.pipeline(transaction=False)
+        pipe.lrange(messages_key, start, -1)
+        pipe.exists(legacy_key)
+        raw_messages, legacy_exists = await pipe.execute()
         
-        messages_data = history.get("messages", [])
-        if limit:
-            messages_data = messages_data[-limit:]
+        if legacy_exists:
+            await self._migrate_legacy(thread_id, tenant_id)
+            raw_messages = await self.redis_store.client.lrange(messages_key, start, -1)
         
-        return [Message(**msg) for msg in messages_data]
+        messages = []
+        for raw in raw_messages:
+            try:
+                messages.append(Message(**self.redis_store.codec.decode(raw)))
+            except (CodecError, ValueError) as e:
+                logger.error(f"Failed to decode message in {messages_key}: {e}")
+        return messages
     
     async def get_messages_for_llm(
         self,
@@ -172,8 +263,13 @@ class ConversationHistory:
             thread_id: 대화 스레드 ID
             tenant_id: 테넌트 ID
         """
-        key = self._make_key(thread_id, tenant_id)
-        await self.redis_store.delete(key)
+        messages_key, meta_key, legacy_key = self._keys(thread_id, tenant_id)
+        pipe = self.redis_store.client.pipeline(transaction=True)
+        pipe.delete(messages_key, meta_key, legacy_key)
+        pipe.zrem(self._make_index_key(tenant_id), thread_id)
+        if tenant_id:
+            pipe.zrem(self._make_index_key(), thread_id)
+        await pipe.execute()
         logger.info(f"Conversation history cleared: {thread_id}")
     
     async def get_thread_metadata(
@@ -191,18 +287,33 @@ class ConversationHistory:
         Returns:
             메타데이터 딕셔너리
         """
-        key = self._make_key(thread_id, tenant_id)
-        history = await self.redis_store.get_json(key)
+        messages_key, meta_key, legacy_key = self._keys(thread_id, tenant_id)
         
-        if history is None:
+        async def _read() -> tuple[dict, int, int]:
+            pipe = self.redis_store.client.pipeline(transaction=False)
+            pipe.hgetall(meta_key)
+            pipe.llen(messages_key)
+            pipe.exists(legacy_key)
+            return tuple(await pipe.execute())  # type: ignore[return-value]
+        
+        meta, message_count, legacy_exists = await _read()
+        if legacy_exists:
+            await self._migrate_legacy(thread_id, tenant_id)
+            meta, message_count, _ = await _read()
+        
+        if not meta and not message_count:
             return None
         
+        meta = {
+            (k.decode("utf-8") if isinstance(k, bytes) else k): (v.decode("utf-8") if isinstance(v, bytes) else v)
+            for k, v in meta.items()
+        }
         return {
             "thread_id": thread_id,
             "tenant_id": tenant_id,
-            "message_count": len(history.get("messages", [])),
-            "created_at": history.get("created_at"),
-            "updated_at": history.get("updated_at"),
+            "message_count": message_count,
+            "created_at": meta.get("created_at"),
+            "updated_at": meta.get("updated_at"),
         }
     
     async def list_threads(
@@ -210,7 +321,10 @@ class ConversationHistory:
         tenant_id: str | None = None,
     ) -> list[str]:
         """
-        모든 대화 스레드 ID 목록 조회
+        모든 대화 스레드 ID 목록 조회 (최근 갱신순)
+        
+        스레드 인덱스(Sorted Set)에서 조회하며, 대화 TTL이 지난 항목은 조회 시 정리합니다.
+        인덱스 도입 이전 데이터는 최초 조회 시 1회 SCAN으로 인덱스에 백필합니다.
         
         Args:
             tenant_id: 테넌트 ID (None이면 전체)
@@ -218,27 +332,34 @@ class ConversationHistory:
         Returns:
             스레드 ID 리스트
         """
-        if tenant_id:
-            pattern = f"{self.prefix}:{tenant_id}:*"
-        else:
-            pattern = f"{self.prefix}:*"
+        await self._backfill_index()
+        return await self.redis_store.index_members(
+            self._make_index_key(tenant_id),
+            min_score=time.time() - settings.redis_ttl,
+        )
+    
+    async def _backfill_index(self) -> None:
+        """
+        인덱스 도입 이전 스레드(레거시 blob / 메타 HASH 키)를 스레드 인덱스에 1회 백필
         
-        keys = await self.redis_store.get_keys(pattern)
+        score는 키의 남은 TTL로 마지막 갱신 시각을 역산합니다. (TTL 없는 키는 현재 시각)
+        """
+        now = time.time()
         
-        # 키에서 thread_id 추출
-        thread_ids = []
-        for key in keys:
-            parts = key.split(":")
+        def to_entries(key: str, ttl: int) -> list[tuple[str, str, float]]:
+            rest = key.split(":", 1)[1]
+            tenant_id, _, thread_id = rest.rpartition(":")
+            score = now - (settings.redis_ttl - ttl) if ttl >= 0 else now
+            entries = [(self._make_index_key(), thread_id, score)]
             if tenant_id:
-                # prefix:tenant_id:thread_id
-                if len(parts) >= 3:
-                    thread_ids.append(parts[2])
-            else:
-                # prefix:thread_id
-                if len(parts) >= 2:
-                    thread_ids.append(parts[1])
+                entries.append((self._make_index_key(tenant_id), thread_id, score))
+            return entries
         
-        return thread_ids
+        await self.redis_store.backfill_index(
+            f"{self.index_prefix}-backfilled",
+            [f"{self.prefix}:*", f"{self.meta_prefix}:*"],
+            to_entries,
+        )
 
 
 async def get_conversation_history() -> ConversationHistory:
@@ -2,9 +2,14 @@
 HITL (Human-In-The-Loop) Manager
 
 Redis Pub/Sub을 사용하여 승인 신호를 수신하고 처리합니다.
+- 프로세스당 단일 패턴 구독(hitl:channel:*)으로 모든 대기 세션의 신호를 수신하여
+  세션별 asyncio.Future로 전달 (대기 스트림마다 구독/연결을 점유하지 않음)
+- 구독 이전에 발행된 신호/메시지 유실 대비 hitl:signal:{session} 키 폴백 조회
+- suspend 모드: 대기 없이 스트림을 종료하고 hitl:suspended:{thread} 레코드로 재개
+- 신호 키 저장은 발행자가 1회 수행 (publish_approval_result: SET NX + PUBLISH), 리스너는 프로세스 내 전달만 담당
 """
 
-import json
+import asyncio
 import logging
 import uuid
 from typing import Any, Callable
@@ -13,10 +18,14 @@ import redis.asyncio as redis
 from redis.asyncio import Redis
 
 from core.config import settings
+from core.memory.codec import INTEROP_JSON_CODEC, RedisCodec, get_default_codec
 from core.memory.redis_store import get_redis_store
 
 logger = logging.getLogger(__name__)
 
+HITL_CHANNEL_PREFIX = "hitl:channel:"
+HITL_SUSPENDED_PREFIX = "hitl:suspended:"
+
 
 class HITLManager:
     """
@@ -34,6 +43,11 @@ class HITLManager:
         """
         self.redis_client = redis_client
         self._pubsub: redis.client.PubSub | None = None
+        # session_id → 대기 중인 (Future, request_id) 목록 (동일 세션 다중 대기 허용)
+        self._waiters: dict[str, list[tuple[asyncio.Future, str | None]]] = {}
+        self._listener_task: asyncio.Task | None = None
+        self._listener_ready: asyncio.Event | None = None
+        self._listener_lock: asyncio.Lock | None = None
     
     async def _get_redis_client(self) -> Redis:
         """Redis 클라이언트 가져오기"""
@@ -76,41 +90,117 @@ class HITLManager:
             "createdAt": int(uuid.uuid4().int % (10 ** 10)),  # 임시 타임스탬프
         }
         
-        # Redis에 저장 (TTL: 30분)
-        key = f"hitl:request:{request_id}"
-        await redis_client.setex(
-            key,
-            1800,  # 30분
-            json.dumps(request_data, ensure_ascii=False)
-        )
-        
-        # 세션 정보 저장 (TTL: 60분)
-        session_key = f"hitl:session:{session_id}"
+        # 세션 정보
         session_data = {
             "sessionId": session_id,
             "requestId": request_id,
             "userId": user_id,
             "tenantId": tenant_id,
         }
-        await redis_client.setex(
-            session_key,
-            3600,  # 60분
-            json.dumps(session_data, ensure_ascii=False)
-        )
+        
+        # Redis에 저장 (요청 TTL: 30분, 세션 TTL: 60분, 1회 왕복)
+        # hitl:request/hitl:session은 dwp_backend가 직접 조회하므로 헤더 없는 compact JSON 유지
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(f"hitl:request:{request_id}", 1800, INTEROP_JSON_CODEC.encode(request_data))
+            pipe.setex(f"hitl:session:{session_id}", 3600, INTEROP_JSON_CODEC.encode(session_data))
+            await pipe.execute()
         
         logger.info(f"HITL approval request saved: {request_id} (session: {session_id})")
     
+    # ==================== 공유 Pub/Sub 리스너 ====================
+    
+    async def _ensure_listener(self) -> None:
+        """패턴 구독 리스너 시작 (프로세스당 1개, 최초 대기 시 지연 시작)"""
+        if self._listener_lock is None:
+            self._listener_lock = asyncio.Lock()
+            self._listener_ready = asyncio.Event()
+        async with self._listener_lock:
+            if self._listener_task is None or self._listener_task.done():
+                self._listener_ready.clear()
+                self._listener_task = asyncio.create_task(self._listen_loop())
+        # 구독 완료 대기 (연결 실패 시에도 폴백 조회로 진행)
+        try:
+            await asyncio.wait_for(self._listener_ready.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning("HITL listener not ready, relying on signal key polling")
+    
+    async def _listen_loop(self) -> None:
+        """hitl:channel:* 메시지를 세션별 Future로 전달 (연결 끊김 시 재구독)"""
+        while True:
+            try:
+                redis_client = await self._get_redis_client()
+                self._pubsub = redis_client.pubsub()
+                await self._pubsub.psubscribe(f"{HITL_CHANNEL_PREFIX}*")
+                self._listener_ready.set()
+                logger.info(f"HITL listener subscribed: {HITL_CHANNEL_PREFIX}*")
+                async for message in self._pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    channel = message["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode("utf-8")
+                    session_id = channel[len(HITL_CHANNEL_PREFIX):]
+                    if session_id not in self._waiters:
+                        # 대기자 없음(다른 Pod 세션, suspend 상태) → 신호 키는 발행자가 저장
+                        continue
+                    try:
+                        signal = RedisCodec.decode(message["data"])
+                    except ValueError as e:
+                        logger.error(f"Invalid HITL signal on {channel}: {e}")
+                        continue
+                    logger.info(f"Received HITL signal: {signal}")
+                    self._dispatch(session_id, signal)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"HITL listener error, resubscribing: {e}")
+                self._listener_ready.clear()
+                await asyncio.sleep(1)
+            finally:
+                if self._pubsub is not None:
+                    try:
+                        await self._pubsub.aclose()
+                    except Exception:
+                        pass
+                    self._pubsub = None
+    
+    def _dispatch(self, session_id: str, signal: dict[str, Any]) -> None:
+        """세션 대기자에게 신호 전달 (requestId 불일치 대기자는 제외)"""
+        for future, request_id in self._waiters.get(session_id, []):
+            if future.done():
+                continue
+            if request_id and signal.get("requestId") not in (None, request_id):
+                continue
+            future.set_result(signal)
+    
+    async def close(self) -> None:
+        """리스너 종료 (앱 종료 시)"""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener_task = None
+        for waiters in self._waiters.values():
+            for future, _ in waiters:
+                if not future.done():
+                    future.cancel()
+        self._waiters.clear()
+    
     async def wait_for_approval_signal(
         self,
         session_id: str,
         timeout: int = 300,
+        request_id: str | None = None,
     ) -> dict[str, Any] | None:
         """
-        승인 신호 대기 (Redis Pub/Sub)
+        승인 신호 대기 (공유 Redis Pub/Sub 리스너 + 신호 키 폴백 조회)
         
         Args:
             session_id: 세션 ID
             timeout: 타임아웃 (초), 기본 300초 (5분)
+            request_id: 승인 요청 ID (지정 시 해당 요청의 신호만 수락 — 동일 세션 이전 신호 무시)
             
         Returns:
             승인 신호 딕셔너리 또는 None (타임아웃)
@@ -123,42 +213,118 @@ class HITLManager:
                 "timestamp": 1706152860
             }
         """
-        redis_client = await self._get_redis_client()
-        
-        # Pub/Sub 구독
-        self._pubsub = redis_client.pubsub()
-        channel = f"hitl:channel:{session_id}"
-        await self._pubsub.subscribe(channel)
-        
-        logger.info(f"Waiting for HITL signal on channel: {channel}")
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        entry = (future, request_id)
+        self._waiters.setdefault(session_id, []).append(entry)
+        logger.info(f"Waiting for HITL signal on channel: {HITL_CHANNEL_PREFIX}{session_id}")
         
         try:
-            import asyncio
-            
-            # 타임아웃 설정
-            async def wait_for_message():
-                async for message in self._pubsub.listen():
-                    if message["type"] == "message":
-                        data = message["data"]
-                        if isinstance(data, bytes):
-                            data = data.decode("utf-8")
-                        signal = json.loads(data)
-                        logger.info(f"Received HITL signal: {signal}")
-                        return signal
-                return None
-            
-            try:
-                signal = await asyncio.wait_for(wait_for_message(), timeout=timeout)
-                return signal
-            except asyncio.TimeoutError:
-                logger.warning(f"HITL signal timeout after {timeout} seconds")
-                return None
+            await self._ensure_listener()
+            deadline = loop.time() + timeout
+            while True:
+                # 구독 이전 발행 신호 / 메시지 유실 대비 키 조회
+                if not future.done():
+                    stored = await self._get_stored_signal(session_id, request_id)
+                    if stored is not None and not future.done():
+                        future.set_result(stored)
+                if future.done():
+                    return future.result()
                 
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    logger.warning(f"HITL signal timeout after {timeout} seconds")
+                    return None
+                try:
+                    return await asyncio.wait_for(
+                        asyncio.shield(future),
+                        timeout=min(remaining, settings.hitl_signal_poll_interval),
+                    )
+                except asyncio.TimeoutError:
+                    continue
         finally:
-            if self._pubsub:
-                await self._pubsub.unsubscribe(channel)
-                await self._pubsub.close()
-                self._pubsub = None
+            waiters = self._waiters.get(session_id, [])
+            if entry in waiters:
+                waiters.remove(entry)
+            if not waiters:
+                self._waiters.pop(session_id, None)
+            if not future.done():
+                future.cancel()
+    
+    async def _get_stored_signal(
+        self,
+        session_id: str,
+        request_id: str | None,
+    ) -> dict[str, Any] | None:
+        """hitl:signal 키 조회 (request_id 지정 시 일치하는 신호만)"""
+        try:
+            signal = await self.get_signal(session_id)
+        except Exception as e:
+            logger.debug(f"HITL signal poll failed: {e}")
+            return None
+        if signal is None:
+            return None
+        if request_id and signal.get("requestId") not in (None, request_id):
+            return None
+        return signal
+    
+    # ==================== Suspend / Resume ====================
+    
+    async def save_suspended_session(
+        self,
+        thread_id: str,
+        record: dict[str, Any],
+        ttl: int | None = None,
+    ) -> None:
+        """
+        HITL interrupt로 중단된 스트림 세션 저장 (스트림 종료 후 다른 워커에서도 재개 가능)
+        
+        Args:
+            thread_id: LangGraph 스레드 ID (재개 키)
+            record: sessionId, requestId, traceId, userId, tenantId, goal, context, lastEventId 등
+            ttl: 보관 시간 (초), None이면 hitl_suspend_ttl_seconds
+        """
+        redis_client = await self._get_redis_client()
+        await redis_client.setex(
+            f"{HITL_SUSPENDED_PREFIX}{thread_id}",
+            ttl or settings.hitl_suspend_ttl_seconds,
+            get_default_codec().encode(record),
+        )
+        # 승인 신호가 스트림 종료 후 도착해도 키로 보존되도록 리스너 유지
+        await self._ensure_listener()
+        logger.info(f"HITL session suspended: thread={thread_id}, request={record.get('requestId')}")
+    
+    async def take_suspended_session(
+        self,
+        thread_id: str,
+        user_id: str,
+        tenant_id: str,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """
+        재개 대상 세션과 승인 신호 조회
+        
+        신호가 도착한 경우에만 레코드를 원자적으로 회수(GETDEL)하여 중복 재개를 방지합니다.
+        
+        Returns:
+            (레코드, 신호) — 레코드 없음/소유자 불일치 (None, None), 승인 대기 중 (레코드, None)
+        """
+        redis_client = await self._get_redis_client()
+        key = f"{HITL_SUSPENDED_PREFIX}{thread_id}"
+        data = await redis_client.get(key)
+        if data is None:
+            return None, None
+        record = RedisCodec.decode(data)
+        if record.get("userId") != user_id or record.get("tenantId") != tenant_id:
+            logger.warning(f"HITL resume owner mismatch: thread={thread_id}, user={user_id}")
+            return None, None
+        
+        signal = await self._get_stored_signal(record["sessionId"], record.get("requestId"))
+        if signal is None:
+            return record, None
+        if await redis_client.getdel(key) is None:
+            # 다른 요청/워커가 먼저 재개
+            return None, None
+        return record, signal
     
     async def get_approval_request(self, request_id: str) -> dict[str, Any] | None:
         """
@@ -177,10 +343,41 @@ class HITLManager:
         if data is None:
             return None
         
-        if isinstance(data, bytes):
-            data = data.decode("utf-8")
-        
-        return json.loads(data)
+        return RedisCodec.decode(data)
+    
+    async def publish_approval_result(
+        self,
+        session_id: str,
+        signal: dict[str, Any],
+        ttl: int | None = None,
+    ) -> int:
+        """
+        승인 신호 발행 (신호 키 저장 + Pub/Sub 발행, 1회 왕복)
+
+        신호 키는 SET NX로 1회만 저장되어 대기자 없는 세션(suspend)도 재개 시 조회할 수 있습니다.
+        외부 발행자(Synapse 백엔드)도 같은 순서(hitl:signal 저장 → hitl:channel 발행)를 따릅니다.
+
+        Args:
+            session_id: 세션 ID
+            signal: 승인 신호 (requestId, status 등)
+            ttl: 신호 키 TTL (초, None이면 hitl_suspend_ttl_seconds)
+
+        Returns:
+            신호를 수신한 구독자 수
+        """
+        redis_client = await self._get_redis_client()
+        payload = INTEROP_JSON_CODEC.encode(signal)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(
+                f"hitl:signal:{session_id}",
+                payload,
+                ex=ttl or settings.hitl_suspend_ttl_seconds,
+                nx=True,
+            )
+            pipe.publish(f"{HITL_CHANNEL_PREFIX}{session_id}", payload)
+            _, receivers = await pipe.execute()
+        logger.info(f"HITL signal published: session={session_id}, receivers={receivers}")
+        return receivers
     
     async def get_signal(self, session_id: str) -> dict[str, Any] | None:
         """
@@ -199,10 +396,7 @@ class HITLManager:
         if data is None:
             return None
         
-        if isinstance(data, bytes):
-            data = data.decode("utf-8")
-        
-        return json.loads(data)
+        return RedisCodec.decode(data)
 
 
 # 전역 HITL Manager 인스턴스
@@ -215,3 +409,11 @@ async def get_hitl_manager() -> HITLManager:
     if _hitl_manager is None:
         _hitl_manager = HITLManager()
     return _hitl_manager
+
+
+async def cleanup_hitl_manager() -> None:
+    """HITL 리스너 정리 (앱 종료 시 호출, cleanup_redis 이전)"""
+    global _hitl_manager
+    if _hitl_manager is not None:
+        await _hitl_manager.close()
+        _hitl_manager = None
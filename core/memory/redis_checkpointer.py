@@ -0,0 +1,436 @@
+"""
+Redis Checkpoint Saver
+
+LangGraph BaseCheckpointSaver 인터페이스를 구현한 비동기 Redis 체크포인터.
+체크포인트/pending writes가 Redis에 저장되므로 HITL 승인(resume)이 다른 워커에서도 처리됩니다.
+
+키 구조 (thread_id, checkpoint_ns 단위):
+- {prefix}:cp:{thread}:{ns}            HASH  checkpoint_id → [type, checkpoint, type, metadata, parent_id]
+- {prefix}:idx:{thread}:{ns}           ZSET  checkpoint_id (score 0, 사전순 = 시간순, uuid6)
+- {prefix}:blobs:{thread}:{ns}         HASH  channel\\x00version → [type, value] (변경된 채널만 저장)
+- {prefix}:writes:{thread}:{ns}:{id}   HASH  task_id\\x00idx → [task_id, channel, type, value, task_path]
+- {prefix}:ns:{thread}                 SET   checkpoint_ns 목록 (delete_thread용)
+
+값은 serde.dumps_typed(msgpack) 결과를 ormsgpack으로 묶은 바이너리이며,
+모든 키는 redis_checkpoint_ttl로 만료됩니다.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, AsyncIterator, Iterator, Sequence
+
+import ormsgpack
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from redis.asyncio import Redis
+
+from core.config import settings
+from core.memory.redis_store import RedisStore, get_redis_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEY_PREFIX = "langgraph:saver"
+
+# 해시 필드 구분자 (channel/task_id에 포함되지 않는 문자)
+FIELD_SEP = "\x00"
+
+# alist 인덱스 페이지 크기 상한 (limit만 지정 시 min(limit, LIST_PAGE_SIZE))
+LIST_PAGE_SIZE = 100
+
+
+def _pack(*values: Any) -> bytes:
+    """여러 값을 하나의 msgpack 바이너리로 결합"""
+    return ormsgpack.packb(list(values))
+
+
+def _unpack(raw: bytes) -> list[Any]:
+    """_pack 결과 복원"""
+    return ormsgpack.unpackb(raw)
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+async def _single_page(ids: list[str]) -> AsyncIterator[list[str]]:
+    yield ids
+
+
+class RedisCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    비동기 Redis 기반 LangGraph Checkpointer
+
+    graph.astream/ainvoke(비동기) 경로에서 사용합니다.
+    동기 메서드(get_tuple/put 등)는 다른 스레드에서 호출된 경우에만 이벤트 루프로 위임합니다.
+
+    Args:
+        redis_store: RedisStore (None이면 전역 get_redis_store() 사용)
+        key_prefix: Redis 키 prefix
+        ttl: 키 TTL (초, None이면 settings.redis_checkpoint_ttl)
+    """
+
+    def __init__(
+        self,
+        redis_store: RedisStore | None = None,
+        *,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+        ttl: int | None = None,
+        serde: Any = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self._store = redis_store
+        self.key_prefix = key_prefix
+        self.ttl = ttl or settings.redis_checkpoint_ttl
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    # ==================== 키/연결 ====================
+
+    def _cp_key(self, thread_id: str, checkpoint_ns: str) -> str:
+        return f"{self.key_prefix}:cp:{thread_id}:{checkpoint_ns}"
+
+    def _idx_key(self, thread_id: str, checkpoint_ns: str) -> str:
+        return f"{self.key_prefix}:idx:{thread_id}:{checkpoint_ns}"
+
+    def _blobs_key(self, thread_id: str, checkpoint_ns: str) -> str:
+        return f"{self.key_prefix}:blobs:{thread_id}:{checkpoint_ns}"
+
+    def _writes_key(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> str:
+        return f"{self.key_prefix}:writes:{thread_id}:{checkpoint_ns}:{checkpoint_id}"
+
+    def _ns_key(self, thread_id: str) -> str:
+        return f"{self.key_prefix}:ns:{thread_id}"
+
+    async def _client(self) -> Redis:
+        """Redis 클라이언트 (최초 호출 시 전역 RedisStore 연결)"""
+        if self._store is None:
+            self._store = await get_redis_store()
+        self._loop = asyncio.get_running_loop()
+        return self._store.client
+
+    # ==================== 직렬화 ====================
+
+    def _load_writes(self, raw_writes: dict[bytes, bytes]) -> list[tuple[str, str, Any]]:
+        """writes 해시 → pending_writes (task_path, task_id, idx 순 정렬)"""
+        entries = []
+        for field, raw in raw_writes.items():
+            task_id, channel, type_, value, task_path = _unpack(raw)
+            idx = int(_decode(field).rsplit(FIELD_SEP, 1)[1])
+            entries.append(((task_path, task_id, idx), task_id, channel, (type_, value)))
+        entries.sort(key=lambda e: e[0])
+        return [(task_id, channel, self.serde.loads_typed(typed)) for _, task_id, channel, typed in entries]
+
+    async def _build_tuple(
+        self,
+        client: Redis,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        raw_checkpoint: bytes,
+        raw_writes: dict[bytes, bytes],
+    ) -> CheckpointTuple:
+        """저장 데이터 → CheckpointTuple (채널 값은 blobs 해시에서 HMGET)"""
+        c_type, c_data, m_type, m_data, parent_id = _unpack(raw_checkpoint)
+        checkpoint: Checkpoint = self.serde.loads_typed((c_type, c_data))
+
+        channel_values: dict[str, Any] = {}
+        versions = list(checkpoint.get("channel_versions", {}).items())
+        if versions:
+            fields = [f"{ch}{FIELD_SEP}{ver}" for ch, ver in versions]
+            blobs = await client.hmget(self._blobs_key(thread_id, checkpoint_ns), fields)
+            for (channel, _), raw in zip(versions, blobs):
+                if raw is None:
+                    continue
+                type_, value = _unpack(raw)
+                if type_ != "empty":
+                    channel_values[channel] = self.serde.loads_typed((type_, value))
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=self.serde.loads_typed((m_type, m_data)),
+            pending_writes=self._load_writes(raw_writes or {}),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+        )
+
+    # ==================== Async API ====================
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """체크포인트 조회 (checkpoint_id 미지정 시 최신)"""
+        client = await self._client()
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        if not checkpoint_id:
+            latest = await client.zrevrange(self._idx_key(thread_id, checkpoint_ns), 0, 0)
+            if not latest:
+                return None
+            checkpoint_id = _decode(latest[0])
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hget(self._cp_key(thread_id, checkpoint_ns), checkpoint_id)
+            pipe.hgetall(self._writes_key(thread_id, checkpoint_ns, checkpoint_id))
+            raw_checkpoint, raw_writes = await pipe.execute()
+        if raw_checkpoint is None:
+            return None
+        return await self._build_tuple(
+            client, thread_id, checkpoint_ns, checkpoint_id, raw_checkpoint, raw_writes
+        )
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """스레드 체크포인트 목록 (최신순)"""
+        if config is None:
+            raise ValueError("RedisCheckpointSaver.alist requires config with thread_id")
+        client = await self._client()
+        thread_id = str(config["configurable"]["thread_id"])
+        config_ns = config["configurable"].get("checkpoint_ns")
+        config_checkpoint_id = get_checkpoint_id(config)
+        before_id = get_checkpoint_id(before) if before else None
+
+        if config_ns is not None:
+            namespaces = [config_ns]
+        else:
+            namespaces = sorted(_decode(ns) for ns in await client.smembers(self._ns_key(thread_id)))
+
+        remaining = limit
+        for checkpoint_ns in namespaces:
+            if remaining is not None and remaining <= 0:
+                return
+            if config_checkpoint_id:
+                if before_id and config_checkpoint_id >= before_id:
+                    continue
+                pages = _single_page([config_checkpoint_id])
+            else:
+                # 인덱스를 페이지 단위로 조회 (limit만 지정 시 첫 페이지 = limit개, 전체 인덱스 조회 없음)
+                page_size = LIST_PAGE_SIZE
+                if remaining is not None and not filter:
+                    page_size = min(remaining, LIST_PAGE_SIZE)
+                pages = self._index_pages(client, thread_id, checkpoint_ns, before_id, page_size)
+            async for ids in pages:
+                raw_checkpoints = await client.hmget(self._cp_key(thread_id, checkpoint_ns), ids)
+                for checkpoint_id, raw_checkpoint in zip(ids, raw_checkpoints):
+                    if remaining is not None and remaining <= 0:
+                        return
+                    if raw_checkpoint is None:
+                        continue
+                    if filter:
+                        _, _, m_type, m_data, _ = _unpack(raw_checkpoint)
+                        metadata = self.serde.loads_typed((m_type, m_data))
+                        if not all(metadata.get(k) == v for k, v in filter.items()):
+                            continue
+                    raw_writes = await client.hgetall(self._writes_key(thread_id, checkpoint_ns, checkpoint_id))
+                    yield await self._build_tuple(
+                        client, thread_id, checkpoint_ns, checkpoint_id, raw_checkpoint, raw_writes
+                    )
+                    if remaining is not None:
+                        remaining -= 1
+                if remaining is not None and remaining <= 0:
+                    return
+
+    async def _index_pages(
+        self,
+        client: Redis,
+        thread_id: str,
+        checkpoint_ns: str,
+        before_id: str | None,
+        page_size: int,
+    ) -> AsyncIterator[list[str]]:
+        """체크포인트 인덱스 최신순 페이지 (before는 exclusive 상한, 사전순 = 시간순)"""
+        max_lex = f"({before_id}" if before_id else "+"
+        start = 0
+        while True:
+            ids = [
+                _decode(i)
+                for i in await client.zrevrangebylex(
+                    self._idx_key(thread_id, checkpoint_ns), max_lex, "-", start=start, num=page_size
+                )
+            ]
+            if ids:
+                yield ids
+            if len(ids) < page_size:
+                return
+            start += page_size
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """체크포인트 저장 (변경된 채널 값만 blobs에 기록, 단일 파이프라인)"""
+        client = await self._client()
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        parent_id = config["configurable"].get("checkpoint_id")
+
+        c = checkpoint.copy()
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+        blobs = {
+            f"{channel}{FIELD_SEP}{version}": _pack(
+                *(self.serde.dumps_typed(values[channel]) if channel in values else ("empty", b""))
+            )
+            for channel, version in new_versions.items()
+        }
+        c_type, c_data = self.serde.dumps_typed(c)
+        m_type, m_data = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+
+        cp_key = self._cp_key(thread_id, checkpoint_ns)
+        idx_key = self._idx_key(thread_id, checkpoint_ns)
+        blobs_key = self._blobs_key(thread_id, checkpoint_ns)
+        ns_key = self._ns_key(thread_id)
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(cp_key, checkpoint["id"], _pack(c_type, c_data, m_type, m_data, parent_id))
+            pipe.zadd(idx_key, {checkpoint["id"]: 0})
+            if blobs:
+                pipe.hset(blobs_key, mapping=blobs)
+            pipe.sadd(ns_key, checkpoint_ns)
+            for key in (cp_key, idx_key, blobs_key, ns_key):
+                pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """pending writes 저장 (특수 write는 덮어쓰기, 일반 write는 최초 1회만 기록)"""
+        client = await self._client()
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        key = self._writes_key(thread_id, checkpoint_ns, checkpoint_id)
+
+        async with client.pipeline(transaction=True) as pipe:
+            for idx, (channel, value) in enumerate(writes):
+                write_idx = WRITES_IDX_MAP.get(channel, idx)
+                field = f"{task_id}{FIELD_SEP}{write_idx}"
+                packed = _pack(task_id, channel, *self.serde.dumps_typed(value), task_path)
+                if write_idx >= 0:
+                    pipe.hsetnx(key, field, packed)
+                else:
+                    pipe.hset(key, field, packed)
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """스레드의 모든 체크포인트/writes 삭제"""
+        client = await self._client()
+        thread_id = str(thread_id)
+        namespaces = [_decode(ns) for ns in await client.smembers(self._ns_key(thread_id))]
+        keys: list[str] = [self._ns_key(thread_id)]
+        for checkpoint_ns in namespaces:
+            ids = [_decode(i) for i in await client.zrange(self._idx_key(thread_id, checkpoint_ns), 0, -1)]
+            keys.extend(
+                [
+                    self._cp_key(thread_id, checkpoint_ns),
+                    self._idx_key(thread_id, checkpoint_ns),
+                    self._blobs_key(thread_id, checkpoint_ns),
+                ]
+            )
+            keys.extend(self._writes_key(thread_id, checkpoint_ns, i) for i in ids)
+        await client.delete(*keys)
+
+    # ==================== Sync API (다른 스레드에서 호출 시 이벤트 루프로 위임) ====================
+
+    def _run_sync(self, coro: Any) -> Any:
+        """동기 호출을 체크포인터 이벤트 루프로 위임"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if self._loop is None or running is self._loop or self._loop.is_closed():
+            coro.close()
+            raise NotImplementedError(
+                "RedisCheckpointSaver supports async usage only (use astream/ainvoke/aget_state)"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return self._run_sync(self.aget_tuple(config))
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        async def _collect() -> list[CheckpointTuple]:
+            return [t async for t in self.alist(config, filter=filter, before=before, limit=limit)]
+
+        yield from self._run_sync(_collect())
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self._run_sync(self.aput(config, checkpoint, metadata, new_versions))
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        return self._run_sync(self.aput_writes(config, writes, task_id, task_path))
+
+    def delete_thread(self, thread_id: str) -> None:
+        return self._run_sync(self.adelete_thread(thread_id))
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        """채널 버전 (InMemorySaver와 동일한 사전순 정렬 가능 문자열)"""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
@@ -5,18 +5,22 @@ LangGraph의 RedisSaver를 활용하여 에이전트의 상태를 저장하고 
 이를 통해 에이전트가 중단되었다가 다시 시작할 때 이전 상태에서 재개할 수 있습니다.
 """
 
-import json
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, AsyncIterator, Callable, Iterable, Optional
 from contextlib import asynccontextmanager
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
 
 from core.config import settings
+from core.memory.codec import CodecError, RedisCodec, get_default_codec
 
 logger = logging.getLogger(__name__)
 
+# SCAN 배치 크기 힌트 (flush_pattern 삭제 배치 크기 겸용)
+SCAN_BATCH_SIZE = 500
+
 
 class RedisStore:
     """
@@ -25,14 +29,16 @@ class RedisStore:
     LangGraph Checkpoint 및 일반 캐싱을 모두 지원합니다.
     """
     
-    def __init__(self, redis_url: str | None = None) -> None:
+    def __init__(self, redis_url: str | None = None, codec: RedisCodec | None = None) -> None:
         """
         RedisStore 초기화
         
         Args:
             redis_url: Redis 연결 URL (None이면 설정에서 로드)
+            codec: get_json/set_json 값 코덱 (None이면 설정 기반 기본 코덱)
         """
         self.redis_url = redis_url or settings.redis_url
+        self.codec = codec or get_default_codec()
         self._client: Redis | None = None
         self._pool: redis.ConnectionPool | None = None
     
@@ -93,6 +99,45 @@ class RedisStore:
         expire_time = ttl or settings.redis_ttl
         await self.client.setex(key, expire_time, value)
     
+    async def set_if_absent(
+        self,
+        key: str,
+        value: bytes | str,
+        ttl: int | None = None,
+    ) -> bool:
+        """
+        키가 없을 때만 저장 (SET NX EX, 원자적)
+        
+        Args:
+            key: Redis 키
+            value: 저장할 값
+            ttl: TTL (초), None이면 기본값 사용
+            
+        Returns:
+            저장 여부 (이미 존재하면 False)
+        """
+        return bool(await self.client.set(key, value, nx=True, ex=ttl or settings.redis_ttl))
+    
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True) -> AsyncIterator[Any]:
+        """
+        파이프라인 컨텍스트 (블록 종료 시 쌓인 명령을 1회 왕복으로 실행)
+        
+        결과가 필요하면 블록 안에서 직접 `await pipe.execute()`를 호출합니다.
+        
+        사용 예:
+            async with store.pipeline() as pipe:
+                pipe.setex("a", 60, b"1")
+                pipe.zadd("idx", {"a": 1})
+        
+        Args:
+            transaction: MULTI/EXEC로 묶을지 여부
+        """
+        async with self.client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+            if pipe.command_stack:
+                await pipe.execute()
+    
     async def delete(self, key: str) -> None:
         """키 삭제"""
         await self.client.delete(key)
@@ -115,8 +160,8 @@ class RedisStore:
         if value is None:
             return None
         try:
-            return json.loads(value.decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return self.codec.decode(value)
+        except CodecError as e:
             logger.error(f"Failed to decode JSON for key {key}: {e}")
             return None
     
@@ -127,19 +172,187 @@ class RedisStore:
         ttl: int | None = None,
     ) -> None:
         """
-        JSON 형태로 값 저장
+        JSON 형태로 값 저장 (코덱: compact JSON/msgpack, 임계값 초과 시 압축)
         
         Args:
             key: Redis 키
             value: 저장할 딕셔너리
             ttl: TTL (초)
         """
-        json_str = json.dumps(value, ensure_ascii=False)
-        await self.set(key, json_str.encode("utf-8"), ttl)
+        await self.set(key, self.codec.encode(value), ttl)
+    
+    async def mset_json(
+        self,
+        mapping: dict[str, dict[str, Any]],
+        ttl: int | None = None,
+    ) -> None:
+        """
+        여러 키를 JSON 형태로 저장 (파이프라인 SETEX, 1회 왕복)
+        
+        Args:
+            mapping: 키 → 저장할 딕셔너리
+            ttl: TTL (초), None이면 기본값 사용
+        """
+        if not mapping:
+            return
+        expire_time = ttl or settings.redis_ttl
+        async with self.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.setex(key, expire_time, self.codec.encode(value))
+    
+    async def mget_json(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        """
+        여러 키를 MGET 한 번으로 조회하여 JSON 디코딩
+        
+        Args:
+            keys: Redis 키 목록
+            
+        Returns:
+            keys와 같은 순서의 딕셔너리 (없거나 디코딩 실패 시 None)
+        """
+        if not keys:
+            return []
+        values = await self.client.mget(keys)
+        results: list[dict[str, Any] | None] = []
+        for key, value in zip(keys, values):
+            if value is None:
+                results.append(None)
+                continue
+            try:
+                results.append(self.codec.decode(value))
+            except CodecError as e:
+                logger.error(f"Failed to decode JSON for key {key}: {e}")
+                results.append(None)
+        return results
+    
+    async def index_add(
+        self,
+        index_key: str,
+        member: str,
+        score: float | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        """
+        Sorted Set 인덱스에 멤버 추가 (score 기본값: 현재 시각)
+        
+        Args:
+            index_key: 인덱스 키
+            member: 멤버 (thread_id, checkpoint_id 등)
+            score: 정렬 점수 (타임스탬프)
+            ttl: 인덱스 TTL (초)
+        """
+        async with self.pipeline(transaction=False) as pipe:
+            pipe.zadd(index_key, {member: score if score is not None else time.time()})
+            pipe.expire(index_key, ttl or settings.redis_ttl)
+    
+    async def index_remove(self, index_key: str, *members: str) -> None:
+        """Sorted Set 인덱스에서 멤버 제거"""
+        if members:
+            await self.client.zrem(index_key, *members)
+    
+    async def index_members(
+        self,
+        index_key: str,
+        limit: int | None = None,
+        min_score: float | None = None,
+    ) -> list[str]:
+        """
+        Sorted Set 인덱스 멤버 조회 (score 내림차순 = 최신순)
+        
+        Args:
+            index_key: 인덱스 키
+            limit: 최대 조회 개수
+            min_score: 이 점수 미만 멤버는 제거 후 조회 (만료된 항목 정리)
+            
+        Returns:
+            멤버 목록
+        """
+        if min_score is not None:
+            await self.client.zremrangebyscore(index_key, "-inf", f"({min_score}")
+        end = (limit - 1) if limit else -1
+        members = await self.client.zrevrange(index_key, 0, end)
+        return [m.decode("utf-8") if isinstance(m, bytes) else m for m in members]
+    
+    async def backfill_index(
+        self,
+        marker_key: str,
+        patterns: Iterable[str],
+        to_entries: Callable[[str, int], Iterable[tuple[str, str, float]]],
+        ttl: int | None = None,
+    ) -> int:
+        """
+        인덱스 도입 이전 키를 SCAN으로 찾아 Sorted Set 인덱스에 1회 백필
+        
+        완료 시 marker_key를 기록하여 이후 호출은 EXISTS 1회로 끝납니다.
+        동시에 여러 워커가 실행해도 ZADD라 결과는 동일합니다.
+        
+        Args:
+            marker_key: 백필 완료 마커 키
+            patterns: SCAN 패턴 목록
+            to_entries: (키, 남은 TTL 초, 만료 없음은 -1) → (인덱스 키, 멤버, 점수) 목록
+            ttl: 인덱스 TTL (초)
+            
+        Returns:
+            백필한 인덱스 항목 수 (이미 완료된 경우 0)
+        """
+        if await self.client.exists(marker_key):
+            return 0
+        added = 0
+        for pattern in patterns:
+            batch: list[str] = []
+            async for key in self.scan_keys(pattern):
+                batch.append(key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    added += await self._backfill_batch(batch, to_entries, ttl)
+                    batch = []
+            if batch:
+                added += await self._backfill_batch(batch, to_entries, ttl)
+        await self.client.set(marker_key, b"1")
+        logger.info(f"Index backfill done: {marker_key} ({added} entries)")
+        return added
+    
+    async def _backfill_batch(
+        self,
+        keys: list[str],
+        to_entries: Callable[[str, int], Iterable[tuple[str, str, float]]],
+        ttl: int | None,
+    ) -> int:
+        async with self.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.ttl(key)
+            key_ttls = await pipe.execute()
+        entries = [
+            entry
+            for key, key_ttl in zip(keys, key_ttls)
+            if key_ttl != -2  # SCAN 이후 만료/삭제된 키
+            for entry in to_entries(key, key_ttl)
+        ]
+        async with self.pipeline(transaction=False) as pipe:
+            for index_key, member, score in entries:
+                pipe.zadd(index_key, {member: score})
+            for index_key in {index_key for index_key, _, _ in entries}:
+                pipe.expire(index_key, ttl or settings.redis_ttl)
+        return len(entries)
+    
+    async def scan_keys(self, pattern: str = "*", count: int = SCAN_BATCH_SIZE) -> AsyncIterator[str]:
+        """
+        SCAN 기반 키 순회 (KEYS와 달리 Redis를 블로킹하지 않음)
+        
+        Args:
+            pattern: 검색 패턴
+            count: SCAN 배치 크기 힌트
+            
+        Yields:
+            키
+        """
+        async for key in self.client.scan_iter(match=pattern, count=count):
+            yield key.decode("utf-8") if isinstance(key, bytes) else key
     
     async def get_keys(self, pattern: str = "*") -> list[str]:
         """
-        패턴에 매칭되는 키 목록 조회
+        패턴에 매칭되는 키 목록 조회 (SCAN 기반, 관리/마이그레이션 용도)
+        
+        조회 경로에서는 인덱스(index_members)를 사용하세요.
         
         Args:
             pattern: 검색 패턴 (예: "checkpoint:*")
@@ -147,12 +360,11 @@ class RedisStore:
         Returns:
             키 목록
         """
-        keys = await self.client.keys(pattern)
-        return [key.decode("utf-8") for key in keys]
+        return [key async for key in self.scan_keys(pattern)]
     
     async def flush_pattern(self, pattern: str) -> int:
         """
-        패턴에 매칭되는 모든 키 삭제
+        패턴에 매칭되는 모든 키 삭제 (SCAN 배치 단위 UNLINK)
         
         Args:
             pattern: 삭제할 키 패턴
@@ -160,10 +372,24 @@ class RedisStore:
         Returns:
             삭제된 키 개수
         """
-        keys = await self.get_keys(pattern)
-        if keys:
-            return await self.client.delete(*keys)
-        return 0
+        deleted = 0
+        batch: list[str] = []
+        async for key in self.scan_keys(pattern):
+            batch.append(key)
+            if len(batch) >= SCAN_BATCH_SIZE:
+                deleted += await self.client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.client.unlink(*batch)
+        return deleted
+
+
+def _checkpoint_score(checkpoint_id: str) -> float:
+    """체크포인트 인덱스 score (ms 타임스탬프 ID는 그대로, 그 외는 현재 시각)"""
+    try:
+        return float(checkpoint_id)
+    except ValueError:
+        return time.time() * 1000
 
 
 class LangGraphCheckpointer:
@@ -183,6 +409,7 @@ class LangGraphCheckpointer:
         """
         self.redis_store = redis_store
         self.checkpoint_prefix = "langgraph:checkpoint"
+        self.index_prefix = "langgraph:checkpoint-index"
         self.ttl = settings.redis_checkpoint_ttl
     
     def _make_key(self, thread_id: str, checkpoint_id: str | None = None) -> str:
@@ -200,6 +427,27 @@ class LangGraphCheckpointer:
             return f"{self.checkpoint_prefix}:{thread_id}:{checkpoint_id}"
         return f"{self.checkpoint_prefix}:{thread_id}:latest"
     
+    def _make_index_key(self, thread_id: str) -> str:
+        """스레드별 체크포인트 인덱스 키 (Sorted Set, score = 타임스탬프)"""
+        return f"{self.index_prefix}:{thread_id}"
+    
+    async def _backfill_index(self) -> None:
+        """인덱스 도입 이전 체크포인트를 스레드별 인덱스에 1회 백필 (완료 마커 이후 생략)"""
+        prefix = f"{self.checkpoint_prefix}:"
+        
+        def to_entries(key: str, _ttl: int) -> list[tuple[str, str, float]]:
+            thread_id, _, checkpoint_id = key[len(prefix):].rpartition(":")
+            if not thread_id or checkpoint_id == "latest":
+                return []
+            return [(self._make_index_key(thread_id), checkpoint_id, _checkpoint_score(checkpoint_id))]
+        
+        await self.redis_store.backfill_index(
+            f"{self.index_prefix}-backfilled",
+            [f"{prefix}*"],
+            to_entries,
+            ttl=self.ttl,
+        )
+    
     async def save_checkpoint(
         self,
         thread_id: str,
@@ -218,7 +466,6 @@ class LangGraphCheckpointer:
             저장된 checkpoint_id
         """
         if checkpoint_id is None:
-            import time
             checkpoint_id = str(int(time.time() * 1000))
         
         key = self._make_key(thread_id, checkpoint_id)
@@ -232,11 +479,13 @@ class LangGraphCheckpointer:
             "data": checkpoint_data,
         }
         
-        # 체크포인트 저장
-        await self.redis_store.set_json(key, data_with_meta, self.ttl)
-        
-        # latest 포인터 업데이트
-        await self.redis_store.set(latest_key, checkpoint_id.encode(), self.ttl)
+        # 체크포인트 + latest 포인터 + 스레드 인덱스 (list_checkpoints용) 1회 왕복 저장
+        index_key = self._make_index_key(thread_id)
+        async with self.redis_store.pipeline() as pipe:
+            pipe.setex(key, self.ttl, self.redis_store.codec.encode(data_with_meta))
+            pipe.setex(latest_key, self.ttl, checkpoint_id.encode())
+            pipe.zadd(index_key, {checkpoint_id: _checkpoint_score(checkpoint_id)})
+            pipe.expire(index_key, self.ttl)
         
         logger.info(f"Checkpoint saved: {thread_id}/{checkpoint_id}")
         return checkpoint_id
@@ -285,20 +534,27 @@ class LangGraphCheckpointer:
         Returns:
             체크포인트 메타데이터 리스트
         """
-        pattern = f"{self.checkpoint_prefix}:{thread_id}:*"
-        keys = await self.redis_store.get_keys(pattern)
+        await self._backfill_index()
+        index_key = self._make_index_key(thread_id)
+        checkpoint_ids = await self.redis_store.index_members(index_key)
+        
+        keys = [self._make_key(thread_id, checkpoint_id) for checkpoint_id in checkpoint_ids]
+        records = await self.redis_store.mget_json(keys)
         
         checkpoints = []
-        for key in keys:
-            if key.endswith(":latest"):
+        expired = []
+        for checkpoint_id, data in zip(checkpoint_ids, records):
+            if not data:
+                expired.append(checkpoint_id)
                 continue
-            data = await self.redis_store.get_json(key)
-            if data:
-                checkpoints.append({
-                    "checkpoint_id": data["checkpoint_id"],
-                    "thread_id": data["thread_id"],
-                    "timestamp": data["timestamp"],
-                })
+            checkpoints.append({
+                "checkpoint_id": data["checkpoint_id"],
+                "thread_id": data["thread_id"],
+                "timestamp": data["timestamp"],
+            })
+        
+        # TTL 만료된 체크포인트는 인덱스에서 정리
+        await self.redis_store.index_remove(index_key, *expired)
         
         # 타임스탬프 기준 정렬
         checkpoints.sort(key=lambda x: x["timestamp"], reverse=True)
@@ -323,11 +579,13 @@ class LangGraphCheckpointer:
             # 스레드의 모든 체크포인트 삭제
             pattern = f"{self.checkpoint_prefix}:{thread_id}:*"
             deleted = await self.redis_store.flush_pattern(pattern)
+            await self.redis_store.delete(self._make_index_key(thread_id))
             logger.info(f"Deleted {deleted} checkpoints for thread: {thread_id}")
             return deleted > 0
         
         key = self._make_key(thread_id, checkpoint_id)
         await self.redis_store.delete(key)
+        await self.redis_store.index_remove(self._make_index_key(thread_id), checkpoint_id)
         logger.info(f"Checkpoint deleted: {thread_id}/{checkpoint_id}")
         return True
 
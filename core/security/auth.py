@@ -3,9 +3,14 @@ Authentication Module
 
 JWT 기반 인증 시스템을 구현합니다.
 dwp_backend에서 발행한 JWT를 검증하고 사용자 정보를 추출합니다.
+검증된 토큰은 해시 키 LRU 캐시에 exp 시각까지 보관하여 반복 요청(SSE 재연결, 폴링)의 서명 검증을 생략합니다.
 """
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -50,12 +55,15 @@ class AuthService:
     인증 서비스 클래스
     
     JWT 생성, 검증 및 사용자 정보 추출을 담당합니다.
+    검증 결과는 토큰 SHA-256 해시 키로 캐시 (jwt_verify_cache_enabled, jwt_verify_cache_size).
     """
     
     def __init__(
         self,
         secret_key: str | None = None,
         algorithm: str | None = None,
+        cache_enabled: bool | None = None,
+        cache_size: int | None = None,
     ) -> None:
         """
         AuthService 초기화
@@ -63,9 +71,20 @@ class AuthService:
         Args:
             secret_key: JWT 서명 키 (None이면 설정에서 로드, dwp_backend와 동일해야 함)
             algorithm: JWT 알고리즘
+            cache_enabled: 검증 캐시 사용 여부 (None이면 jwt_verify_cache_enabled)
+            cache_size: 검증 캐시 최대 항목 수 (None이면 jwt_verify_cache_size)
         """
         self.secret_key = secret_key or settings.secret_key
         self.algorithm = algorithm or settings.algorithm
+        self.cache_enabled = (
+            settings.jwt_verify_cache_enabled if cache_enabled is None else cache_enabled
+        )
+        self.cache_size = cache_size or settings.jwt_verify_cache_size
+        # sha256(token) → (payload, 만료 시각 Unix timestamp)
+        self._cache: OrderedDict[bytes, tuple[TokenPayload, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def create_access_token(
         self,
@@ -118,6 +137,7 @@ class AuthService:
         
         jwt.decode()가 자동으로 exp 클레임을 검증하므로,
         추가적인 만료 확인 로직은 필요하지 않습니다.
+        캐시 적중 시 서명 검증을 생략하며, 캐시 항목은 exp 시각 이후 사용하지 않습니다.
         
         Args:
             token: JWT 토큰 문자열
@@ -125,6 +145,36 @@ class AuthService:
         Returns:
             TokenPayload 또는 None (검증 실패 시)
         """
+        if not self.cache_enabled:
+            return self._decode_token(token)
+        
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        now = time.time()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                if now < cached[1]:
+                    self._cache.move_to_end(key)
+                    self.cache_hits += 1
+                    return cached[0]
+                del self._cache[key]
+            self.cache_misses += 1
+        
+        token_data = self._decode_token(token)
+        if token_data is not None:
+            expires_at = (
+                token_data.exp if token_data.exp is not None
+                else now + settings.jwt_verify_cache_max_age_seconds
+            )
+            with self._cache_lock:
+                self._cache[key] = (token_data, expires_at)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return token_data
+    
+    def _decode_token(self, token: str) -> TokenPayload | None:
+        """서명/클레임 검증 (jose jwt.decode + TokenPayload)"""
         try:
             # jwt.decode()는 자동으로 exp, nbf, iat를 검증합니다
             payload = jwt.decode(
@@ -143,6 +193,19 @@ class AuthService:
             logger.error(f"Unexpected error during token verification: {e}")
             return None
     
+    def clear_cache(self) -> None:
+        """검증 캐시 비우기 (키 교체/토큰 폐기 시)"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def cache_stats(self) -> dict[str, int]:
+        """검증 캐시 항목 수 / 적중 / 미스"""
+        return {
+            "entries": len(self._cache),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+        }
+    
     def extract_user_from_token(self, token: str) -> User | None:
         """
         JWT 토큰에서 사용자 정보 추출
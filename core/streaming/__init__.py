@@ -2,6 +2,7 @@
 Streaming Module (Prompt C)
 
 Case Detail 탭용 Agent Stream 저장소 및 이벤트 관리.
+에이전트 SSE 스트림 세션 로그 (재연결 replay).
 """
 
 from core.streaming.case_stream_store import (
@@ -9,9 +10,17 @@ from core.streaming.case_stream_store import (
     CaseStreamStore,
     get_case_stream_store,
 )
+from core.streaming.event_log import (
+    SSEEventLog,
+    StreamSession,
+    get_sse_event_log,
+)
 
 __all__ = [
     "CaseStreamEvent",
     "CaseStreamStore",
     "get_case_stream_store",
+    "SSEEventLog",
+    "StreamSession",
+    "get_sse_event_log",
 ]
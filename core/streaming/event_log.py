@@ -0,0 +1,215 @@
+"""
+SSE Event Log
+
+에이전트 스트림 세션별 SSE 프레임 로그 (in-memory, bounded).
+- 에이전트 실행은 HTTP 연결과 분리된 백그라운드 태스크로 진행되고, 생성된 프레임은 세션 로그에 기록
+- 클라이언트는 로그를 구독: Last-Event-ID 이후 프레임 replay → 이후 실시간 프레임 수신
+- 재연결 시 에이전트를 재실행하지 않음 (중복 LLM/Tool 호출 방지)
+- 완료된 세션은 TTL 경과 후 제거 (재연결 유예)
+- 구독자가 모두 떠난 뒤 유예 시간 내 재연결이 없으면 생산 태스크 취소 (진행 중 LLM/Tool 호출 중단)
+
+프로세스 로컬 저장소이므로 다른 워커로 재연결 시 로그를 찾지 못하면 호출 측이 새 실행으로 폴백.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import AsyncIterator
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_event_id(frame: str | bytes) -> str | None:
+    """SSE 프레임의 id 필드 추출 (format_sse_event 형식: 'id: {id}\\n...')"""
+    if isinstance(frame, bytes):
+        if not frame.startswith(b"id: "):
+            return None
+        end = frame.find(b"\n")
+        return frame[4:end].decode("utf-8") if end > 0 else None
+    if not frame.startswith("id: "):
+        return None
+    end = frame.find("\n")
+    return frame[4:end] if end > 0 else None
+
+
+class StreamSession:
+    """
+    단일 스트림 세션의 프레임 로그
+
+    Args:
+        key: 세션 키 (예: finance:{tenant}:{user}:{thread_id})
+        max_events: 보관 프레임 수 (초과 시 오래된 프레임부터 제거)
+        cancel_grace: 구독자 0명 상태 유지 시 생산 취소까지 유예 (초, None이면 취소 안 함)
+    """
+
+    def __init__(self, key: str, max_events: int, cancel_grace: float | None = None) -> None:
+        self.key = key
+        self.cancel_grace = cancel_grace
+        self._idle_handle: asyncio.TimerHandle | None = None
+        # (seq, event_id, frame)
+        self._frames: deque[tuple[int, str | None, str | bytes]] = deque(maxlen=max_events)
+        self._seq = 0
+        self._changed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.done = False
+        self.finished_at: float | None = None
+        self.subscribers = 0
+
+    def append(self, frame: str | bytes) -> None:
+        """프레임 기록 후 대기 중인 구독자 깨움"""
+        self._seq += 1
+        self._frames.append((self._seq, _parse_event_id(frame), frame))
+        self._notify()
+
+    def close(self) -> None:
+        """생산 종료 표시"""
+        self.done = True
+        self.finished_at = time.monotonic()
+        self._clear_idle_timer()
+        self._notify()
+
+    def _schedule_idle_cancel(self) -> None:
+        """구독자 없음 → 유예 후 생산 취소 예약"""
+        if self.cancel_grace is None or self.done or self.subscribers > 0:
+            return
+        self._clear_idle_timer()
+        loop = asyncio.get_running_loop()
+        self._idle_handle = loop.call_later(self.cancel_grace, self._cancel_if_idle)
+
+    def _clear_idle_timer(self) -> None:
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def _cancel_if_idle(self) -> None:
+        self._idle_handle = None
+        if self.subscribers == 0 and not self.done and self._task is not None and not self._task.done():
+            logger.info(f"Stream session {self.key} has no subscribers, cancelling producer")
+            self._task.cancel()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _cursor_for(self, last_event_id: str | None) -> int:
+        """Last-Event-ID → replay 시작 seq (해당 id가 로그에 없으면 보관된 처음부터)"""
+        if last_event_id:
+            for seq, event_id, _ in self._frames:
+                if event_id == last_event_id:
+                    return seq
+        return self._frames[0][0] - 1 if self._frames else 0
+
+    async def frames(self, last_event_id: str | None = None) -> AsyncIterator[str | bytes]:
+        """
+        Last-Event-ID 이후 프레임 replay 후 실시간 프레임 구독
+
+        생산이 끝나고 모든 프레임을 보낸 시점에 종료.
+        """
+        cursor = self._cursor_for(last_event_id)
+        self.subscribers += 1
+        self._clear_idle_timer()
+        try:
+            while True:
+                changed = self._changed
+                pending = [(seq, frame) for seq, _, frame in self._frames if seq > cursor]
+                for seq, frame in pending:
+                    cursor = seq
+                    yield frame
+                if self.done and cursor >= self._seq:
+                    return
+                if not pending:
+                    await changed.wait()
+        finally:
+            self.subscribers -= 1
+            self._schedule_idle_cancel()
+
+    async def _pump(self, source: AsyncIterator[str | bytes]) -> None:
+        try:
+            async for frame in source:
+                self.append(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Stream session {self.key} producer failed: {e}", exc_info=True)
+        finally:
+            self.close()
+
+
+class SSEEventLog:
+    """
+    스트림 세션 레지스트리
+
+    Args:
+        max_events: 세션당 보관 프레임 수
+        ttl_seconds: 완료된 세션 보관 시간 (재연결 유예)
+        cancel_grace: 구독자 없는 진행 중 세션 취소 유예 (초, None이면 취소 안 함)
+    """
+
+    def __init__(
+        self,
+        max_events: int = 1000,
+        ttl_seconds: int = 300,
+        cancel_grace: float | None = None,
+    ) -> None:
+        self.max_events = max_events
+        self.ttl_seconds = ttl_seconds
+        self.cancel_grace = cancel_grace
+        self._sessions: dict[str, StreamSession] = {}
+
+    def get(self, key: str) -> StreamSession | None:
+        """세션 조회 (만료된 세션은 None)"""
+        self._evict_expired()
+        return self._sessions.get(key)
+
+    def start(self, key: str, source: AsyncIterator[str | bytes]) -> StreamSession:
+        """
+        프레임 생성기를 백그라운드 태스크로 실행하고 세션 로그에 기록
+
+        동일 키의 이전 세션은 새 세션으로 교체 (진행 중이면 생산 태스크 취소).
+        """
+        self._evict_expired()
+        previous = self._sessions.get(key)
+        if previous is not None and previous._task is not None and not previous._task.done():
+            previous._task.cancel()
+        session = StreamSession(key, self.max_events, self.cancel_grace)
+        session._task = asyncio.create_task(session._pump(source))
+        # 첫 구독 전에 연결이 끊긴 경우 대비 (구독 시작 시 해제)
+        session._schedule_idle_cancel()
+        self._sessions[key] = session
+        return session
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            key for key, session in self._sessions.items()
+            if session.done and session.subscribers == 0
+            and session.finished_at is not None and now - session.finished_at > self.ttl_seconds
+        ]
+        for key in expired:
+            del self._sessions[key]
+
+    def stats(self) -> dict[str, int]:
+        """세션 수 / 진행 중 세션 수 / 보관 프레임 수"""
+        return {
+            "sessions": len(self._sessions),
+            "running": sum(1 for s in self._sessions.values() if not s.done),
+            "frames": sum(len(s._frames) for s in self._sessions.values()),
+        }
+
+
+_sse_event_log: SSEEventLog | None = None
+
+
+def get_sse_event_log() -> SSEEventLog:
+    """SSEEventLog 싱글톤 (sse_event_log_max_events, sse_event_log_ttl_seconds, sse_disconnect_grace_seconds)"""
+    global _sse_event_log
+    if _sse_event_log is None:
+        _sse_event_log = SSEEventLog(
+            max_events=settings.sse_event_log_max_events,
+            ttl_seconds=settings.sse_event_log_ttl_seconds,
+            cancel_grace=settings.sse_disconnect_grace_seconds,
+        )
+    return _sse_event_log
@@ -0,0 +1,242 @@
+"""
+Task Supervisor Module
+
+백그라운드 작업(분석 실행, 트리거 에이전트) 감독자입니다.
+- 이름 있는 풀(phase2, phase3, finance-trigger)별 동시 실행 상한 + 대기열 길이 상한
+- 상한 초과 시 우선순위 대기열에 적재 (priority 값이 작을수록 먼저 실행, 동일 우선순위는 FIFO)
+- 대기열까지 가득 차면 TaskPoolSaturatedError → 라우트에서 429 응답
+- 실행 중 태스크 참조 유지 (GC로 인한 태스크 소실 방지), 예외 로깅
+- 앱 종료 시(main.lifespan) 신규 제출 거부 후 대기/실행 중 작업 drain, 타임아웃 초과분은 취소
+
+사용 예:
+    result = get_task_supervisor().submit(
+        POOL_PHASE2, functools.partial(run_job, case_id), name=f"phase2:{run_id}",
+    )
+    # result.status: "started" | "queued"
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+POOL_PHASE2 = "phase2"
+POOL_PHASE3 = "phase3"
+POOL_FINANCE_TRIGGER = "finance-trigger"
+
+TASK_STARTED = "started"
+TASK_QUEUED = "queued"
+
+JobFactory = Callable[[], Awaitable[Any]]
+
+
+class TaskPoolSaturatedError(RuntimeError):
+    """풀의 실행 슬롯과 대기열이 모두 가득 찼거나 종료 중인 경우"""
+
+    def __init__(self, pool: str, reason: str = "saturated") -> None:
+        super().__init__(f"Task pool '{pool}' {reason}")
+        self.pool = pool
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class SubmitResult:
+    """작업 제출 결과"""
+
+    pool: str
+    status: str  # started | queued
+    queue_position: int = 0  # queued일 때 대기열 내 순번 (1부터)
+
+
+@dataclass
+class _PendingJob:
+    factory: JobFactory
+    name: str
+    context: contextvars.Context
+
+
+class TaskPool:
+    """
+    동시 실행 상한 + 우선순위 대기열을 가진 작업 풀
+
+    Args:
+        name: 풀 이름
+        max_concurrency: 동시 실행 상한
+        max_queue: 대기열 길이 상한 (0이면 대기 없이 즉시 거부)
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int) -> None:
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self._running: set[asyncio.Task] = set()
+        self._pending: list[tuple[int, int, _PendingJob]] = []
+        self._seq = itertools.count()
+        self._closed = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    @property
+    def queued(self) -> int:
+        return len(self._pending)
+
+    def submit(self, factory: JobFactory, *, priority: int = 0, name: str | None = None) -> SubmitResult:
+        """
+        작업 제출 (코루틴은 실행 시점에 factory()로 생성 → 거부 시 미실행 코루틴이 남지 않음)
+
+        제출 시점의 contextvars(요청 컨텍스트 등)를 복사해 실행 시 그대로 사용합니다.
+
+        Raises:
+            TaskPoolSaturatedError: 실행 슬롯과 대기열이 가득 찼거나 풀이 종료 중
+        """
+        if self._closed:
+            raise TaskPoolSaturatedError(self.name, "shutting down")
+        job = _PendingJob(factory, name or self.name, contextvars.copy_context())
+        if len(self._running) < self.max_concurrency:
+            self._start(job)
+            return SubmitResult(self.name, TASK_STARTED)
+        if len(self._pending) >= self.max_queue:
+            logger.warning(
+                f"Task pool {self.name} saturated (running={self.running}, queued={self.queued}), reject {job.name}"
+            )
+            raise TaskPoolSaturatedError(self.name)
+        heapq.heappush(self._pending, (priority, next(self._seq), job))
+        self._idle.clear()
+        position = sum(1 for p, _, _ in self._pending if p <= priority)
+        logger.info(f"Task {job.name} queued in {self.name} (position={position})")
+        return SubmitResult(self.name, TASK_QUEUED, position)
+
+    def _start(self, job: _PendingJob) -> None:
+        task = job.context.run(asyncio.ensure_future, self._guard(job))
+        task.set_name(job.name)
+        self._running.add(task)
+        self._idle.clear()
+        task.add_done_callback(self._on_done)
+
+    async def _guard(self, job: _PendingJob) -> None:
+        try:
+            await job.factory()
+        except asyncio.CancelledError:
+            logger.warning(f"Task {job.name} cancelled")
+            raise
+        except Exception:
+            logger.exception(f"Task {job.name} failed in pool {self.name}")
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        while self._pending and len(self._running) < self.max_concurrency:
+            _, _, job = heapq.heappop(self._pending)
+            self._start(job)
+        if not self._running and not self._pending:
+            self._idle.set()
+
+    async def drain(self, timeout: float) -> None:
+        """신규 제출 거부 후 대기/실행 중 작업 완료 대기, 타임아웃 초과 시 남은 작업 폐기·취소"""
+        self._closed = True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Task pool {self.name} drain timed out after {timeout:g}s "
+                f"(running={self.running}, dropped={self.queued})"
+            )
+        self._pending.clear()
+        tasks = list(self._running)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "queued": self.queued,
+            "maxConcurrency": self.max_concurrency,
+            "maxQueue": self.max_queue,
+        }
+
+
+class TaskSupervisor:
+    """이름 있는 TaskPool 묶음 (풀은 최초 제출 시 settings 한도로 생성)"""
+
+    def __init__(self, limits: dict[str, tuple[int, int]] | None = None) -> None:
+        """
+        Args:
+            limits: 풀 이름 → (max_concurrency, max_queue). None이면 settings 기본 풀 한도
+        """
+        self._limits = limits if limits is not None else _default_limits()
+        self._pools: dict[str, TaskPool] = {}
+        self._closed = False
+
+    def pool(self, name: str) -> TaskPool:
+        pool = self._pools.get(name)
+        if pool is None:
+            if name not in self._limits:
+                raise KeyError(f"Unknown task pool: {name}")
+            max_concurrency, max_queue = self._limits[name]
+            pool = self._pools[name] = TaskPool(name, max_concurrency, max_queue)
+        return pool
+
+    def submit(
+        self,
+        pool: str,
+        factory: JobFactory,
+        *,
+        priority: int = 0,
+        name: str | None = None,
+    ) -> SubmitResult:
+        """작업 제출 (TaskPool.submit 참고)"""
+        if self._closed:
+            raise TaskPoolSaturatedError(pool, "shutting down")
+        return self.pool(pool).submit(factory, priority=priority, name=name)
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """모든 풀 drain (앱 종료 시 호출)"""
+        self._closed = True
+        timeout = settings.task_drain_timeout_seconds if timeout is None else timeout
+        await asyncio.gather(*(p.drain(timeout) for p in self._pools.values()))
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+
+def _default_limits() -> dict[str, tuple[int, int]]:
+    return {
+        POOL_PHASE2: (settings.task_phase2_max_concurrency, settings.task_phase2_max_queue),
+        POOL_PHASE3: (settings.task_phase3_max_concurrency, settings.task_phase3_max_queue),
+        POOL_FINANCE_TRIGGER: (
+            settings.task_finance_trigger_max_concurrency,
+            settings.task_finance_trigger_max_queue,
+        ),
+    }
+
+
+# 전역 TaskSupervisor 인스턴스
+_task_supervisor: TaskSupervisor | None = None
+
+
+def get_task_supervisor() -> TaskSupervisor:
+    """TaskSupervisor 인스턴스 반환"""
+    global _task_supervisor
+    if _task_supervisor is None:
+        _task_supervisor = TaskSupervisor()
+    return _task_supervisor
+
+
+async def cleanup_task_supervisor() -> None:
+    """백그라운드 작업 drain (앱 종료 시 호출, 외부 클라이언트/Redis 정리 이전)"""
+    global _task_supervisor
+    if _task_supervisor is not None:
+        await _task_supervisor.drain()
+        _task_supervisor = None
@@ -9,11 +9,11 @@ import logging
 from typing import Annotated, Any, TypedDict
 
 from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
 
 from core.llm import get_llm_client
 from core.llm.prompts import get_system_prompt
+from tools.executor import ToolExecutor
 from tools.integrations.git_tool import GIT_TOOLS
 from tools.integrations.github_tool import GITHUB_TOOLS
 
@@ -43,6 +43,7 @@ class CodeAgent:
         
         # LLM에 도구 바인딩
         self.llm_with_tools = self.llm_client.client.bind_tools(self.tools)
+        self.tool_executor = ToolExecutor(self.tools)
         
         # LangGraph 워크플로우 구성
         self.graph = self._build_graph()
@@ -53,7 +54,7 @@ class CodeAgent:
         
         # 노드 추가
         workflow.add_node("agent", self._agent_node)
-        workflow.add_node("tools", ToolNode(self.tools))
+        workflow.add_node("tools", self._tools_node)
         
         # 엔트리 포인트
         workflow.set_entry_point("agent")
@@ -90,6 +91,11 @@ class CodeAgent:
         
         return {"messages": [response]}
     
+    async def _tools_node(self, state: AgentState) -> dict[str, Any]:
+        """도구 노드: 독립 도구 호출 병렬 실행 (결과는 tool_calls 순서)"""
+        tool_messages = await self.tool_executor.ainvoke(state["messages"][-1].tool_calls)
+        return {"messages": tool_messages}
+    
     def _should_continue(self, state: AgentState) -> str:
         """도구 호출 여부 결정"""
         last_message = state["messages"][-1]
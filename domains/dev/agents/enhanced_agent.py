@@ -17,11 +17,12 @@ from typing import Annotated, Any, TypedDict
 
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
 
 from core.llm import get_llm_client
+from core.llm.context_budget import build_prompt_messages
 from core.llm.prompts import get_system_prompt
+from tools.executor import ToolExecutor
 from tools.integrations.git_tool import GIT_TOOLS
 from tools.integrations.github_tool import GITHUB_TOOLS
 
@@ -104,6 +105,7 @@ class EnhancedCodeAgent:
         
         # LLM에 도구 바인딩
         self.llm_with_tools = self.llm_client.client.bind_tools(self.tools)
+        self.tool_executor = ToolExecutor(self.tools)
         
         # Checkpointer 설정
         self.checkpointer = checkpointer or MemorySaver()
@@ -209,15 +211,13 @@ class EnhancedCodeAgent:
             **context,  # 프론트엔드에서 전달된 context 정보 포함
         }
         
-        system_message = HumanMessage(
-            content=get_system_prompt(
-                domain="dev",
-                context=context_for_prompt,  # dict 형태로 전달하여 activeApp, selectedItemIds 자동 추출
-            )
+        system_prompt = get_system_prompt(
+            domain="dev",
+            context=context_for_prompt,  # dict 형태로 전달하여 activeApp, selectedItemIds 자동 추출
         )
         
-        # LLM 호출
-        response = await self.llm_with_tools.ainvoke([system_message] + messages)
+        # LLM 호출 (누적 메시지는 토큰 예산 내로 축약)
+        response = await self.llm_with_tools.ainvoke(build_prompt_messages(system_prompt, messages))
         
         # Confidence Score 계산
         confidence = self._calculate_confidence(response)
@@ -287,9 +287,8 @@ class EnhancedCodeAgent:
                 "pending_approvals": pending_approvals,
             }
         
-        # ToolNode 실행
-        tool_node = ToolNode(self.tools)
-        result = await tool_node.ainvoke({"messages": [last_message]})
+        # 도구 실행 (독립 호출 병렬, 결과는 tool_calls 순서)
+        tool_messages = await self.tool_executor.ainvoke(last_message.tool_calls)
         
         # 실행 로그 업데이트
         for log in execution_logs:
@@ -298,7 +297,7 @@ class EnhancedCodeAgent:
                 # 결과는 ToolMessage에서 추출
         
         return {
-            "messages": result["messages"],
+            "messages": tool_messages,
             "execution_logs": execution_logs,
         }
     
@@ -450,8 +449,10 @@ _enhanced_agent: EnhancedCodeAgent | None = None
 
 
 def get_enhanced_agent(checkpointer=None) -> EnhancedCodeAgent:
-    """EnhancedCodeAgent 인스턴스 반환"""
+    """EnhancedCodeAgent 인스턴스 반환 (checkpointer 미지정 시 get_dev_checkpointer 사용)"""
     global _enhanced_agent
     if _enhanced_agent is None:
-        _enhanced_agent = EnhancedCodeAgent(checkpointer=checkpointer)
+        from core.memory.checkpointer_factory import get_dev_checkpointer
+        cp = checkpointer if checkpointer is not None else get_dev_checkpointer()
+        _enhanced_agent = EnhancedCodeAgent(checkpointer=cp)
     return _enhanced_agent
@@ -14,15 +14,17 @@ from typing import Annotated, Any, TypedDict
 
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
 from langgraph.types import interrupt
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
 
 from core.llm import get_llm_client
+from core.llm.context_budget import build_prompt_messages
 from core.llm.prompts import get_system_prompt
+from tools.executor import ToolExecutor
 from tools.synapse_finance_tool import (
     FINANCE_TOOLS,
     FINANCE_HITL_TOOLS,
+    FINANCE_WRITE_TOOLS,
     get_case,
     search_documents,
     get_open_items,
@@ -81,6 +83,7 @@ class FinanceAgent:
         self.llm_client = get_llm_client()
         self.tools = FINANCE_TOOLS
         self.llm_with_tools = self.llm_client.client.bind_tools(self.tools)
+        self.tool_executor = ToolExecutor(self.tools, serial_tools=FINANCE_WRITE_TOOLS)
         self.checkpointer = checkpointer or MemorySaver()
         self.graph = self._build_graph()
     
@@ -236,9 +239,9 @@ class FinanceAgent:
         단계별 조사 및 조치 계획을 수립하세요. 각 단계에 설명과 신뢰도를 제공하세요.
         """
         
-        messages = [HumanMessage(content=system_prompt + "\n\n" + planning_prompt)]
+        messages = build_prompt_messages(system_prompt, [HumanMessage(content=planning_prompt)])
         response = await self.llm_client.client.ainvoke(messages)
-        
+
         plan_steps = self._parse_plan(response.content)
         evidence_refs = [
             {"type": e.get("type"), "source": e.get("source"), "ref": e.get("ref")}
@@ -269,11 +272,12 @@ class FinanceAgent:
             **(state.get("context") or {}),
         }
         
-        system_message = HumanMessage(
-            content=get_system_prompt(domain="finance", context=context)
+        # 시스템 프롬프트 prefix 고정 + 누적 메시지(도구 raw JSON 등) 토큰 예산 내 축약
+        messages = build_prompt_messages(
+            get_system_prompt(domain="finance", context=context),
+            state["messages"],
         )
-        messages = [system_message] + state["messages"]
-        
+
         response = await self.llm_with_tools.ainvoke(messages)
         
         current_step_id = state.get("current_step_id")
@@ -355,23 +359,14 @@ class FinanceAgent:
             idx: approval_results.get(approval_req["requestId"], False)
             for idx, approval_req in pending_approvals
         }
-        tool_node = ToolNode(self.tools)
         tool_calls_to_run = [
             tc for i, tc in enumerate(last_message.tool_calls)
             if tc.get("name") not in self.APPROVAL_REQUIRED_TOOLS
             or approved_by_idx.get(i, False)
         ]
         
-        if tool_calls_to_run:
-            from langchain_core.messages import AIMessageChunk
-            msg_to_run = AIMessageChunk(
-                content="",
-                tool_calls=tool_calls_to_run,
-            ) if hasattr(AIMessageChunk, "tool_calls") else last_message
-            result = await tool_node.ainvoke({"messages": [msg_to_run]})
-            executed_messages = result["messages"]
-        else:
-            executed_messages = []
+        # 읽기 도구 병렬, 쓰기 도구 직렬 실행 (결과는 tool_calls_to_run 순서)
+        executed_messages = await self.tool_executor.ainvoke(tool_calls_to_run)
         
         # tool_calls 순서대로 ToolMessage 구성 (실행 결과 또는 거절 메시지)
         exec_idx = 0
@@ -12,8 +12,14 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 
 from core.config import settings
+from api.route_access import public_route
 from api.middleware import setup_middlewares
 from core.memory.redis_store import get_redis_store, cleanup_redis
+from core.memory.hitl_manager import cleanup_hitl_manager
+from core.task_supervisor import cleanup_task_supervisor
+from core.analysis.worker_pool import cleanup_analysis_workers
+from tools.integrations.git_cache import cleanup_git_cache
+from tools.integrations.github_tool import cleanup_github_client
 
 # 로깅 설정
 logging.basicConfig(
@@ -46,6 +52,12 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down application")
+    # 백그라운드 분석/트리거 작업 drain (콜백·Redis 사용 → 다른 리소스 정리 이전)
+    await cleanup_task_supervisor()
+    await cleanup_analysis_workers()
+    await cleanup_hitl_manager()
+    await cleanup_git_cache()
+    await cleanup_github_client()
     await cleanup_redis()
 
 
@@ -67,23 +79,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# API 라우터 임포트 (stream_app 생성에 필요)
+# API 라우터 임포트
 from api.routes.agents import router as agents_router
 from api.routes.agents_enhanced import router as agents_enhanced_router
 from api.routes.aura_backend import router as aura_backend_router
 from api.routes.aura_analysis_runs import router as aura_analysis_runs_router
-from api.routes.aura_cases import router as aura_cases_router, stream_only_router
+from api.routes.aura_cases import router as aura_cases_router
 from api.routes.finance_agent import router as finance_agent_router
 from api.routes.triggers import router as triggers_router
 from api.routes.aura_internal import router as aura_internal_router
 
-# BaseHTTPMiddleware 미경유 스트림 전용 앱 (스트림 취소 방지)
-# CORS 미들웨어 제거 — CORSMiddleware도 BaseHTTPMiddleware라 스트림을 취소함. BE→Aura는 서버 간 호출이라 CORS 불필요.
-stream_app = FastAPI()
-stream_app.include_router(stream_only_router)
-
-# 커스텀 미들웨어 설정 (스트림 경로는 stream_app으로 바이패스)
-setup_middlewares(app, stream_app=stream_app)
+# 커스텀 미들웨어 설정 (raw ASGI 단일 미들웨어, 스트림 경로 포함)
+setup_middlewares(app)
 
 
 @app.exception_handler(RequestValidationError)
@@ -113,6 +120,7 @@ app.include_router(aura_internal_router)  # Phase3: internal trigger
 
 
 @app.get("/")
+@public_route
 async def root() -> dict[str, str]:
     """
     루트 엔드포인트
@@ -128,6 +136,7 @@ async def root() -> dict[str, str]:
 
 
 @app.get("/health")
+@public_route
 async def health_check() -> dict[str, str]:
     """
     헬스체크 엔드포인트
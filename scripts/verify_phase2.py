@@ -39,12 +39,7 @@ def test_imports() -> bool:
         print("  ✓ Security modules imported")
         
         # API modules
-        from api.middleware import (
-            AuthMiddleware,
-            TenantMiddleware,
-            RequestLoggingMiddleware,
-            ErrorHandlingMiddleware,
-        )
+        from api.middleware import RequestContextMiddleware, setup_middlewares
         print("  ✓ API middleware imported")
         
         from api.dependencies import (
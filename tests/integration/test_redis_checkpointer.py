@@ -0,0 +1,79 @@
+"""
+RedisCheckpointSaver 통합 테스트
+
+체크포인트 저장/조회, pending writes, HITL interrupt → 다른 인스턴스에서 resume 검증
+
+실행 시 Redis 필요 (REDIS_URL, 미연결 시 스킵)
+"""
+
+import operator
+import uuid
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.graph import END, StateGraph
+from langgraph.types import Command, interrupt
+
+from core.memory.redis_checkpointer import RedisCheckpointSaver
+from core.memory.redis_store import RedisStore
+
+
+class _State(TypedDict):
+    steps: Annotated[list, operator.add]
+
+
+def _build_graph(checkpointer):
+    """승인 노드(interrupt) 포함 그래프"""
+    def propose(state):
+        return {"steps": ["propose"]}
+
+    def approve(state):
+        decision = interrupt({"action": "approve"})
+        return {"steps": [f"approved:{decision['approved']}"]}
+
+    builder = StateGraph(_State)
+    builder.add_node("propose", propose)
+    builder.add_node("approve", approve)
+    builder.set_entry_point("propose")
+    builder.add_edge("propose", "approve")
+    builder.add_edge("approve", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+@pytest.fixture
+async def redis_store():
+    store = RedisStore()
+    await store.connect()
+    try:
+        await store.client.ping()
+    except Exception:
+        await store.disconnect()
+        pytest.skip("Redis not available")
+    yield store
+    await store.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_interrupt_resume_across_saver_instances(redis_store):
+    """interrupt 후 별도 saver 인스턴스(다른 워커 가정)에서 resume"""
+    prefix = f"test:saver:{uuid.uuid4().hex[:8]}"
+    config = {"configurable": {"thread_id": "t1"}}
+
+    worker_a = _build_graph(RedisCheckpointSaver(redis_store, key_prefix=prefix, ttl=60))
+    await worker_a.ainvoke({"steps": []}, config)
+
+    saver_b = RedisCheckpointSaver(redis_store, key_prefix=prefix, ttl=60)
+    latest = await saver_b.aget_tuple(config)
+    assert latest is not None
+    assert any(channel == "__interrupt__" for _, channel, _ in latest.pending_writes)
+
+    worker_b = _build_graph(saver_b)
+    result = await worker_b.ainvoke(Command(resume={"approved": True}), config)
+    assert result["steps"] == ["propose", "approved:True"]
+
+    history = [t async for t in saver_b.alist(config, limit=2)]
+    assert len(history) == 2
+    assert history[0].checkpoint["id"] > history[1].checkpoint["id"]
+
+    await saver_b.adelete_thread("t1")
+    assert await saver_b.aget_tuple(config) is None
@@ -0,0 +1,82 @@
+"""
+분석 워커 프로세스 풀 단위 테스트
+
+워커 프로세스에서 파이프라인 실행, 요청 컨텍스트 전달, 이벤트 순서, 소비자 중단 시 취소 검증
+"""
+
+import asyncio
+from typing import Any, AsyncGenerator
+
+from core.analysis import worker_pool
+from core.analysis.worker_pool import AnalysisWorkerPool
+from core.context import get_request_context, set_request_context
+
+
+async def fake_pipeline(case_id: str, steps: int = 3) -> AsyncGenerator[tuple[str, dict[str, Any]], None]:
+    """워커 프로세스에서 실행되는 테스트 파이프라인 (pid·컨텍스트를 이벤트로 반환)"""
+    import os
+
+    yield ("started", {"caseId": case_id, "pid": os.getpid(), "tenant": get_request_context().get("tenant_id")})
+    for i in range(steps):
+        await asyncio.sleep(0.01)
+        yield ("step", {"index": i})
+    yield ("completed", {"caseId": case_id})
+
+
+async def test_pipeline_runs_in_worker_process_and_streams_events(monkeypatch):
+    """이벤트는 워커 pid에서 순서대로 도착, 요청 컨텍스트 복원, 중단 후에도 다음 작업 정상 처리"""
+    monkeypatch.setitem(worker_pool.ANALYSIS_PIPELINES, "fake", f"{__name__}:fake_pipeline")
+    pool = AnalysisWorkerPool(processes=1, job_timeout=30)
+    pool.start()
+    try:
+        set_request_context(tenant_id="t9", user_id="u1", auth_token=None)
+        events = [e async for e in pool.run("fake", case_id="c1")]
+
+        assert [t for t, _ in events] == ["started", "step", "step", "step", "completed"]
+        started = events[0][1]
+        assert started["pid"] != __import__("os").getpid()
+        assert started["tenant"] == "t9"
+
+        # 소비자 중단 → 워커 작업 취소, 이후 작업 영향 없음
+        stream = pool.run("fake", case_id="c2", steps=1000)
+        assert (await stream.__anext__())[0] == "started"
+        await stream.aclose()
+        events = [e async for e in pool.run("fake", case_id="c3", steps=1)]
+        assert events[-1] == ("completed", {"caseId": "c3"})
+
+        for _ in range(100):
+            if not pool._job_workers:
+                break
+            await asyncio.sleep(0.05)
+        assert pool._job_workers == {}
+    finally:
+        await pool.shutdown(timeout=5)
+
+
+async def test_dead_worker_detected_while_other_worker_streams(monkeypatch):
+    """다른 워커가 이벤트를 계속 보내는 중에도 종료된 워커의 작업은 failed 처리, 새 작업은 살아있는 워커에 할당"""
+    monkeypatch.setitem(worker_pool.ANALYSIS_PIPELINES, "fake", f"{__name__}:fake_pipeline")
+    pool = AnalysisWorkerPool(processes=2, job_timeout=30)
+    pool.start()
+    try:
+        busy = pool.run("fake", case_id="busy", steps=1000)
+        assert (await busy.__anext__())[0] == "started"
+        doomed = pool.run("fake", case_id="doomed", steps=1000)
+        assert (await doomed.__anext__())[0] == "started"
+
+        busy_worker, doomed_worker = pool._job_workers.values()
+        assert busy_worker is not doomed_worker
+        doomed_worker.process.kill()
+        doomed_worker.process.join()
+
+        # 감지 전 제출된 작업도 종료된 워커에는 할당되지 않음
+        extra = pool.run("fake", case_id="extra", steps=1)
+        assert (await extra.__anext__())[0] == "started"
+        await extra.aclose()
+
+        failed = [e async for e in doomed if e[0] == "failed"]
+        assert failed == [("failed", {"error": "analysis worker exited", "stage": "worker"})]
+        assert all(w.process.is_alive() for w in pool._workers)
+        await busy.aclose()
+    finally:
+        await pool.shutdown(timeout=5)
@@ -0,0 +1,39 @@
+"""
+JWT 검증 캐시 단위 테스트
+
+반복 검증 시 캐시 적중, exp 경과 항목 미사용, 캐시 비활성 스위치 검증
+"""
+
+import time
+from datetime import timedelta
+
+from core.security.auth import AuthService
+
+
+def test_verify_token_cache_hits_and_expiry():
+    """동일 토큰 재검증은 캐시 적중, exp 지난 항목은 재검증 후 실패"""
+    auth = AuthService(secret_key="k" * 32, cache_enabled=True)
+    token = auth.create_access_token({"sub": "u1", "tenant_id": "t1"})
+
+    first = auth.verify_token(token)
+    second = auth.verify_token(token)
+    assert first is not None and second is first
+    assert auth.cache_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    assert auth.verify_token(token + "x") is None
+    assert auth.cache_stats()["entries"] == 1
+
+    expired = auth.create_access_token({"sub": "u2"}, expires_delta=timedelta(seconds=1))
+    assert auth.verify_token(expired) is not None
+    time.sleep(2.1)
+    assert auth.verify_token(expired) is None
+
+
+def test_verify_token_cache_disabled():
+    """캐시 비활성 시 매번 검증"""
+    auth = AuthService(secret_key="k" * 32, cache_enabled=False)
+    token = auth.create_access_token({"sub": "u1"})
+
+    assert auth.verify_token(token).user_id == "u1"
+    assert auth.verify_token(token).user_id == "u1"
+    assert auth.cache_stats() == {"entries": 0, "hits": 0, "misses": 0}
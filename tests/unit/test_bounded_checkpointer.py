@@ -0,0 +1,108 @@
+"""
+BoundedMemorySaver 단위 테스트
+
+중간 체크포인트 정리, LRU/TTL 스레드 제거, HITL 대기 스레드 보호 검증
+"""
+
+import operator
+import time
+from typing import Annotated, TypedDict
+
+from langgraph.graph import END, StateGraph
+from langgraph.types import Command, interrupt
+
+from core.memory.bounded_checkpointer import BoundedMemorySaver
+
+
+class _State(TypedDict):
+    steps: Annotated[list, operator.add]
+
+
+def _build_graph(checkpointer, with_interrupt: bool = False):
+    """3단계 노드 그래프 (옵션: 두 번째 노드에서 interrupt)"""
+    def step_a(state):
+        return {"steps": ["a"]}
+
+    def step_b(state):
+        if with_interrupt:
+            interrupt({"action": "approve"})
+        return {"steps": ["b"]}
+
+    def step_c(state):
+        return {"steps": ["c"]}
+
+    builder = StateGraph(_State)
+    builder.add_node("a", step_a)
+    builder.add_node("b", step_b)
+    builder.add_node("c", step_c)
+    builder.set_entry_point("a")
+    builder.add_edge("a", "b")
+    builder.add_edge("b", "c")
+    builder.add_edge("c", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def test_prunes_intermediate_checkpoints_and_keeps_state():
+    """최근 N개 체크포인트만 보관, 최종 상태는 유지"""
+    saver = BoundedMemorySaver(max_threads=10, thread_ttl=3600, keep_checkpoints=2)
+    graph = _build_graph(saver)
+
+    graph.invoke({"steps": []}, _config("t1"))
+
+    assert saver.stats()["checkpoints"] == 2
+    assert saver.pruned_checkpoints > 0
+    assert graph.get_state(_config("t1")).values["steps"] == ["a", "b", "c"]
+    assert saver.stats()["bytes"] > 0
+
+
+def test_lru_eviction_skips_interrupted_thread():
+    """스레드 수 초과 시 LRU 제거, HITL 대기 스레드는 보호 후 재개 가능"""
+    saver = BoundedMemorySaver(max_threads=2, thread_ttl=3600, keep_checkpoints=2)
+    hitl_graph = _build_graph(saver, with_interrupt=True)
+    graph = _build_graph(saver)
+
+    hitl_graph.invoke({"steps": []}, _config("hitl"))
+    for i in range(3):
+        graph.invoke({"steps": []}, _config(f"t{i}"))
+
+    stats = saver.stats()
+    assert stats["threads"] == 2
+    assert stats["evictions"] == 2
+    assert graph.get_state(_config("t0")).values == {}
+
+    result = hitl_graph.invoke(Command(resume={"approved": True}), _config("hitl"))
+    assert result["steps"] == ["a", "b", "c"]
+
+
+def test_ttl_eviction():
+    """유휴 TTL 만료 스레드 제거"""
+    saver = BoundedMemorySaver(max_threads=10, thread_ttl=0.01, keep_checkpoints=1)
+    graph = _build_graph(saver)
+    graph.invoke({"steps": []}, _config("old"))
+    time.sleep(0.02)
+
+    assert saver.evict_expired() == 1
+    assert saver.stats()["threads"] == 0
+
+
+def test_ttl_eviction_keeps_interrupted_thread_until_interrupted_ttl():
+    """유휴 TTL이 지나도 HITL 대기 스레드는 유지되어 재개 가능, interrupted_ttl 초과 시 제거"""
+    saver = BoundedMemorySaver(max_threads=10, thread_ttl=0.01, interrupted_ttl=0.2, keep_checkpoints=2)
+    hitl_graph = _build_graph(saver, with_interrupt=True)
+    graph = _build_graph(saver)
+    hitl_graph.invoke({"steps": []}, _config("hitl"))
+    graph.invoke({"steps": []}, _config("done"))
+    time.sleep(0.02)
+
+    assert saver.evict_expired() == 1
+    result = hitl_graph.invoke(Command(resume={"approved": True}), _config("hitl"))
+    assert result["steps"] == ["a", "b", "c"]
+
+    hitl_graph.invoke({"steps": []}, _config("stale"))
+    time.sleep(0.25)
+    saver.evict_expired()
+    assert saver.stats()["threads"] == 0
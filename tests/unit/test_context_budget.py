@@ -0,0 +1,75 @@
+"""
+Context Budget 단위 테스트
+
+도구 출력 축약, 턴 단위 제거, 시스템 프롬프트 prefix 고정 검증
+"""
+
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from core.llm.context_budget import (
+    ContextBudget,
+    build_prompt_messages,
+    compact_messages,
+    summarize_tool_output,
+)
+
+
+def _tool_turn(idx: int, payload_size: int) -> list:
+    """AIMessage(tool_calls) + ToolMessage 한 턴"""
+    call_id = f"call_{idx}"
+    ai = AIMessage(content="", tool_calls=[{"name": "get_case", "args": {"caseId": str(idx)}, "id": call_id}])
+    tool = ToolMessage(content=json.dumps({"caseId": idx, "data": "x" * payload_size}), tool_call_id=call_id)
+    return [ai, tool]
+
+
+def test_summarize_tool_output_keeps_short_content():
+    """짧은 출력은 그대로 유지"""
+    assert summarize_tool_output('{"a": 1}', 100) == '{"a": 1}'
+
+
+def test_summarize_tool_output_truncates_json():
+    """긴 JSON은 키 목록 + 앞부분 + 잘린 길이 표기"""
+    content = json.dumps({"caseId": "c1", "documents": ["d" * 50] * 50})
+    summary = summarize_tool_output(content, 200)
+    assert summary.startswith("[keys: caseId, documents]")
+    assert "chars truncated" in summary
+
+
+def test_compact_messages_truncates_old_tool_outputs_only():
+    """최근 N개를 제외한 ToolMessage만 축약, 원본은 변경하지 않음"""
+    messages = [HumanMessage(content="조사")] + _tool_turn(1, 5000) + _tool_turn(2, 5000)
+    budget = ContextBudget(max_input_tokens=100_000, tool_output_max_chars=300, keep_recent_tool_outputs=1)
+
+    result = compact_messages(messages, budget=budget)
+
+    assert len(result) == len(messages)
+    assert len(result[2].content) < 400
+    assert result[4].content == messages[4].content
+    assert len(messages[2].content) > 5000
+
+
+def test_compact_messages_drops_oldest_turns_keeping_pairs():
+    """예산 초과 시 첫 요청과 마지막 턴을 유지하고 tool_call/ToolMessage 쌍 단위로 제거"""
+    messages = [HumanMessage(content="조사")]
+    for i in range(5):
+        messages += _tool_turn(i, 800)
+    budget = ContextBudget(max_input_tokens=1200, tool_output_max_chars=2000, keep_recent_tool_outputs=5)
+
+    result = compact_messages(messages, budget=budget)
+
+    assert result[0].content == "조사"
+    assert result[-1] is messages[-1]
+    assert len(result) < len(messages)
+    for i, msg in enumerate(result):
+        if isinstance(msg, ToolMessage):
+            prev = result[i - 1]
+            assert isinstance(prev, (AIMessage, ToolMessage))
+
+
+def test_build_prompt_messages_system_prefix_first():
+    """시스템 프롬프트가 항상 첫 메시지 (prefix byte-identical)"""
+    result = build_prompt_messages("SYSTEM", [HumanMessage(content="hi")])
+    assert result[0].content == "SYSTEM"
+    assert result[1].content == "hi"
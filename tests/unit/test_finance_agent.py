@@ -4,6 +4,8 @@ Finance Agent 단위 테스트
 AgentState, 그래프 구조, HITL 플래그 검증
 """
 
+import asyncio
+
 import pytest
 
 from domains.finance.agents.finance_agent import (
@@ -63,3 +65,27 @@ def test_evidence_item_typed_dict():
     }
     assert item["type"] == "regulation"
     assert item["content"] == "IFRS 15 인용"
+
+
+@pytest.mark.parametrize("failure", [ConnectionError("redis down"), asyncio.CancelledError()])
+async def test_finance_stream_releases_slot_when_setup_fails(monkeypatch, failure):
+    """응답 생성 전 HITL 매니저 실패/취소 시 테넌트 스트림 슬롯 반환"""
+    from api.routes import finance_agent as route
+    from api.sse_utils import get_stream_slots
+    from core.security.auth import User
+
+    class _Manager:
+        async def take_suspended_session(self, *args):
+            raise failure
+
+    async def manager():
+        return _Manager()
+
+    monkeypatch.setattr(route, "get_hitl_manager", manager)
+    request = route.FinanceStreamRequest(thread_id="th1", resume=True)
+    slots = get_stream_slots()
+    before = slots.active("t-slot")
+
+    with pytest.raises(type(failure)):
+        await route.finance_stream(request, None, User(user_id="u1"), "t-slot", None, None, None)
+    assert slots.active("t-slot") == before
@@ -0,0 +1,60 @@
+"""
+Git 읽기 캐시 단위 테스트
+
+임시 저장소에서 캐시 적중, 커밋 시 무효화, cat-file --batch 워커 blob 읽기 검증
+"""
+
+import subprocess
+
+import pytest
+
+from tools.integrations.git_cache import CatFileBatch, GitReadCache
+from tools.integrations.git_exec import GitCommandError, run_git
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-C", repo, *args], check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """커밋 1개가 있는 임시 Git 저장소"""
+    repo = str(tmp_path)
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "dev@example.com")
+    _git(repo, "config", "user.name", "dev")
+    (tmp_path / "a.txt").write_text("v1\n")
+    _git(repo, "add", "a.txt")
+    _git(repo, "commit", "-q", "-m", "init")
+    return repo
+
+
+async def test_read_cache_hits_until_head_changes(repo, tmp_path):
+    """동일 명령은 캐시 적중, 새 커밋(HEAD 변경) 후에는 다시 실행"""
+    cache = GitReadCache()
+    args = ("log", "--pretty=format:%s")
+
+    async def load():
+        return await run_git(repo, *args)
+
+    assert await cache.get_or_load(repo, args, load) == "init"
+    assert await cache.get_or_load(repo, args, load) == "init"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    (tmp_path / "a.txt").write_text("v2\n")
+    _git(repo, "commit", "-q", "-am", "second")
+
+    assert (await cache.get_or_load(repo, args, load)).startswith("second")
+    assert cache.misses == 2
+
+
+async def test_cat_file_batch_reads_blobs(repo):
+    """장기 실행 워커로 연속 blob 읽기, 없는 경로는 GitCommandError 후에도 워커 재사용"""
+    worker = CatFileBatch(repo)
+    try:
+        assert await worker.read_blob("HEAD:a.txt", 1024) == (b"v1\n", False)
+        with pytest.raises(GitCommandError):
+            await worker.read_blob("HEAD:missing.txt", 1024)
+        assert await worker.read_blob("HEAD:a.txt", 2) == (b"v1", True)
+    finally:
+        await worker.close()
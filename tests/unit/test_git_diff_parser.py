@@ -0,0 +1,74 @@
+"""
+Git diff 스트리밍 파서 단위 테스트
+
+임시 저장소의 실제 git diff/show 출력으로 파일별 예산, stat 요약, 출력 상한 검증
+"""
+
+import subprocess
+
+import pytest
+
+from tools.integrations.git_diff_parser import parse_unified_diff, read_capped
+from tools.integrations.git_exec import stream_git
+from tools.integrations.git_tool import git_diff
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """작은 변경(small.txt)과 대용량 변경(big.txt)이 있는 임시 Git 저장소"""
+    def git(*args):
+        subprocess.run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "dev")
+    (tmp_path / "small.txt").write_text("a\nb\n")
+    (tmp_path / "big.txt").write_text("old\n" * 5000)
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+    (tmp_path / "small.txt").write_text("a\nc\n")
+    (tmp_path / "big.txt").write_text("new\n" * 5000)
+    return str(tmp_path)
+
+
+async def test_parse_unified_diff_budgets_and_stats(repo):
+    """예산 초과 파일은 본문 일부 + 정확한 +/- 집계, 작은 파일은 전체 보관"""
+    result = await parse_unified_diff(
+        stream_git(repo, "diff", "HEAD"), max_file_lines=50, max_total_bytes=1 << 20,
+    )
+    files = {f.path: f for f in result.files}
+
+    assert files["big.txt"].truncated
+    assert len(files["big.txt"].lines) == 50
+    assert (files["big.txt"].additions, files["big.txt"].deletions) == (5000, 5000)
+    assert not files["small.txt"].truncated
+    assert (files["small.txt"].additions, files["small.txt"].deletions) == (1, 1)
+    assert "+5000 -5000" in result.to_text()
+
+    text = await git_diff.ainvoke({"repo_path": repo, "branch": "HEAD"})
+    assert "[truncated big.txt" in text
+    assert text.count("\n") < 1000
+
+
+async def test_parse_unified_diff_max_files_and_read_capped(repo):
+    """파일 수 상한 초과 시 읽기 중단, read_capped는 줄 경계에서 자름"""
+    result = await parse_unified_diff(stream_git(repo, "diff", "HEAD"), max_files=1)
+    assert len(result.files) == 1
+    assert result.truncated
+
+    text, truncated = await read_capped(stream_git(repo, "show", "HEAD:big.txt"), max_bytes=10)
+    assert truncated
+    assert text == "old\nold\n"
+
+
+async def test_parse_unified_diff_stops_reading_at_total_budget(repo):
+    """전체 예산 초과 시 읽기 중단 (이후 파일 생략, 현재 파일 집계는 중단 시점까지)"""
+    result = await parse_unified_diff(stream_git(repo, "diff", "HEAD"), max_total_bytes=200)
+
+    assert result.truncated
+    assert [f.path for f in result.files] == ["big.txt"]
+    big = result.files[0]
+    assert big.truncated
+    assert big.kept_bytes <= 200
+    assert big.additions + big.deletions < 10000
+    assert "remaining files omitted" in result.to_text()
@@ -0,0 +1,45 @@
+"""
+Git 비동기 실행 계층 단위 테스트
+
+임시 저장소에서 run_git/stream_git 결과, 실패/조기 종료 처리 검증
+"""
+
+import subprocess
+
+import pytest
+
+from tools.integrations.git_exec import GitCommandError, run_git, stream_git
+from tools.integrations.git_tool import git_log
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """커밋 1개가 있는 임시 Git 저장소"""
+    def git(*args):
+        subprocess.run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "dev@example.com")
+    git("config", "user.name", "dev")
+    (tmp_path / "a.txt").write_text("line\n" * 50000)
+    git("add", "a.txt")
+    git("commit", "-q", "-m", "init")
+    return str(tmp_path)
+
+
+async def test_run_git_and_tool_use_async_exec(repo):
+    """run_git 출력 및 도구 결과, 실패 시 GitCommandError"""
+    assert (await run_git(repo, "show", "HEAD:a.txt")).count("line") == 50000
+    assert "init" in await git_log.ainvoke({"repo_path": repo, "limit": 1, "branch": "HEAD"})
+    with pytest.raises(GitCommandError):
+        await run_git(repo, "show", "HEAD:missing.txt")
+
+
+async def test_stream_git_early_close_kills_process(repo):
+    """소비 측이 첫 청크 후 종료해도 프로세스가 정리됨"""
+    stream = stream_git(repo, "show", "HEAD:a.txt", chunk_size=1024)
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first.startswith(b"line\n")
+    assert await run_git(repo, "rev-parse", "--is-inside-work-tree") == "true\n"
@@ -0,0 +1,75 @@
+"""
+GitHub 클라이언트 단위 테스트
+
+httpx.MockTransport로 조건부 요청(ETag → 304), 페이지네이션, rate limit 추적 검증
+"""
+
+import httpx
+
+from tools.integrations.github_tool import GitHubClient
+
+
+async def test_conditional_requests_and_pagination():
+    """재조회는 If-None-Match로 304 → 캐시 응답, Link next를 따라 limit까지 수집"""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        headers = {"ETag": f'"{request.url.path}:{request.url.query.decode()}"', "X-RateLimit-Remaining": "4999"}
+        if request.headers.get("If-None-Match") == headers["ETag"]:
+            return httpx.Response(304, headers=headers)
+        if request.url.path.endswith("/pulls"):
+            page = int(request.url.params.get("page", "1"))
+            if page == 1:
+                headers["Link"] = '<https://api.github.test/repos/o/r/pulls?state=open&per_page=2&page=2>; rel="next"'
+            return httpx.Response(200, headers=headers, json=[{"number": page * 10 + i} for i in range(2)])
+        return httpx.Response(200, headers=headers, json={"number": 7})
+
+    client = GitHubClient(token="t", base_url="https://api.github.test", transport=httpx.MockTransport(handler))
+    try:
+        assert (await client.get_pr("o", "r", 7))["number"] == 7
+        assert (await client.get_pr("o", "r", 7))["number"] == 7
+        assert "If-None-Match" not in seen[0].headers
+        assert "If-None-Match" in seen[1].headers
+
+        prs = await client.list_prs("o", "r", limit=3)
+        assert [pr["number"] for pr in prs] == [10, 11, 20]
+        assert seen[-1].url.params["page"] == "2"
+
+        again = await client.list_prs("o", "r", limit=3)
+        assert again == prs
+        assert client.rate_limit_remaining == 4999
+    finally:
+        await client.aclose()
+
+
+async def test_pr_diff_tool_bounds_file_list(monkeypatch):
+    """PR 파일 목록은 limit까지만 조회하고 잘림을 표시"""
+    from tools.integrations import github_tool
+
+    pages: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        per_page = int(request.url.params.get("per_page", "2"))
+        pages.append(str(page))
+        files = [
+            {"status": "modified", "filename": f"f{(page - 1) * per_page + i}.py", "additions": 1, "deletions": 0}
+            for i in range(per_page)
+        ]
+        headers = {
+            "Link": f'<https://api.github.test/repos/o/r/pulls/1/files?per_page={per_page}&page={page + 1}>; rel="next"'
+        }
+        return httpx.Response(200, headers=headers, json=files)
+
+    client = GitHubClient(token="t", base_url="https://api.github.test", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(github_tool, "get_github_client", lambda: client)
+    monkeypatch.setattr(github_tool.settings, "github_pr_files_limit", 3)
+    try:
+        output = await github_tool.github_get_pr_diff.ainvoke({"owner": "o", "repo": "r", "pr_number": 1})
+    finally:
+        await client.aclose()
+
+    assert output.startswith("PR #1 changed more than 3 file(s), showing first 3")
+    assert "f2.py" in output and "f3.py" not in output
+    assert pages == ["1"]
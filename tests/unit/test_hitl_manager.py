@@ -0,0 +1,122 @@
+"""
+HITLManager 단위 테스트
+
+공유 패턴 구독 리스너의 세션별 신호 전달, 신호 키 폴백 조회 검증
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from core.memory.hitl_manager import HITLManager
+
+
+def _mock_redis(stored_signals: dict[str, dict] | None = None):
+    """pubsub.listen()이 큐의 메시지를 내보내는 Redis 클라이언트 mock"""
+    queue: asyncio.Queue = asyncio.Queue()
+    stored = stored_signals or {}
+
+    async def listen():
+        while True:
+            yield await queue.get()
+
+    pubsub = MagicMock()
+    pubsub.psubscribe = AsyncMock()
+    pubsub.aclose = AsyncMock()
+    pubsub.listen = listen
+
+    client = MagicMock()
+    client.pubsub = MagicMock(return_value=pubsub)
+    client.get = AsyncMock(side_effect=lambda key: json.dumps(stored[key]).encode() if key in stored else None)
+    return client, pubsub, queue
+
+
+def _pmessage(session_id: str, signal: dict) -> dict:
+    return {
+        "type": "pmessage",
+        "pattern": b"hitl:channel:*",
+        "channel": f"hitl:channel:{session_id}".encode(),
+        "data": json.dumps(signal).encode(),
+    }
+
+
+async def test_single_subscription_dispatches_to_each_session():
+    """동시 대기 세션들이 하나의 패턴 구독으로 각자의 신호 수신"""
+    client, pubsub, queue = _mock_redis()
+    manager = HITLManager(redis_client=client)
+
+    waits = [
+        asyncio.create_task(manager.wait_for_approval_signal(f"s{i}", timeout=5, request_id=f"r{i}"))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0.05)
+    for i in reversed(range(3)):
+        queue.put_nowait(_pmessage(f"s{i}", {"requestId": f"r{i}", "status": "approved"}))
+
+    results = await asyncio.gather(*waits)
+    await manager.close()
+
+    assert [r["requestId"] for r in results] == ["r0", "r1", "r2"]
+    pubsub.psubscribe.assert_awaited_once_with("hitl:channel:*")
+    assert manager._waiters == {}
+
+
+async def test_signal_published_before_wait_is_found_by_key():
+    """구독 이전 저장된 hitl:signal은 키 조회로 수신, 다른 requestId 신호는 무시"""
+    client, _, _ = _mock_redis({"hitl:signal:s1": {"requestId": "r1", "status": "rejected"}})
+    manager = HITLManager(redis_client=client)
+
+    signal = await manager.wait_for_approval_signal("s1", timeout=1, request_id="r1")
+    stale = await manager.wait_for_approval_signal("s1", timeout=0.1, request_id="r2")
+    await manager.close()
+
+    assert signal["status"] == "rejected"
+    assert stale is None
+
+
+async def test_take_suspended_session_claims_once_after_signal():
+    """suspend 세션은 신호 도착 전 유지, 도착 후 1회만 회수 (중복 재개 방지)"""
+    record = {"sessionId": "s1", "requestId": "r1", "userId": "u1", "tenantId": "t1"}
+    stored: dict[str, dict] = {"hitl:suspended:th1": record}
+    client, _, _ = _mock_redis(stored)
+    client.getdel = AsyncMock(side_effect=lambda key: json.dumps(stored.pop(key)).encode() if key in stored else None)
+    manager = HITLManager(redis_client=client)
+
+    pending = await manager.take_suspended_session("th1", "u1", "t1")
+    other_user = await manager.take_suspended_session("th1", "u2", "t1")
+    stored["hitl:signal:s1"] = {"requestId": "r1", "type": "approval"}
+    claimed = await manager.take_suspended_session("th1", "u1", "t1")
+    again = await manager.take_suspended_session("th1", "u1", "t1")
+
+    assert pending == (record, None)
+    assert other_user == (None, None)
+    assert claimed[0] == record and claimed[1]["type"] == "approval"
+    assert again == (None, None)
+
+
+async def test_signal_key_written_by_publisher_not_listener():
+    """신호 키는 발행자가 SET NX로 1회 저장, 대기자 없는 세션 메시지를 받은 리스너는 쓰지 않음"""
+    client, _, queue = _mock_redis()
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.execute = AsyncMock(return_value=[True, 2])
+    client.pipeline = MagicMock(return_value=pipe)
+    client.set = AsyncMock()
+    manager = HITLManager(redis_client=client)
+
+    receivers = await manager.publish_approval_result("s1", {"requestId": "r1", "status": "approved"}, ttl=60)
+    assert receivers == 2
+    pipe.set.assert_called_once()
+    assert pipe.set.call_args.args[0] == "hitl:signal:s1"
+    assert pipe.set.call_args.kwargs == {"ex": 60, "nx": True}
+    pipe.publish.assert_called_once()
+    assert pipe.publish.call_args.args[0] == "hitl:channel:s1"
+
+    waiting = asyncio.create_task(manager.wait_for_approval_signal("s2", timeout=5))
+    await asyncio.sleep(0.05)
+    queue.put_nowait(_pmessage("suspended", {"requestId": "r9", "status": "approved"}))
+    queue.put_nowait(_pmessage("s2", {"requestId": "r2", "status": "approved"}))
+    assert (await waiting)["requestId"] == "r2"
+    await manager.close()
+    client.set.assert_not_called()
@@ -0,0 +1,127 @@
+"""
+요청 컨텍스트 미들웨어 단위 테스트
+
+단일 raw ASGI 미들웨어의 인증/테넌트/요청 ID/예외 처리, SSE 스트림 전달, 경로 분류 검증
+"""
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from api.middleware import setup_middlewares
+from api.route_access import PathClassifier, public_route, stream_route
+from core.security.auth import create_token
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    setup_middlewares(app)
+
+    @app.get("/health")
+    @public_route
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/me")
+    async def me(request: Request):
+        return {
+            "user": request.state.user.user_id,
+            "tenant": request.state.tenant_id,
+            "requestId": request.state.request_id,
+        }
+
+    @app.get("/boom")
+    async def boom():
+        raise ValueError("bad input")
+
+    @app.get("/stream")
+    @stream_route
+    async def stream():
+        async def frames():
+            for i in range(3):
+                yield f"data: {i}\n\n".encode()
+        return StreamingResponse(frames(), media_type="text/event-stream")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_auth_tenant_and_request_id():
+    """공개 경로 통과, 토큰 누락 401, 테넌트 불일치 403, 인증 시 request.state 설정"""
+    client = _client()
+    auth = {"Authorization": f"Bearer {create_token('u1', tenant_id='t1')}"}
+
+    assert client.get("/health").status_code == 200
+    assert client.get("/me").status_code == 401
+    assert client.get("/me", headers={**auth, "X-Tenant-ID": "t2"}).status_code == 403
+
+    response = client.get("/me", headers={**auth, "X-Tenant-ID": "t1"})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["user"], body["tenant"]) == ("u1", "t1")
+    assert response.headers["x-request-id"] == body["requestId"]
+
+
+def test_errors_mapped_and_streams_pass_through():
+    """라우트 ValueError → 400 JSON, SSE 본문은 그대로 전달"""
+    client = _client()
+    auth = {"Authorization": f"Bearer {create_token('u1', tenant_id='t1')}"}
+
+    error = client.get("/boom", headers=auth)
+    assert error.status_code == 400
+    assert error.json() == {"detail": "bad input", "error_type": "validation_error"}
+
+    stream = client.get("/stream", headers=auth)
+    assert stream.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+
+
+def test_path_classifier_route_order_and_wildcards():
+    """정적 경로 우선, 파라미터 경로는 선언 순서대로, 미선언 경로는 auth"""
+    classifier = PathClassifier([
+        ("/health", "public"),
+        ("/cases/{case_id}/stream", "stream"),
+        ("/cases/search", "auth"),
+        ("/cases/{case_id}", "public"),
+        ("/files/{path:path}", "stream"),
+        ("/docs*", "public"),
+    ])
+
+    assert classifier.classify("/health") == "public"
+    assert classifier.classify("/cases/c1/stream") == "stream"
+    assert classifier.classify("/cases/search") == "auth"
+    assert classifier.classify("/cases/c1") == "public"
+    assert classifier.classify("/files/a/b/c") == "stream"
+    assert classifier.classify("/docs/oauth2-redirect") == "public"
+    assert classifier.classify("/unknown") == "auth"
+
+
+def test_path_classifier_from_app_includes_router_prefix():
+    """include_router/mount 라우트도 prefix 포함 경로와 선언으로 분류"""
+    router = APIRouter(prefix="/cases")
+
+    @router.get("/{case_id}/stream")
+    @stream_route
+    async def case_stream(case_id: str):
+        return {}
+
+    @router.get("/health")
+    @public_route
+    async def cases_health():
+        return {}
+
+    sub_app = FastAPI()
+
+    @sub_app.get("/ping")
+    @public_route
+    async def ping():
+        return {}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/aura")
+    app.mount("/sub", sub_app)
+    classifier = PathClassifier.from_app(app)
+
+    assert classifier.classify("/aura/cases/c1/stream") == "stream"
+    assert classifier.classify("/aura/cases/health") == "public"
+    assert classifier.classify("/cases/health") == "auth"
+    assert classifier.classify("/sub/ping") == "public"
+    assert classifier.classify("/docs") == "public"
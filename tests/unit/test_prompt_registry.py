@@ -0,0 +1,75 @@
+"""
+Prompt Registry 단위 테스트
+
+템플릿 컴파일, 버전 폴백, 렌더링 캐시, 시스템 프롬프트 byte-identical 검증
+"""
+
+from core.llm.prompt_registry import PromptRegistry, compile_prompt
+from core.llm.prompts import FINANCE_DOMAIN_SYSTEM_PROMPT, get_system_prompt, render_prompt
+
+
+def test_compile_prompt_segments_and_static_prefix():
+    """placeholder 이전 고정 구간이 static_prefix"""
+    compiled = compile_prompt("t", "v1", "고정 문구\n{context}\n끝 {code}")
+    assert compiled.fields == ("context", "code")
+    assert compiled.static_prefix == "고정 문구\n"
+    assert compiled.render(context="C", code="X") == "고정 문구\nC\n끝 X"
+
+
+def test_registry_unknown_version_falls_back_to_default():
+    """미등록 버전은 기본 버전 사용"""
+    registry = PromptRegistry()
+    registry.register("p", "v1 {x}", version="v1")
+    registry.register("p", "v2 {x}", version="v2")
+    assert registry.resolve_version("p", "v9") == "v1"
+    assert registry.render("p", "v2", x=1) == "v2 1"
+
+
+def test_registry_render_cache_hits():
+    """동일 cache_key 재렌더링은 캐시 사용"""
+    registry = PromptRegistry()
+    registry.register("p", "hello {who}")
+    registry.render("p", cache_key="k", who="a")
+    registry.render("p", cache_key="k", who="a")
+    assert registry.hits == 1
+    assert registry.misses == 1
+
+
+def test_registry_values_factory_called_only_on_miss():
+    """values_factory는 캐시 miss 시에만 호출"""
+    registry = PromptRegistry()
+    registry.register("p", "hello {who} {ctx}")
+    calls: list[int] = []
+
+    def factory() -> dict:
+        calls.append(1)
+        return {"ctx": "C"}
+
+    assert registry.render("p", cache_key="k", values_factory=factory, who="a") == "hello a C"
+    assert registry.render("p", cache_key="k", values_factory=factory, who="a") == "hello a C"
+    assert len(calls) == 1
+
+
+def test_get_system_prompt_matches_format_and_ignores_unrelated_keys():
+    """기존 str.format 결과와 동일, 프롬프트와 무관한 context 키는 결과에 영향 없음"""
+    context = {"caseId": "C-1", "activeApp": "finance"}
+    first = get_system_prompt("finance", context=context)
+    second = get_system_prompt("finance", context={**context, "user_id": "u2"})
+    expected = FINANCE_DOMAIN_SYSTEM_PROMPT.format(
+        context="현재 사용자가 보고 있는 화면: finance\n케이스 ID: C-1", code=""
+    )
+    assert first == expected
+    assert second == first
+
+
+def test_render_prompt_phase3_versions():
+    """phase3 reasonText 프롬프트 버전 선택"""
+    v1, version = render_prompt("phase3_reason", "unknown", case_id="C", score="0.90", severity="HIGH")
+    assert version == "phase3-mvp-v1"
+    assert "스코어 0.90" in v1
+    v2, version = render_prompt(
+        "phase3_reason", "phase3-mvp-v2",
+        case_id="C", score="0.90", severity="HIGH", evidence_count=3, rag_count=2,
+    )
+    assert version == "phase3-mvp-v2"
+    assert "증거 3건" in v2
@@ -0,0 +1,119 @@
+"""
+Redis Checkpointer 단위 테스트
+
+alist 인덱스 페이지 조회 (limit 시 전체 인덱스 조회 없음), before/filter 검증
+"""
+
+from langgraph.checkpoint.base import empty_checkpoint
+
+from core.memory import redis_checkpointer
+from core.memory.redis_checkpointer import RedisCheckpointSaver
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self.command_stack: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self.command_stack.append((name, args, kwargs))
+        return queue
+
+    async def execute(self) -> list:
+        commands, self.command_stack = self.command_stack, []
+        return [await getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+class _FakeRedis:
+    """체크포인트 저장/목록 조회에 필요한 명령만 구현한 in-memory Redis (zrevrangebylex 호출 기록)"""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, bytes]] = {}
+        self.zsets: dict[str, set[str]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.range_calls: list[tuple[int | None, int | None]] = []
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def hset(self, key: str, field: str | None = None, value: bytes | None = None, mapping=None) -> None:
+        entries = self.hashes.setdefault(key, {})
+        if field is not None:
+            entries[field] = value
+        entries.update(mapping or {})
+
+    async def hmget(self, key: str, fields: list[str]) -> list[bytes | None]:
+        return [self.hashes.get(key, {}).get(f) for f in fields]
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return {f.encode(): v for f, v in self.hashes.get(key, {}).items()}
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.zsets.setdefault(key, set()).update(mapping)
+
+    async def sadd(self, key: str, *members: str) -> None:
+        self.sets.setdefault(key, set()).update(members)
+
+    async def smembers(self, key: str) -> set[bytes]:
+        return {m.encode() for m in self.sets.get(key, set())}
+
+    async def expire(self, key: str, ttl: int) -> None:
+        return None
+
+    async def zrevrangebylex(self, key: str, max_: str, min_: str, start=None, num=None) -> list[bytes]:
+        self.range_calls.append((start, num))
+        members = sorted(self.zsets.get(key, set()), reverse=True)
+        if max_.startswith("("):
+            members = [m for m in members if m < max_[1:]]
+        if start is not None:
+            members = members[start:start + num]
+        return [m.encode() for m in members]
+
+
+class _Store:
+    def __init__(self, client: _FakeRedis) -> None:
+        self.client = client
+
+
+async def _saver_with_checkpoints(count: int) -> tuple[RedisCheckpointSaver, _FakeRedis]:
+    fake = _FakeRedis()
+    saver = RedisCheckpointSaver(_Store(fake), ttl=60)
+    for i in range(count):
+        checkpoint = empty_checkpoint()
+        checkpoint["id"] = f"cp-{i:04d}"
+        config = {"configurable": {"thread_id": "th", "checkpoint_ns": ""}}
+        await saver.aput(config, checkpoint, {"step": i}, {})
+    return saver, fake
+
+
+async def test_alist_limit_reads_only_limit_ids():
+    """limit만 지정 시 인덱스에서 limit개만 조회"""
+    saver, fake = await _saver_with_checkpoints(250)
+    config = {"configurable": {"thread_id": "th"}}
+
+    listed = [t async for t in saver.alist(config, limit=1)]
+
+    assert [t.config["configurable"]["checkpoint_id"] for t in listed] == ["cp-0249"]
+    assert fake.range_calls == [(0, 1)]
+
+
+async def test_alist_pages_through_index_with_before_and_filter():
+    """filter/limit 미지정 시 페이지 단위로 전체 조회, before는 exclusive 상한"""
+    saver, fake = await _saver_with_checkpoints(250)
+    config = {"configurable": {"thread_id": "th"}}
+    before = {"configurable": {"checkpoint_id": "cp-0200"}}
+
+    listed = [t async for t in saver.alist(config, before=before)]
+    assert len(listed) == 200 and listed[0].config["configurable"]["checkpoint_id"] == "cp-0199"
+    page = redis_checkpointer.LIST_PAGE_SIZE
+    assert fake.range_calls == [(0, page), (page, page), (2 * page, page)]
+
+    matched = [t async for t in saver.alist(config, filter={"step": 3}, limit=1)]
+    assert [t.metadata["step"] for t in matched] == [3]
@@ -0,0 +1,51 @@
+"""
+Redis Codec 단위 테스트
+
+헤더 기반 포맷 판별, 임계값 압축, 기존 JSON 값 호환 검증
+"""
+
+import json
+
+import pytest
+
+from core.memory.codec import HEADER_ZLIB_JSON, CodecError, INTEROP_JSON_CODEC, RedisCodec
+
+
+def test_small_json_value_has_no_header():
+    """임계값 이하 JSON은 헤더 없는 compact JSON (외부 시스템 호환)"""
+    codec = RedisCodec(format="json", compress_threshold=1024)
+    raw = codec.encode({"status": "pending", "n": 1})
+    assert raw == b'{"status":"pending","n":1}'
+    assert codec.decode(raw) == {"status": "pending", "n": 1}
+
+
+def test_large_value_is_compressed_and_roundtrips():
+    """임계값 초과 값은 zlib 압축 + 헤더"""
+    codec = RedisCodec(format="json", compress_threshold=100)
+    value = {"messages": [{"role": "user", "content": "안녕하세요 " * 20}] * 20}
+    raw = codec.encode(value)
+    assert raw[0] == HEADER_ZLIB_JSON
+    assert len(raw) < len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+    assert RedisCodec.decode(raw) == value
+
+
+def test_msgpack_roundtrip_and_legacy_json_read():
+    """msgpack 코덱도 기존(pretty) JSON 값을 그대로 읽음"""
+    codec = RedisCodec(format="msgpack", compress_threshold=None)
+    assert codec.decode(codec.encode({"a": [1, 2, 3]})) == {"a": [1, 2, 3]}
+    legacy = json.dumps({"a": "기존 값"}, ensure_ascii=False, indent=2).encode("utf-8")
+    assert codec.decode(legacy) == {"a": "기존 값"}
+
+
+def test_interop_codec_never_compresses():
+    """INTEROP_JSON_CODEC는 크기와 무관하게 평문 JSON"""
+    raw = INTEROP_JSON_CODEC.encode({"context": "x" * 5000})
+    assert raw.startswith(b"{")
+
+
+def test_invalid_values_raise_codec_error():
+    """str/bytes 입력 모두 잘못된 데이터는 CodecError"""
+    assert RedisCodec.decode('{"a":1}') == {"a": 1}
+    for raw in ("not json", b"not json", "", b""):
+        with pytest.raises(CodecError):
+            RedisCodec.decode(raw)
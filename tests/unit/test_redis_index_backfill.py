@@ -0,0 +1,129 @@
+"""
+Sorted Set 인덱스 백필 단위 테스트
+
+인덱스 도입 이전 키와 인덱스된 키가 공존할 때 대화 스레드/체크포인트 목록 검증
+"""
+
+import fnmatch
+import time
+
+from core.config import settings
+from core.memory.conversation import ConversationHistory
+from core.memory.redis_store import LangGraphCheckpointer, RedisStore
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self.command_stack: list[tuple[str, tuple]] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args):
+            self.command_stack.append((name, args))
+        return queue
+
+    async def execute(self) -> list:
+        commands, self.command_stack = self.command_stack, []
+        return [await getattr(self._redis, name)(*args) for name, args in commands]
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+class _FakeRedis:
+    """백필/인덱스 조회에 필요한 명령만 구현한 in-memory Redis"""
+
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.ttls: dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def scan_iter(self, match: str = "*", count: int | None = None):
+        for key in list(self.values):
+            if fnmatch.fnmatchcase(key, match):
+                yield key.encode()
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.values or key in self.zsets)
+
+    async def set(self, key: str, value: bytes) -> None:
+        self.values[key] = value
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def ttl(self, key: str) -> int:
+        if key not in self.values:
+            return -2
+        return self.ttls.get(key, -1)
+
+    async def expire(self, key: str, ttl: int) -> None:
+        self.ttls[key] = ttl
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key: str, *members: str) -> None:
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    async def zremrangebyscore(self, key: str, _min: str, max_: str) -> None:
+        bound = float(max_.lstrip("("))
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score < bound]:
+            del zset[member]
+
+    async def zrevrange(self, key: str, start: int, end: int) -> list[bytes]:
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1], reverse=True)
+        members = members[start:] if end == -1 else members[start:end + 1]
+        return [member.encode() for member, _ in members]
+
+
+def _store() -> tuple[RedisStore, _FakeRedis]:
+    store = RedisStore(redis_url="redis://unused")
+    fake = _FakeRedis()
+    store._client = fake
+    return store, fake
+
+
+async def test_thread_listing_backfills_pre_index_threads_once():
+    """인덱스에 새 스레드가 있어도 인덱스 도입 이전 스레드가 목록에 포함 (백필은 1회)"""
+    store, fake = _store()
+    history = ConversationHistory(store)
+    fake.values["conversation:t1:old-blob"] = b"{}"
+    fake.values["conversation-meta:t1:old-list"] = b""
+    fake.ttls["conversation-meta:t1:old-list"] = settings.redis_ttl - 60
+    fake.values["conversation-meta:t2:other-tenant"] = b""
+    await fake.zadd("conversation-threads:t1", {"new": time.time()})
+    await fake.zadd("conversation-threads:_all", {"new": time.time()})
+
+    assert set(await history.list_threads("t1")) == {"new", "old-blob", "old-list"}
+    assert set(await history.list_threads()) == {"new", "old-blob", "old-list", "other-tenant"}
+
+    # 마커 기록 이후에는 SCAN 없이 인덱스만 조회
+    fake.values["conversation-meta:t1:late"] = b""
+    assert "late" not in await history.list_threads("t1")
+
+
+async def test_checkpoint_listing_merges_pre_index_checkpoints():
+    """새로 저장된 체크포인트와 인덱스 도입 이전 체크포인트가 함께 조회"""
+    store, fake = _store()
+    checkpointer = LangGraphCheckpointer(store)
+    old = {"checkpoint_id": "1000", "thread_id": "th:1", "timestamp": "1000", "data": {}}
+    fake.values["langgraph:checkpoint:th:1:1000"] = store.codec.encode(old)
+    fake.values["langgraph:checkpoint:th:1:latest"] = b"1000"
+
+    await checkpointer.save_checkpoint("th:1", {"step": 2}, checkpoint_id="2000")
+
+    listed = await checkpointer.list_checkpoints("th:1")
+    assert [c["checkpoint_id"] for c in listed] == ["2000", "1000"]
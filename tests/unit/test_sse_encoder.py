@@ -0,0 +1,33 @@
+"""
+SSE 인코더 단위 테스트
+
+dict/pydantic 이벤트 모델 → SSE bytes 프레임 직렬화 (datetime → Unix timestamp) 검증
+"""
+
+import json
+from datetime import datetime, timezone
+
+from api.schemas.events import ThoughtEvent, ThoughtType
+from api.sse_encoder import encode_sse
+
+
+def _data(frame: bytes) -> dict:
+    line = next(l for l in frame.decode("utf-8").split("\n") if l.startswith("data: "))
+    return json.loads(line[len("data: "):])
+
+
+def test_encode_dict_and_model_frames():
+    """dict는 version 보강, 모델은 직접 직렬화, datetime은 초 단위 timestamp"""
+    ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    frame = encode_sse("start", {"message": "시작", "at": ts}, "7")
+    model_frame = encode_sse(
+        "thought",
+        ThoughtEvent(thoughtType=ThoughtType.ANALYSIS, content="분석", timestamp=ts),
+    )
+
+    assert frame.startswith(b"id: 7\nevent: start\ndata: ")
+    assert frame.endswith(b"\n\n")
+    assert _data(frame) == {"message": "시작", "at": int(ts.timestamp()), "version": "1.0"}
+    assert model_frame.startswith(b"event: thought\n")
+    assert _data(model_frame)["timestamp"] == int(ts.timestamp())
+    assert _data(model_frame)["thoughtType"] == "analysis"
@@ -0,0 +1,62 @@
+"""
+SSEEventLog 단위 테스트
+
+재연결 시 Last-Event-ID 이후 프레임 replay 및 실시간 구독 검증
+"""
+
+import asyncio
+
+from core.streaming.event_log import SSEEventLog
+
+
+async def _producer(release: asyncio.Event):
+    for i in (1, 2):
+        yield f"id: {i}\nevent: step\ndata: {{}}\n\n"
+    await release.wait()
+    yield "id: 3\nevent: end\ndata: {}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+async def test_reconnect_replays_missed_frames_then_follows_live():
+    """끊긴 클라이언트는 Last-Event-ID 이후 프레임부터 받고 생산자는 한 번만 실행"""
+    log = SSEEventLog(max_events=10, ttl_seconds=60)
+    release = asyncio.Event()
+    session = log.start("k", _producer(release))
+
+    first = session.frames()
+    received = [await first.__anext__()]
+    await first.aclose()  # id 1 수신 후 연결 끊김
+
+    reattached = log.get("k")
+    assert reattached is session
+    frames = reattached.frames("1")
+    release.set()
+    replayed = [frame async for frame in frames]
+
+    assert received[0].startswith("id: 1\n")
+    assert [f.split("\n", 1)[0] for f in replayed] == ["id: 2", "id: 3", "data: [DONE]"]
+    assert log.stats() == {"sessions": 1, "running": 0, "frames": 4}
+
+
+
+async def test_producer_cancelled_when_no_subscriber_reattaches():
+    """구독자가 떠난 뒤 유예 시간 내 재연결이 없으면 생산 태스크(에이전트 실행) 취소"""
+    log = SSEEventLog(max_events=10, ttl_seconds=60, cancel_grace=0.05)
+    cancelled = asyncio.Event()
+
+    async def producer():
+        yield "id: 1\n\n"
+        try:
+            await asyncio.sleep(10)  # 진행 중 LLM/Tool 호출
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    session = log.start("k", producer())
+    frames = session.frames()
+    await frames.__anext__()
+    await frames.aclose()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert session.done
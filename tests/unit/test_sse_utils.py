@@ -0,0 +1,89 @@
+"""
+SSE 유틸 단위 테스트
+
+적응형 프레임 페이싱(burst 병합, 유휴 시 즉시 전송), keepalive/끊김 감지, 테넌트 스트림 상한 검증
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from api.sse_utils import StreamSlots, pace_sse, with_heartbeat
+
+
+async def test_pace_sse_coalesces_bursts_without_per_event_delay():
+    """burst는 한 청크로 병합되고 유휴 후 첫 이벤트는 즉시 전송"""
+    async def source():
+        for i in range(5):
+            yield f"id: {i}\n\n"
+        await asyncio.sleep(0.2)
+        yield "data: [DONE]\n\n"
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    chunks = [chunk async for chunk in pace_sse(source(), max_fps=20)]
+    elapsed = loop.time() - started
+
+    assert "".join(chunks).count("id: ") == 5
+    assert chunks[0] == "id: 0\n\n"
+    assert len(chunks) == 3  # 첫 이벤트, 나머지 burst 4개 병합, 유휴 후 [DONE]
+    assert elapsed < 0.4
+
+
+async def test_heartbeat_keepalive_and_disconnect_cancels_upstream():
+    """유휴 시 keepalive 주석 전송, 연결 끊김 감지 시 상류 생성기 취소"""
+    cancelled = asyncio.Event()
+
+    async def slow_source():
+        yield b"id: 1\n\n"
+        try:
+            await asyncio.sleep(10)  # LLM 호출/큐 대기
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        yield b"id: 2\n\n"
+
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(side_effect=[False, True])
+    chunks = [c async for c in with_heartbeat(slow_source(), request, interval=0.05)]
+
+    assert chunks == [b"id: 1\n\n", b": keepalive\n\n"]
+    assert cancelled.is_set()
+
+
+def test_stream_slots_cap_per_tenant():
+    """테넌트별 동시 스트림 상한 (다른 테넌트는 영향 없음)"""
+    slots = StreamSlots(max_per_tenant=2)
+    assert slots.acquire("t1") and slots.acquire("t1")
+    assert not slots.acquire("t1")
+    assert slots.acquire("t2")
+    slots.release("t1")
+    assert slots.acquire("t1")
+
+
+async def test_pump_sse_paces_and_sends_keepalive_with_one_pending_task(monkeypatch):
+    """페이싱 + keepalive를 한 루프에서 처리 (프레임당 상류 대기 Task 1개), 페이싱 없으면 Task 없이 통과"""
+    from api import sse_utils
+
+    async def source():
+        for i in range(3):
+            yield f"id: {i}\n\n"
+        await asyncio.sleep(0.25)
+        yield "id: 3\n\n"
+
+    created = 0
+    ensure_future = asyncio.ensure_future
+
+    def counting_ensure_future(coro, **kwargs):
+        nonlocal created
+        created += 1
+        return ensure_future(coro, **kwargs)
+
+    monkeypatch.setattr(sse_utils.asyncio, "ensure_future", counting_ensure_future)
+    chunks = [c async for c in sse_utils.pump_sse(source(), max_fps=20, heartbeat_interval=0.1)]
+
+    assert chunks == ["id: 0\n\n", "id: 1\n\nid: 2\n\n", b": keepalive\n\n", "id: 3\n\n"]
+    assert created == 5  # 프레임 4개 + 종료(StopAsyncIteration)
+
+    created = 0
+    assert [c async for c in sse_utils.pump_sse(source())] == [f"id: {i}\n\n" for i in range(4)]
+    assert created == 0
@@ -0,0 +1,63 @@
+"""
+백그라운드 작업 감독자 단위 테스트
+
+풀별 동시 실행 상한, 우선순위 대기열, 포화 시 거부, 종료 시 drain 검증
+"""
+
+import asyncio
+
+import pytest
+
+from core.task_supervisor import (
+    TASK_QUEUED,
+    TASK_STARTED,
+    TaskPoolSaturatedError,
+    TaskSupervisor,
+)
+
+
+async def test_concurrency_cap_priority_queue_and_rejection():
+    """상한 초과분은 우선순위 순으로 대기, 대기열까지 차면 거부"""
+    supervisor = TaskSupervisor({"p": (1, 2)})
+    gate = asyncio.Event()
+    order: list[str] = []
+
+    async def job(label: str) -> None:
+        order.append(label)
+        await gate.wait()
+
+    first = supervisor.submit("p", lambda: job("first"))
+    low = supervisor.submit("p", lambda: job("low"), priority=5)
+    high = supervisor.submit("p", lambda: job("high"), priority=0)
+    assert first.status == TASK_STARTED
+    assert (low.status, high.status) == (TASK_QUEUED, TASK_QUEUED)
+    with pytest.raises(TaskPoolSaturatedError):
+        supervisor.submit("p", lambda: job("overflow"))
+
+    await asyncio.sleep(0)
+    assert supervisor.stats()["p"]["running"] == 1
+    gate.set()
+    await supervisor.drain(timeout=1)
+    assert order == ["first", "high", "low"]
+
+
+async def test_drain_rejects_new_jobs_and_cancels_after_timeout():
+    """drain 시 신규 제출 거부, 타임아웃 초과 작업은 취소"""
+    supervisor = TaskSupervisor({"p": (1, 1)})
+    cancelled = asyncio.Event()
+
+    async def hang() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    supervisor.submit("p", hang)
+    supervisor.submit("p", hang)
+    await supervisor.drain(timeout=0.05)
+
+    assert cancelled.is_set()
+    assert supervisor.stats()["p"] == {"running": 0, "queued": 0, "maxConcurrency": 1, "maxQueue": 1}
+    with pytest.raises(TaskPoolSaturatedError):
+        supervisor.submit("p", hang)
@@ -0,0 +1,97 @@
+"""
+도구 실행기 단위 테스트
+
+독립 읽기 도구 병렬 실행, 쓰기 도구 직렬 실행, ToolMessage 순서 유지, 타임아웃 검증
+"""
+
+import asyncio
+import time
+
+from langchain_core.tools import tool
+
+from tools.executor import ToolExecutor
+
+_active_writes = 0
+_max_active_writes = 0
+
+
+@tool
+async def slow_read(key: str) -> str:
+    """0.2초 걸리는 조회 도구"""
+    await asyncio.sleep(0.2)
+    return f"read:{key}"
+
+
+@tool
+async def slow_write(key: str) -> str:
+    """동시 실행 수를 기록하는 쓰기 도구"""
+    global _active_writes, _max_active_writes
+    _active_writes += 1
+    _max_active_writes = max(_max_active_writes, _active_writes)
+    await asyncio.sleep(0.05)
+    _active_writes -= 1
+    return f"write:{key}"
+
+
+@tool
+async def hang(key: str) -> str:
+    """응답하지 않는 도구"""
+    await asyncio.sleep(10)
+    return key
+
+
+def _call(name: str, key: str) -> dict:
+    return {"name": name, "args": {"key": key}, "id": f"{name}-{key}"}
+
+
+async def test_reads_run_concurrently_writes_serialized_in_order():
+    """읽기 3건은 max(latency), 쓰기는 동시 1건, 결과는 tool_calls 순서"""
+    executor = ToolExecutor([slow_read, slow_write], serial_tools={"slow_write"})
+    calls = [
+        _call("slow_write", "w1"),
+        _call("slow_read", "a"),
+        _call("slow_read", "b"),
+        _call("slow_write", "w2"),
+        _call("slow_read", "c"),
+    ]
+
+    started = time.monotonic()
+    messages = await executor.ainvoke(calls)
+    elapsed = time.monotonic() - started
+
+    assert [m.tool_call_id for m in messages] == [c["id"] for c in calls]
+    assert [m.content for m in messages] == ["write:w1", "read:a", "read:b", "write:w2", "read:c"]
+    assert elapsed < 0.5
+    assert _max_active_writes == 1
+
+
+async def test_timeout_and_unknown_tool_return_error_messages():
+    """타임아웃/미등록 도구는 오류 ToolMessage로 반환"""
+    executor = ToolExecutor([hang], timeout=0.05)
+    timed_out, unknown = await executor.ainvoke([_call("hang", "x"), _call("nope", "y")])
+
+    assert timed_out.status == "error" and "timed out" in timed_out.content
+    assert unknown.status == "error" and "not a valid tool" in unknown.content
+
+
+async def test_concurrent_invocations_do_not_block_each_other():
+    """같은 실행기의 동시 ainvoke 호출은 도구별 세마포어/쓰기 직렬 체인을 공유하지 않음"""
+    executor = ToolExecutor([slow_read, hang], serial_tools={"hang"}, max_concurrency=1, timeout=0.3)
+
+    # 느린 쓰기가 다른 호출의 쓰기를 막지 않음 (공유 lock이면 0.6초)
+    started = time.monotonic()
+    writes = await asyncio.gather(
+        executor.ainvoke([_call("hang", "w1")]),
+        executor.ainvoke([_call("hang", "w2")]),
+    )
+    assert time.monotonic() - started < 0.5
+    assert all(m.status == "error" for (m,) in writes)
+
+    # 도구별 상한은 호출 단위 (실행기 전역 세마포어면 0.4초)
+    started = time.monotonic()
+    reads = await asyncio.gather(
+        executor.ainvoke([_call("slow_read", "a")]),
+        executor.ainvoke([_call("slow_read", "b")]),
+    )
+    assert time.monotonic() - started < 0.35
+    assert [m.content for (m,) in reads] == ["read:a", "read:b"]
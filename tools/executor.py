@@ -0,0 +1,127 @@
+"""
+Tool Executor Module
+
+에이전트 그래프 공통 도구 실행기입니다. (LangGraph ToolNode 대체)
+- 도구 dispatch 테이블은 에이전트 생성 시 1회 구성
+- 한 메시지의 독립적인 읽기 도구 호출은 동시 실행 (ainvoke 호출 단위 도구별 세마포어, 호출별 타임아웃)
+- 쓰기 도구(serial_tools)는 한 메시지 안에서 tool_calls 순서대로 직렬 실행
+- 실행기는 에이전트 싱글톤에 묶이므로 동시성 제한/직렬화는 ainvoke 호출 단위 (다른 세션/테넌트 호출 간 대기 없음)
+- 결과 ToolMessage는 원본 tool_calls 순서 유지
+
+멀티 조회 턴의 도구 대기 시간이 sum(latency) → max(latency)로 줄어듭니다.
+"""
+
+import asyncio
+import logging
+from typing import Any, Iterable, Sequence
+
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
+from pydantic import ValidationError
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ToolExecutor:
+    """
+    도구 호출 병렬 실행기
+
+    Args:
+        tools: 실행 가능한 도구 목록
+        serial_tools: 직렬 실행할 도구 이름 (상태 변경/쓰기 도구)
+        max_concurrency: 한 메시지 내 도구별 동시 실행 상한 (None이면 agent_tool_max_concurrency)
+        timeout: 호출별 타임아웃 (초, None이면 agent_tool_timeout_seconds)
+    """
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool],
+        serial_tools: Iterable[str] = (),
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self.tools_by_name: dict[str, BaseTool] = {t.name: t for t in tools}
+        self.serial_tools = frozenset(serial_tools)
+        self.timeout = timeout or settings.agent_tool_timeout_seconds
+        self.max_concurrency = max_concurrency or settings.agent_tool_max_concurrency
+
+    async def _run(
+        self,
+        tool_call: dict[str, Any],
+        semaphores: dict[str, asyncio.Semaphore],
+    ) -> ToolMessage:
+        """단일 도구 호출 (세마포어 + 타임아웃)"""
+        name = tool_call.get("name", "")
+        call_id = tool_call.get("id") or "unknown"
+        tool = self.tools_by_name.get(name)
+        if tool is None:
+            return ToolMessage(
+                content=(
+                    f"Error: {name} is not a valid tool, "
+                    f"try one of [{', '.join(self.tools_by_name)}]."
+                ),
+                name=name,
+                tool_call_id=call_id,
+                status="error",
+            )
+        try:
+            async with semaphores[name]:
+                output = await asyncio.wait_for(
+                    tool.ainvoke({**tool_call, "type": "tool_call"}),
+                    self.timeout,
+                )
+        except asyncio.TimeoutError:
+            logger.warning(f"Tool {name} timed out after {self.timeout}s (call {call_id})")
+            return ToolMessage(
+                content=f"Error: {name} timed out after {self.timeout:g}s",
+                name=name,
+                tool_call_id=call_id,
+                status="error",
+            )
+        except ValidationError as e:
+            return ToolMessage(
+                content=f"Error: {e!r}\n Please fix your mistakes.",
+                name=name,
+                tool_call_id=call_id,
+                status="error",
+            )
+        if isinstance(output, ToolMessage):
+            return output
+        return ToolMessage(content=str(output), name=name, tool_call_id=call_id)
+
+    async def _run_serial(
+        self,
+        tool_calls: list[dict[str, Any]],
+        semaphores: dict[str, asyncio.Semaphore],
+    ) -> list[ToolMessage]:
+        return [await self._run(tc, semaphores) for tc in tool_calls]
+
+    async def ainvoke(self, tool_calls: Sequence[dict[str, Any]]) -> list[ToolMessage]:
+        """
+        도구 호출 실행
+
+        읽기 도구는 각각 동시 실행, 쓰기 도구는 하나의 직렬 체인으로 읽기 도구와 병행 실행.
+        세마포어와 직렬 체인은 이 호출에만 적용되며 다른 ainvoke 호출과 공유하지 않습니다.
+
+        Returns:
+            tool_calls 순서와 동일한 ToolMessage 목록
+        """
+        serial_idx = [i for i, tc in enumerate(tool_calls) if tc.get("name") in self.serial_tools]
+        serial_set = set(serial_idx)
+        parallel_idx = [i for i in range(len(tool_calls)) if i not in serial_set]
+
+        semaphores = {name: asyncio.Semaphore(self.max_concurrency) for name in self.tools_by_name}
+        jobs = [self._run(tool_calls[i], semaphores) for i in parallel_idx]
+        if serial_idx:
+            jobs.append(self._run_serial([tool_calls[i] for i in serial_idx], semaphores))
+        outputs = await asyncio.gather(*jobs)
+
+        results: list[ToolMessage | None] = [None] * len(tool_calls)
+        for i, message in zip(parallel_idx, outputs):
+            results[i] = message
+        if serial_idx:
+            for i, message in zip(serial_idx, outputs[-1]):
+                results[i] = message
+        return results  # type: ignore[return-value]
@@ -0,0 +1,282 @@
+"""
+Git Cache Module
+
+Git 읽기 도구 결과 캐시 및 blob 읽기용 장기 실행 워커입니다.
+- 저장소별 캐시: 키 = (repo_path, HEAD oid, 명령 인자)
+- HEAD/refs 파일 stat fingerprint 변경 시 해당 저장소 캐시 전체 무효화 (git 프로세스 실행 없이 확인)
+- 상대 시간(%ar) 등 시간 의존 출력 대비 TTL(git_read_cache_ttl_seconds) 적용
+- 작업 트리 의존 명령(status, diff 작업 트리 비교)은 캐시하지 않음 (호출 측 책임)
+- git_cat_file_batch 활성 시 저장소별 `git cat-file --batch` 프로세스 1개로 blob 읽기 (프로세스 생성 비용 제거)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, TypeVar
+
+from core.config import settings
+from tools.integrations.git_exec import DEFAULT_CHUNK_SIZE, GitCommandError, GitTimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Fingerprint = tuple[tuple[int, int] | None, ...]
+
+
+def _git_dir(repo_path: str) -> str | None:
+    """저장소 .git 디렉토리 (worktree/.git 파일은 gitdir 경로 추적, 저장소가 아니면 None)"""
+    dot_git = os.path.join(repo_path, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    if os.path.isfile(dot_git):
+        with open(dot_git, encoding="utf-8") as f:
+            content = f.read().strip()
+        if content.startswith("gitdir: "):
+            return os.path.normpath(os.path.join(repo_path, content[len("gitdir: "):]))
+    return None
+
+
+def _stat(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_head(git_dir: str) -> tuple[str, str | None]:
+    """
+    HEAD 해석 → (HEAD oid 또는 ref 내용, 현재 브랜치 ref 경로)
+
+    loose ref가 없으면(packed-refs) ref 이름 자체를 키로 사용 (packed-refs fingerprint로 무효화).
+    """
+    with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+        head = f.read().strip()
+    if not head.startswith("ref: "):
+        return head, None
+    ref = head[len("ref: "):]
+    try:
+        with open(os.path.join(git_dir, ref), encoding="utf-8") as f:
+            return f.read().strip(), ref
+    except OSError:
+        return ref, ref
+
+
+def repo_state(repo_path: str) -> tuple[str, Fingerprint] | None:
+    """
+    저장소 HEAD oid 및 refs fingerprint (stat 몇 회, git 프로세스 없음)
+
+    fingerprint: HEAD, packed-refs, refs/heads, refs/tags, FETCH_HEAD, 현재 브랜치 ref 파일의 (mtime_ns, size).
+    ref 갱신은 lock 파일 rename으로 이루어져 상위 디렉토리 mtime이 함께 변경됨.
+    """
+    git_dir = _git_dir(repo_path)
+    if git_dir is None:
+        return None
+    try:
+        head_oid, ref = _read_head(git_dir)
+    except OSError:
+        return None
+    paths = ["HEAD", "packed-refs", "refs/heads", "refs/tags", "FETCH_HEAD"]
+    if ref:
+        paths.append(ref)
+    return head_oid, tuple(_stat(os.path.join(git_dir, p)) for p in paths)
+
+
+class GitReadCache:
+    """
+    저장소별 Git 읽기 결과 캐시 (LRU)
+
+    Args:
+        max_entries: 전체 캐시 항목 상한
+        ttl_seconds: 항목 유효 시간 (초)
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # repo_path → fingerprint
+        self._fingerprints: dict[str, Fingerprint] = {}
+        # (repo_path, head_oid, args) → (stored_at, value)
+        self._entries: OrderedDict[tuple[str, str, tuple[str, ...]], tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _invalidate_repo(self, repo_path: str) -> None:
+        for key in [k for k in self._entries if k[0] == repo_path]:
+            del self._entries[key]
+
+    async def get_or_load(
+        self,
+        repo_path: str,
+        args: tuple[str, ...],
+        loader: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        캐시 조회, 미스 시 loader 실행 결과 저장 (예외는 캐시하지 않음)
+
+        캐시 비활성(max_entries=0)이거나 저장소가 아니거나 HEAD를 읽을 수 없으면 캐시 없이 loader 실행.
+        """
+        if self.max_entries == 0:
+            return await loader()
+        repo_path = os.path.abspath(repo_path)
+        state = repo_state(repo_path)
+        if state is None:
+            return await loader()
+        head_oid, fingerprint = state
+        if self._fingerprints.get(repo_path) != fingerprint:
+            self._invalidate_repo(repo_path)
+            self._fingerprints[repo_path] = fingerprint
+
+        key = (repo_path, head_oid, args)
+        now = time.monotonic()
+        cached = self._entries.get(key)
+        if cached is not None and now - cached[0] <= self.ttl_seconds:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        value = await loader()
+        # loader 실행 중 refs가 바뀌었으면 저장하지 않음
+        if repo_state(repo_path) == state:
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._fingerprints.clear()
+
+    def stats(self) -> dict[str, int]:
+        """캐시 항목 수 / 적중 / 미스"""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class CatFileBatch:
+    """
+    저장소별 장기 실행 `git cat-file --batch` 워커
+
+    요청/응답은 stdin/stdout 한 쌍으로 직렬 처리 (asyncio.Lock).
+    프로세스가 종료되었거나 응답 중 오류가 나면 다음 요청에서 재시작.
+    """
+
+    def __init__(self, repo_path: str) -> None:
+        self.repo_path = repo_path
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_process(self) -> asyncio.subprocess.Process:
+        if self._proc is None or self._proc.returncode is not None:
+            self._proc = await asyncio.create_subprocess_exec(
+                "git", "-C", self.repo_path, "cat-file", "--batch",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        return self._proc
+
+    async def read_blob(self, rev: str, max_bytes: int) -> tuple[bytes, bool]:
+        """
+        `<commit>:<path>` blob 읽기 (max_bytes 초과분은 읽고 버림)
+
+        Returns:
+            (내용 앞부분, 잘림 여부)
+
+        Raises:
+            GitCommandError: 객체 없음 / blob 아님
+            GitTimeoutError: 타임아웃
+        """
+        if "\n" in rev:
+            raise GitCommandError(128, f"invalid object name '{rev}'")
+        async with self._lock:
+            try:
+                return await asyncio.wait_for(
+                    self._read(rev, max_bytes), settings.git_timeout_seconds,
+                )
+            except asyncio.TimeoutError:
+                await self.close()
+                raise GitTimeoutError(f"git cat-file {rev} timed out") from None
+            except (asyncio.IncompleteReadError, BrokenPipeError, ConnectionResetError) as e:
+                await self.close()
+                raise GitCommandError(-1, f"git cat-file worker failed: {e}") from e
+            except asyncio.CancelledError:
+                # 응답 중간에 취소되면 stdout 위치를 알 수 없으므로 프로세스 폐기
+                self._discard()
+                raise
+
+    async def _read(self, rev: str, max_bytes: int) -> tuple[bytes, bool]:
+        proc = await self._ensure_process()
+        proc.stdin.write(rev.encode("utf-8") + b"\n")
+        await proc.stdin.drain()
+        header = (await proc.stdout.readline()).decode("utf-8", errors="replace").strip()
+        if not header:
+            raise asyncio.IncompleteReadError(b"", None)
+        parts = header.split(" ")
+        if parts[-1] in ("missing", "ambiguous"):
+            raise GitCommandError(128, f"fatal: path or object '{rev}' does not exist")
+        _, obj_type, size_str = parts
+        size = int(size_str)
+        kept = await proc.stdout.readexactly(min(size, max_bytes))
+        remaining = size - len(kept)
+        while remaining > 0:
+            discarded = await proc.stdout.readexactly(min(remaining, DEFAULT_CHUNK_SIZE))
+            remaining -= len(discarded)
+        await proc.stdout.readexactly(1)  # 객체 뒤 개행
+        if obj_type != "blob":
+            raise GitCommandError(128, f"fatal: '{rev}' is a {obj_type}, not a blob")
+        return kept, size > max_bytes
+
+    def _discard(self) -> asyncio.subprocess.Process | None:
+        """현재 프로세스 kill 후 분리 (종료 대기 없음)"""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return None
+        with suppress(ProcessLookupError, BrokenPipeError):
+            proc.stdin.close()
+            proc.kill()
+        return proc
+
+    async def close(self) -> None:
+        proc = self._discard()
+        if proc is not None:
+            await proc.wait()
+
+
+_git_read_cache: GitReadCache | None = None
+_cat_file_workers: dict[str, CatFileBatch] = {}
+
+
+def get_git_read_cache() -> GitReadCache:
+    """GitReadCache 싱글톤 (git_read_cache_max_entries, git_read_cache_ttl_seconds)"""
+    global _git_read_cache
+    if _git_read_cache is None:
+        _git_read_cache = GitReadCache(
+            max_entries=settings.git_read_cache_max_entries,
+            ttl_seconds=settings.git_read_cache_ttl_seconds,
+        )
+    return _git_read_cache
+
+
+def get_cat_file_worker(repo_path: str) -> CatFileBatch:
+    """저장소별 cat-file --batch 워커"""
+    repo_path = os.path.abspath(repo_path)
+    worker = _cat_file_workers.get(repo_path)
+    if worker is None:
+        worker = _cat_file_workers[repo_path] = CatFileBatch(repo_path)
+    return worker
+
+
+async def cleanup_git_cache() -> None:
+    """cat-file 워커 종료 및 캐시 정리 (애플리케이션 종료 시)"""
+    workers = list(_cat_file_workers.values())
+    _cat_file_workers.clear()
+    for worker in workers:
+        await worker.close()
+    if _git_read_cache is not None:
+        _git_read_cache.clear()
@@ -0,0 +1,196 @@
+"""
+Git Diff Parser Module
+
+git diff/show 출력을 스트리밍으로 파싱하여 예산(바이트/라인) 내 구조화 결과로 반환합니다.
+- stdout 청크를 줄 단위로 점진 처리 (전체 diff를 메모리에 올리지 않음)
+- 파일별 바이트/라인 예산 초과 시 본문 저장 중단, +/- 라인 수만 집계 (stat 요약)
+- 전체 예산/파일 수 초과 시 읽기 중단 (git 프로세스 종료, 집계는 중단 시점까지)
+"""
+
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from core.config import settings
+
+
+@dataclass
+class FileDiff:
+    """파일 단위 diff (예산 내 본문 + 집계)"""
+    path: str
+    old_path: str | None = None
+    lines: list[str] = field(default_factory=list)
+    additions: int = 0
+    deletions: int = 0
+    hunks: int = 0
+    total_lines: int = 0
+    kept_bytes: int = 0
+    binary: bool = False
+    truncated: bool = False
+
+    def to_text(self) -> str:
+        text = "\n".join(self.lines)
+        if self.truncated:
+            text += (
+                f"\n... [truncated {self.path}: {self.hunks} hunks, +{self.additions} -{self.deletions}, "
+                f"showing {len(self.lines)} of {self.total_lines} lines]"
+            )
+        return text
+
+
+@dataclass
+class DiffResult:
+    """diff 파싱 결과"""
+    files: list[FileDiff] = field(default_factory=list)
+    truncated: bool = False
+
+    @property
+    def additions(self) -> int:
+        return sum(f.additions for f in self.files)
+
+    @property
+    def deletions(self) -> int:
+        return sum(f.deletions for f in self.files)
+
+    def to_text(self) -> str:
+        """LLM 전달용 텍스트 (파일 본문 + 요약 stat)"""
+        if not self.files:
+            return ""
+        parts = [f.to_text() for f in self.files]
+        summary = f"{len(self.files)} file(s) changed, +{self.additions} -{self.deletions}"
+        truncated_files = [f.path for f in self.files if f.truncated]
+        if truncated_files:
+            summary += f" (truncated: {', '.join(truncated_files)})"
+        if self.truncated:
+            summary += " [diff budget exceeded, remaining files omitted]"
+        parts.append(f"--- stat: {summary}")
+        return "\n".join(parts)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """bytes 청크 → 줄 단위 문자열 (개행 제외)"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for line in complete:
+            yield line.decode("utf-8", errors="replace")
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace")
+
+
+def _paths_from_header(line: str) -> tuple[str, str | None]:
+    """'diff --git a/x b/y' → (y, x if renamed)"""
+    rest = line[len("diff --git "):]
+    old, sep, new = rest.partition(" b/")
+    old = old[2:] if old.startswith("a/") else old
+    if not sep:
+        return old, None
+    return new, (old if old != new else None)
+
+
+async def parse_unified_diff(
+    chunks: AsyncIterator[bytes],
+    max_file_bytes: int | None = None,
+    max_file_lines: int | None = None,
+    max_total_bytes: int | None = None,
+    max_files: int | None = None,
+) -> DiffResult:
+    """
+    unified diff 스트리밍 파싱
+
+    Args:
+        chunks: git stdout 청크 (stream_git)
+        max_file_bytes: 파일당 본문 보관 바이트 (기본 git_diff_max_file_bytes)
+        max_file_lines: 파일당 본문 보관 라인 (기본 git_diff_max_file_lines)
+        max_total_bytes: 전체 본문 보관 바이트 (기본 git_diff_max_total_bytes, 초과 시 읽기 중단)
+        max_files: 최대 파일 수 (기본 git_diff_max_files, 초과 시 읽기 중단)
+    """
+    max_file_bytes = max_file_bytes or settings.git_diff_max_file_bytes
+    max_file_lines = max_file_lines or settings.git_diff_max_file_lines
+    max_total_bytes = max_total_bytes or settings.git_diff_max_total_bytes
+    max_files = max_files or settings.git_diff_max_files
+
+    result = DiffResult()
+    current: FileDiff | None = None
+    total_bytes = 0
+    lines = iter_lines(chunks)
+    try:
+        async for line in lines:
+            if line.startswith("diff --git "):
+                if len(result.files) >= max_files:
+                    result.truncated = True
+                    break
+                path, old_path = _paths_from_header(line)
+                current = FileDiff(path=path, old_path=old_path)
+                result.files.append(current)
+            elif current is None:
+                # 첫 파일 헤더 이전 출력 (경고 등) 무시
+                continue
+            elif line.startswith("@@"):
+                current.hunks += 1
+            elif line.startswith("+") and not line.startswith("+++ "):
+                current.additions += 1
+            elif line.startswith("-") and not line.startswith("--- "):
+                current.deletions += 1
+            elif line.startswith("Binary files "):
+                current.binary = True
+
+            current.total_lines += 1
+            if current.truncated:
+                continue
+            size = len(line.encode("utf-8")) + 1
+            if total_bytes + size > max_total_bytes:
+                # 전체 예산 초과: 현재 파일은 여기까지의 집계로 마감하고 읽기 중단
+                current.truncated = True
+                result.truncated = True
+                break
+            if len(current.lines) >= max_file_lines or current.kept_bytes + size > max_file_bytes:
+                current.truncated = True
+                continue
+            current.lines.append(line)
+            current.kept_bytes += size
+            total_bytes += size
+    finally:
+        # 조기 중단 시 상류(git 프로세스) 종료
+        await lines.aclose()
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return result
+
+
+async def read_capped(
+    chunks: AsyncIterator[bytes],
+    max_bytes: int | None = None,
+) -> tuple[str, bool]:
+    """
+    출력 앞부분만 바이트 예산 내로 읽기 (초과 시 읽기 중단)
+
+    Returns:
+        (텍스트, 잘림 여부)
+    """
+    max_bytes = max_bytes or settings.git_show_max_bytes
+    kept: list[bytes] = []
+    size = 0
+    truncated = False
+    try:
+        async for chunk in chunks:
+            if size + len(chunk) > max_bytes:
+                kept.append(chunk[: max_bytes - size])
+                truncated = True
+                break
+            kept.append(chunk)
+            size += len(chunk)
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return decode_capped(b"".join(kept), truncated), truncated
+
+
+def decode_capped(data: bytes, truncated: bool) -> str:
+    """상한에서 잘린 출력 디코딩 (잘린 마지막 줄/멀티바이트 문자 제거)"""
+    if not truncated:
+        return data.decode("utf-8", errors="replace")
+    data = data[: data.rfind(b"\n") + 1] or data
+    return data.decode("utf-8", errors="ignore")
@@ -0,0 +1,125 @@
+"""
+Git Exec Module
+
+Git 도구 공통 비동기 실행 계층입니다.
+- asyncio.create_subprocess_exec 기반 (이벤트 루프 블로킹 없음)
+- stdout 청크 스트리밍 (대용량 diff를 한 번에 버퍼링하지 않음)
+- 프로세스 동시 실행 수 제한 (git_max_concurrency 세마포어)
+- 타임아웃/취소 시 git 프로세스 kill
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_semaphore: asyncio.Semaphore | None = None
+
+
+class GitCommandError(Exception):
+    """git 명령 실패 (종료 코드 != 0)"""
+
+    def __init__(self, returncode: int, stderr: str) -> None:
+        super().__init__(stderr or f"git exited with {returncode}")
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+class GitTimeoutError(Exception):
+    """git 명령 타임아웃"""
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """git 프로세스 동시 실행 제한 세마포어 (git_max_concurrency)"""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.git_max_concurrency)
+    return _semaphore
+
+
+@asynccontextmanager
+async def _spawn(repo_path: str, args: tuple[str, ...]) -> AsyncIterator[asyncio.subprocess.Process]:
+    """세마포어 획득 후 git 프로세스 실행, 종료 시 미완료 프로세스 kill"""
+    async with _get_semaphore():
+        proc = await asyncio.create_subprocess_exec(
+            "git", "-C", repo_path, *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            yield proc
+        finally:
+            if proc.returncode is None:
+                with suppress(ProcessLookupError):
+                    proc.kill()
+                await proc.wait()
+
+
+async def stream_git(
+    repo_path: str,
+    *args: str,
+    timeout: float | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    git 명령 stdout을 청크 단위로 스트리밍
+
+    소비 측이 중간에 종료(aclose)하거나 취소되면 프로세스를 kill합니다.
+
+    Args:
+        repo_path: Git 저장소 경로
+        *args: git 하위 명령 및 인자 (예: "diff", "HEAD")
+        timeout: 전체 실행 타임아웃 (초), None이면 git_timeout_seconds
+
+    Raises:
+        GitTimeoutError: 타임아웃
+        GitCommandError: 종료 코드 != 0
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (timeout or settings.git_timeout_seconds)
+    async with _spawn(repo_path, args) as proc:
+        # stderr 파이프가 가득 차 stdout 읽기가 멈추지 않도록 병행 수집
+        stderr_task = asyncio.create_task(proc.stderr.read())
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise GitTimeoutError(f"git {' '.join(args[:1])} timed out")
+                try:
+                    chunk = await asyncio.wait_for(proc.stdout.read(chunk_size), remaining)
+                except asyncio.TimeoutError:
+                    raise GitTimeoutError(f"git {' '.join(args[:1])} timed out") from None
+                if not chunk:
+                    break
+                yield chunk
+            try:
+                returncode = await asyncio.wait_for(proc.wait(), max(deadline - loop.time(), 0.1))
+            except asyncio.TimeoutError:
+                raise GitTimeoutError(f"git {' '.join(args[:1])} timed out") from None
+            stderr = (await stderr_task).decode("utf-8", errors="replace").strip()
+            if returncode != 0:
+                raise GitCommandError(returncode, stderr)
+        finally:
+            if not stderr_task.done():
+                stderr_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await stderr_task
+
+
+async def run_git(repo_path: str, *args: str, timeout: float | None = None) -> str:
+    """
+    git 명령 실행 후 stdout 문자열 반환
+
+    Raises:
+        GitTimeoutError: 타임아웃
+        GitCommandError: 종료 코드 != 0
+    """
+    chunks = [chunk async for chunk in stream_git(repo_path, *args, timeout=timeout)]
+    return b"".join(chunks).decode("utf-8", errors="replace")
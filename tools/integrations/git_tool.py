@@ -2,20 +2,41 @@
 Git Tool Module
 
 로컬 Git 작업을 수행하는 도구입니다.
+git 실행은 비동기 실행 계층(git_exec)을 사용하여 이벤트 루프를 블로킹하지 않습니다.
+diff/show 출력은 스트리밍으로 읽으며 예산(git_diff_*, git_show_max_bytes) 내로 잘라 반환합니다.
+log/branch/show 결과는 HEAD/refs 기준 읽기 캐시(git_cache)를 사용합니다.
 """
 
-import asyncio
 import logging
-import subprocess
-from pathlib import Path
-from typing import Any
 
 from langchain_core.tools import tool
 from pydantic import Field
 
+from core.config import settings
+from tools.integrations.git_cache import get_cat_file_worker, get_git_read_cache
+from tools.integrations.git_diff_parser import decode_capped, parse_unified_diff, read_capped
+from tools.integrations.git_exec import GitCommandError, GitTimeoutError, run_git, stream_git
+
 logger = logging.getLogger(__name__)
 
 
+async def _cached_git(repo_path: str, *args: str) -> str:
+    """HEAD/refs 변경 전까지 동일 명령 결과 재사용"""
+    return await get_git_read_cache().get_or_load(
+        repo_path, args, lambda: run_git(repo_path, *args),
+    )
+
+
+async def _show_blob(repo_path: str, rev: str) -> tuple[str, bool]:
+    """`<commit>:<path>` 내용 (git_show_max_bytes 상한, git_cat_file_batch 시 장기 실행 워커 사용)"""
+    if settings.git_cat_file_batch:
+        data, truncated = await get_cat_file_worker(repo_path).read_blob(
+            rev, settings.git_show_max_bytes,
+        )
+        return decode_capped(data, truncated), truncated
+    return await read_capped(stream_git(repo_path, "show", rev))
+
+
 @tool
 async def git_diff(
     repo_path: str = Field(..., description="Git 저장소 경로"),
@@ -28,28 +49,21 @@ async def git_diff(
     로컬 Git 저장소의 변경사항을 확인할 때 사용합니다.
     """
     try:
-        cmd = ["git", "-C", repo_path, "diff", branch]
+        args = ["diff", branch]
         if file_path:
-            cmd.append(file_path)
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+            args.extend(["--", file_path])
         
-        if result.returncode != 0:
-            return f"Error: {result.stderr}"
+        result = await parse_unified_diff(stream_git(repo_path, *args))
         
-        diff_output = result.stdout
-        if not diff_output:
+        if not result.files:
             return "No changes detected."
         
-        return diff_output
+        return result.to_text()
         
-    except subprocess.TimeoutExpired:
+    except GitTimeoutError:
         return "Error: Git command timed out"
+    except GitCommandError as e:
+        return f"Error: {e.stderr}"
     except Exception as e:
         logger.error(f"Git diff failed: {e}")
         return f"Error: {str(e)}"
@@ -67,27 +81,21 @@ async def git_log(
     최근 커밋 히스토리를 확인할 때 사용합니다.
     """
     try:
-        cmd = [
-            "git", "-C", repo_path, "log",
+        args = [
+            "log",
             f"-{limit}",
             "--pretty=format:%h - %an, %ar : %s",
             branch,
         ]
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        
-        if result.returncode != 0:
-            return f"Error: {result.stderr}"
+        output = await _cached_git(repo_path, *args)
         
-        return result.stdout
+        return output
         
-    except subprocess.TimeoutExpired:
+    except GitTimeoutError:
         return "Error: Git command timed out"
+    except GitCommandError as e:
+        return f"Error: {e.stderr}"
     except Exception as e:
         logger.error(f"Git log failed: {e}")
         return f"Error: {str(e)}"
@@ -103,24 +111,17 @@ async def git_status(
     현재 작업 디렉토리의 변경사항을 확인할 때 사용합니다.
     """
     try:
-        result = subprocess.run(
-            ["git", "-C", repo_path, "status", "--short"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        output = await run_git(repo_path, "status", "--short")
         
-        if result.returncode != 0:
-            return f"Error: {result.stderr}"
-        
-        status_output = result.stdout
-        if not status_output:
+        if not output:
             return "Working directory clean."
         
-        return status_output
+        return output
         
-    except subprocess.TimeoutExpired:
+    except GitTimeoutError:
         return "Error: Git command timed out"
+    except GitCommandError as e:
+        return f"Error: {e.stderr}"
     except Exception as e:
         logger.error(f"Git status failed: {e}")
         return f"Error: {str(e)}"
@@ -138,20 +139,20 @@ async def git_show_file(
     과거 버전의 파일을 확인할 때 사용합니다.
     """
     try:
-        result = subprocess.run(
-            ["git", "-C", repo_path, "show", f"{commit}:{file_path}"],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        rev = f"{commit}:{file_path}"
+        output, truncated = await get_git_read_cache().get_or_load(
+            repo_path, ("show", rev), lambda: _show_blob(repo_path, rev),
         )
         
-        if result.returncode != 0:
-            return f"Error: {result.stderr}"
+        if truncated:
+            output += f"\n... [truncated: file exceeds {settings.git_show_max_bytes} bytes]"
         
-        return result.stdout
+        return output
         
-    except subprocess.TimeoutExpired:
+    except GitTimeoutError:
         return "Error: Git command timed out"
+    except GitCommandError as e:
+        return f"Error: {e.stderr}"
     except Exception as e:
         logger.error(f"Git show file failed: {e}")
         return f"Error: {str(e)}"
@@ -168,24 +169,18 @@ async def git_branch_list(
     저장소의 모든 브랜치를 확인할 때 사용합니다.
     """
     try:
-        cmd = ["git", "-C", repo_path, "branch"]
+        args = ["branch"]
         if remote:
-            cmd.append("-a")
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+            args.append("-a")
         
-        if result.returncode != 0:
-            return f"Error: {result.stderr}"
+        output = await _cached_git(repo_path, *args)
         
-        return result.stdout
+        return output
         
-    except subprocess.TimeoutExpired:
+    except GitTimeoutError:
         return "Error: Git command timed out"
+    except GitCommandError as e:
+        return f"Error: {e.stderr}"
     except Exception as e:
         logger.error(f"Git branch list failed: {e}")
         return f"Error: {str(e)}"
@@ -2,9 +2,14 @@
 GitHub Tool Module
 
 GitHub API를 사용하여 PR, 이슈, 코드 등을 조회하는 도구입니다.
+모든 도구는 공유 GitHubClient(커넥션 풀, 조건부 요청 캐시, rate limit 추적)를 사용합니다.
 """
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Optional
 
 import httpx
@@ -16,23 +21,169 @@ from core.config import settings
 logger = logging.getLogger(__name__)
 
 
+class GitHubRateLimitError(Exception):
+    """GitHub rate limit 소진 (리셋까지 대기 시간이 허용 범위 초과)"""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"GitHub rate limit exceeded, retry after {int(retry_after)}s")
+        self.retry_after = retry_after
+
+
+@dataclass
+class _CachedResponse:
+    """조건부 요청용 캐시 항목"""
+    etag: str | None
+    last_modified: str | None
+    data: Any
+    next_url: str | None
+
+
 class GitHubClient:
-    """GitHub API 클라이언트"""
+    """
+    GitHub API 클라이언트
+
+    - 공유 httpx.AsyncClient (커넥션 풀, keep-alive)
+    - GET 응답 ETag/Last-Modified 캐시 → 조건부 요청 (304는 primary rate limit 미차감)
+    - X-RateLimit-* 헤더 추적: 잔여량이 예약분 이하이면 리셋까지 요청 간격을 벌림, 소진 시 리셋 대기
+    - Link 헤더 기반 페이지네이션 (paginate)
+    """
     
-    def __init__(self, token: str | None = None):
+    def __init__(
+        self,
+        token: str | None = None,
+        base_url: str = "https://api.github.com",
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         """
         GitHubClient 초기화
         
         Args:
             token: GitHub Personal Access Token
+            base_url: API 기본 URL
+            transport: httpx transport (테스트/프록시용, None이면 기본)
         """
         self.token = token or settings.github_token
-        self.base_url = "https://api.github.com"
+        self.base_url = base_url
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
         }
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._cache: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self.rate_limit_remaining: int | None = None
+        self.rate_limit_reset: float | None = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=settings.github_max_connections,
+                    max_keepalive_connections=settings.github_max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """커넥션 풀 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _update_rate_limit(self, response: httpx.Response) -> None:
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is not None and remaining.isdigit():
+            self.rate_limit_remaining = int(remaining)
+        if reset is not None and reset.isdigit():
+            self.rate_limit_reset = float(reset)
+    
+    async def _throttle(self) -> None:
+        """잔여 rate limit 기반 요청 전 대기 (예약분 이하: 리셋까지 균등 분배, 0: 리셋 대기)"""
+        remaining, reset = self.rate_limit_remaining, self.rate_limit_reset
+        if remaining is None or reset is None or remaining > settings.github_rate_limit_reserve:
+            return
+        until_reset = reset - time.time()
+        if until_reset <= 0:
+            self.rate_limit_remaining = None
+            return
+        wait = until_reset if remaining == 0 else until_reset / (remaining + 1)
+        if wait > settings.github_rate_limit_max_wait_seconds:
+            if remaining == 0:
+                raise GitHubRateLimitError(until_reset)
+            wait = settings.github_rate_limit_max_wait_seconds
+        logger.warning(f"GitHub rate limit low (remaining={remaining}), throttling {wait:.1f}s")
+        await asyncio.sleep(wait)
+    
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        """rate limit 응답(403/429)의 대기 시간, rate limit 응답이 아니면 None"""
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        if response.headers.get("X-RateLimit-Remaining") == "0" and self.rate_limit_reset:
+            return max(self.rate_limit_reset - time.time(), 0.0)
+        return None
+    
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """rate limit 추적/대기 포함 요청 (rate limit 응답 시 허용 범위 내 1회 재시도)"""
+        client = self._get_client()
+        for attempt in range(2):
+            await self._throttle()
+            response = await client.request(method, url, **kwargs)
+            self._update_rate_limit(response)
+            wait = self._retry_after(response)
+            if wait is None:
+                break
+            if attempt == 1 or wait > settings.github_rate_limit_max_wait_seconds:
+                raise GitHubRateLimitError(wait)
+            logger.warning(f"GitHub rate limited ({response.status_code}), retrying after {wait:.1f}s")
+            await asyncio.sleep(wait)
+        return response
+    
+    async def _get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[Any, str | None]:
+        """
+        조건부 GET (ETag/Last-Modified 캐시)
+
+        Returns:
+            (응답 데이터, 다음 페이지 URL)
+        """
+        request = self._get_client().build_request("GET", url, params=params)
+        cache_key = str(request.url)
+        headers: dict[str, str] = {}
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        
+        response = await self._send("GET", cache_key, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached.data, cached.next_url
+        response.raise_for_status()
+        
+        data = response.json()
+        next_url = response.links.get("next", {}).get("url")
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._cache[cache_key] = _CachedResponse(etag, last_modified, data, next_url)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > settings.github_etag_cache_size:
+                self._cache.popitem(last=False)
+        return data, next_url
     
     async def _request(
         self,
@@ -40,19 +191,41 @@ class GitHubClient:
         endpoint: str,
         **kwargs: Any,
     ) -> dict[str, Any] | list[dict[str, Any]]:
-        """GitHub API 요청"""
-        url = f"{self.base_url}{endpoint}"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method,
-                url,
-                headers=self.headers,
-                timeout=30.0,
-                **kwargs,
-            )
-            response.raise_for_status()
-            return response.json()
+        """GitHub API 요청 (GET은 조건부 요청 캐시 사용)"""
+        if method == "GET":
+            data, _ = await self._get(endpoint, params=kwargs.get("params"))
+            return data
+        response = await self._send(method, endpoint, **kwargs)
+        response.raise_for_status()
+        return response.json()
+    
+    async def paginate(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> list[Any]:
+        """
+        Link 헤더 next를 따라 목록 수집
+
+        Args:
+            endpoint: 목록 API 경로
+            params: 첫 페이지 쿼리 (per_page 미지정 시 min(limit, 100))
+            limit: 최대 항목 수 (None이면 전체)
+        """
+        params = dict(params or {})
+        params.setdefault("per_page", min(limit, 100) if limit else 100)
+        items: list[Any] = []
+        url: str | None = endpoint
+        while url is not None:
+            data, url = await self._get(url, params=params)
+            params = None  # next URL에 쿼리 포함
+            if not isinstance(data, list):
+                break
+            items.extend(data)
+            if limit is not None and len(items) >= limit:
+                return items[:limit]
+        return items
     
     async def get_pr(self, owner: str, repo: str, pr_number: int) -> dict[str, Any]:
         """PR 정보 조회"""
@@ -66,25 +239,24 @@ class GitHubClient:
         limit: int = 10,
     ) -> list[dict[str, Any]]:
         """PR 목록 조회"""
-        data = await self._request(
-            "GET",
+        return await self.paginate(
             f"/repos/{owner}/{repo}/pulls",
-            params={"state": state, "per_page": limit},
+            params={"state": state},
+            limit=limit,
         )
-        return data if isinstance(data, list) else []
     
     async def get_pr_files(
         self,
         owner: str,
         repo: str,
         pr_number: int,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        """PR의 변경된 파일 목록"""
-        data = await self._request(
-            "GET",
+        """PR의 변경된 파일 목록 (Link next 페이지 포함, 최대 limit개, None이면 github_pr_files_limit)"""
+        return await self.paginate(
             f"/repos/{owner}/{repo}/pulls/{pr_number}/files",
+            limit=limit or settings.github_pr_files_limit,
         )
-        return data if isinstance(data, list) else []
     
     async def get_file_content(
         self,
@@ -113,6 +285,14 @@ def get_github_client() -> GitHubClient:
     return _github_client
 
 
+async def cleanup_github_client() -> None:
+    """GitHub 클라이언트 커넥션 풀 정리 (애플리케이션 종료 시)"""
+    global _github_client
+    if _github_client is not None:
+        await _github_client.aclose()
+        _github_client = None
+
+
 @tool
 async def github_get_pr(
     owner: str = Field(..., description="저장소 소유자 (예: facebook)"),
@@ -195,20 +375,29 @@ async def github_get_pr_diff(
     owner: str = Field(..., description="저장소 소유자"),
     repo: str = Field(..., description="저장소 이름"),
     pr_number: int = Field(..., description="PR 번호"),
+    limit: int | None = Field(default=None, description="조회할 최대 파일 수 (미지정 시 서버 기본값)"),
 ) -> str:
     """
     GitHub Pull Request의 변경된 파일 목록을 조회합니다.
     
     PR에서 어떤 파일이 변경되었는지 확인할 때 사용합니다.
+    파일이 많으면 앞쪽 limit개만 반환하고 잘렸음을 표시합니다.
     """
     try:
         client = get_github_client()
-        files = await client.get_pr_files(owner, repo, pr_number)
+        limit = min(limit or settings.github_pr_files_limit, settings.github_pr_files_limit)
+        # limit + 1개 조회로 잘림 여부 판별
+        files = await client.get_pr_files(owner, repo, pr_number, limit=limit + 1)
+        truncated = len(files) > limit
+        files = files[:limit]
         
         if not files:
             return f"No files changed in PR #{pr_number}"
         
-        result_lines = [f"PR #{pr_number} changed {len(files)} file(s):\n"]
+        if truncated:
+            result_lines = [f"PR #{pr_number} changed more than {limit} file(s), showing first {limit}:\n"]
+        else:
+            result_lines = [f"PR #{pr_number} changed {len(files)} file(s):\n"]
         for file in files:
             status = file['status']
             filename = file['filename']
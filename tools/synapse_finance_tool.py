@@ -530,6 +530,9 @@ async def execute_action(
 # HITL 승인이 필요한 도구 (Finance Agent에서 사용)
 FINANCE_HITL_TOOLS = {"propose_action"}
 
+# 상태 변경 도구 (도구 실행기에서 직렬 실행)
+FINANCE_WRITE_TOOLS = {"simulate_action", "propose_action", "execute_action"}
+
 # 전체 Finance 도구 목록
 FINANCE_TOOLS = [
     get_case,